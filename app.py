@@ -7,6 +7,13 @@
     python app.py --port 80    # 포트 지정
     python app.py --host 0.0.0.0  # 외부 접속 허용
 
+운영 모드 (gunicorn 멀티 프로세스, Linux/macOS):
+    python app.py --prod --workers 4 --threads 8
+    python app.py --prod --bind unix:/run/yugwan/gunicorn.sock
+    python app.py --prod --asgi  # uvicorn 워커 (config.asgi, 비동기 목록 API)
+    kill -HUP <pid>            # 무중단 재시작 (워커 순차 교체)
+    (워커가 2개 이상이면 REDIS_URL 공유 캐시 필요 - 없으면 워커가 시작하지 않음)
+
 접속 URL:
     - 웹사이트: http://localhost:8000/
     - 관리자: http://localhost:8000/admin/
@@ -14,20 +21,85 @@
 """
 import os
 import sys
+import signal
 import argparse
 import subprocess
 
+
+def build_prod_command(args):
+    """gunicorn 실행 명령 구성 (config.wsgi.application / --asgi: config.asgi.application)"""
+    bind = args.bind or f'{args.host}:{args.port}'
+    if args.asgi:
+        app_args = ['config.asgi:application', '--worker-class', 'uvicorn_worker.UvicornWorker']
+    else:
+        app_args = ['config.wsgi:application', '--threads', str(args.threads)]
+    return [
+        sys.executable, '-m', 'gunicorn', *app_args,
+        '--bind', bind,
+        '--workers', str(args.workers),
+        '--max-requests', str(args.max_requests),
+        '--max-requests-jitter', str(max(args.max_requests // 10, 1)) if args.max_requests else '0',
+        '--graceful-timeout', str(args.graceful_timeout),
+        '--access-logfile', '-',
+    ]
+
+
+def run_prod(args, backend_dir):
+    """gunicorn 마스터를 자식 프로세스로 실행하고 종료/재시작 시그널을 전달"""
+    if os.name == 'nt':
+        print("Production mode (--prod) requires Linux or macOS.")
+        sys.exit(1)
+
+    # 워커 수를 Django 설정(APP_WORKERS)에 전달 - 여러 워커인데 공유 캐시가 없으면 시작 시 오류
+    env = dict(os.environ, APP_WORKERS=str(args.workers))
+    process = subprocess.Popen(build_prod_command(args), cwd=backend_dir, env=env)
+
+    # SIGHUP: 설정 재로드 + 워커 순차 교체, SIGTERM: 진행 중 요청 처리 후 종료
+    def forward(signum, frame):
+        process.send_signal(signum)
+
+    signal.signal(signal.SIGHUP, forward)
+    signal.signal(signal.SIGTERM, forward)
+
+    try:
+        return process.wait()
+    except KeyboardInterrupt:
+        # Ctrl+C는 같은 프로세스 그룹의 gunicorn에도 전달됨 - 종료 대기
+        return process.wait()
+
+
 def main():
     # 인자 파싱
     parser = argparse.ArgumentParser(description='Yu Gwan-sun Memorial Association Web Server')
     parser.add_argument('--host', default='127.0.0.1', help='Host address (default: 127.0.0.1)')
     parser.add_argument('--port', type=int, default=8000, help='Port number (default: 8000)')
+    parser.add_argument('--prod', action='store_true', help='Run with gunicorn (multi-process, no autoreload)')
+    parser.add_argument('--workers', type=int, default=(os.cpu_count() or 1) * 2 + 1,
+                        help='[--prod] Worker processes (default: CPU*2+1)')
+    parser.add_argument('--threads', type=int, default=4, help='[--prod] Threads per worker (default: 4)')
+    parser.add_argument('--max-requests', type=int, default=1000,
+                        help='[--prod] Recycle a worker after N requests, 0 to disable (default: 1000)')
+    parser.add_argument('--graceful-timeout', type=int, default=30,
+                        help='[--prod] Seconds to finish in-flight requests on reload/stop (default: 30)')
+    parser.add_argument('--asgi', action='store_true',
+                        help='[--prod] Serve config.asgi with uvicorn workers (--threads is ignored)')
+    parser.add_argument('--bind', help='[--prod] Bind address, e.g. unix:/run/yugwan.sock (default: HOST:PORT)')
     args = parser.parse_args()
 
     # 프로젝트 경로 설정
     project_dir = os.path.dirname(os.path.abspath(__file__))
     backend_dir = os.path.join(project_dir, 'backend')
 
+    if args.prod:
+        if args.asgi:
+            mode = f'production ASGI ({args.workers} uvicorn workers)'
+        else:
+            mode = f'production ({args.workers} workers x {args.threads} threads)'
+        if args.bind:
+            mode += f', bind {args.bind}'
+    else:
+        mode = 'development (runserver)'
+
     print(f"""
 ================================================================
     Yu Gwan-sun Memorial Association Web Server
@@ -35,11 +107,17 @@ def main():
     Website:  http://{args.host}:{args.port}/
     Admin:    http://{args.host}:{args.port}/admin/
     API:      http://{args.host}:{args.port}/api/v1/
+    Mode:     {mode}
 ----------------------------------------------------------------
     Press Ctrl+C to stop the server
 ================================================================
 """)
 
+    if args.prod:
+        returncode = run_prod(args, backend_dir)
+        print("\nServer stopped.")
+        sys.exit(returncode)
+
     # Django 서버 실행 (backend 폴더에서)
     try:
         subprocess.run(
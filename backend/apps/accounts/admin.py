@@ -1,7 +1,8 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from django.utils import timezone
-from .models import User, BoardPermission
+from .authentication import revoke_user_tokens
+from .models import User, BoardPermission, TierTransition
+from .tiers import CHANGED, change_tier
 
 
 @admin.register(User)
@@ -37,25 +38,32 @@ class UserAdmin(BaseUserAdmin):
 
     readonly_fields = ['tier_approved_at', 'tier_approved_by', 'admin_level']
 
+    # 등급/권한/활성 상태가 바뀌었을 수 있으므로 발급된 토큰의 클레임을 믿지 않도록 기록
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change:
+            revoke_user_tokens(obj.pk)
+
+    def delete_model(self, request, obj):
+        user_id = obj.pk
+        super().delete_model(request, obj)
+        revoke_user_tokens(user_id)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = list(queryset.values_list('pk', flat=True))
+        super().delete_queryset(request, queryset)
+        revoke_user_tokens(*user_ids)
+
     @admin.action(description='선택한 회원을 후원회원으로 승급')
     def approve_as_supporter(self, request, queryset):
-        count = 0
-        for user in queryset:
-            if user.tier != 'SUPPORTER':
-                user.tier = 'SUPPORTER'
-                user.tier_approved_at = timezone.now()
-                user.tier_approved_by = request.user
-                user.save()
-                count += 1
+        results = change_tier(queryset.values_list('pk', flat=True), 'SUPPORTER', request.user)
+        count = sum(1 for result in results.values() if result == CHANGED)
         self.message_user(request, f'{count}명의 회원이 후원회원으로 승급되었습니다.')
 
     @admin.action(description='선택한 회원의 후원회원 자격 해제')
     def revoke_supporter(self, request, queryset):
-        count = queryset.filter(tier='SUPPORTER').update(
-            tier='FREE',
-            tier_approved_at=None,
-            tier_approved_by=None
-        )
+        results = change_tier(queryset.values_list('pk', flat=True), 'FREE', request.user)
+        count = sum(1 for result in results.values() if result == CHANGED)
         self.message_user(request, f'{count}명의 회원이 무료회원으로 변경되었습니다.')
 
     @admin.action(description='선택한 회원을 운영진으로 지정')
@@ -63,7 +71,9 @@ class UserAdmin(BaseUserAdmin):
         if not request.user.is_superuser:
             self.message_user(request, '최고관리자만 운영진을 지정할 수 있습니다.', level='error')
             return
-        count = queryset.update(is_staff=True)
+        user_ids = list(queryset.values_list('pk', flat=True))
+        count = User.objects.filter(pk__in=user_ids).update(is_staff=True)
+        revoke_user_tokens(*user_ids)
         self.message_user(request, f'{count}명의 회원이 운영진으로 지정되었습니다.')
 
     @admin.action(description='선택한 회원의 운영진 권한 해제')
@@ -72,10 +82,30 @@ class UserAdmin(BaseUserAdmin):
             self.message_user(request, '최고관리자만 운영진 권한을 해제할 수 있습니다.', level='error')
             return
         # 최고관리자는 해제 불가
-        count = queryset.filter(is_superuser=False).update(is_staff=False)
+        user_ids = list(queryset.filter(is_superuser=False).values_list('pk', flat=True))
+        count = User.objects.filter(pk__in=user_ids).update(is_staff=False)
+        revoke_user_tokens(*user_ids)
         self.message_user(request, f'{count}명의 회원의 운영진 권한이 해제되었습니다.')
 
 
+@admin.register(TierTransition)
+class TierTransitionAdmin(admin.ModelAdmin):
+    """등급 변경 기록 (조회 전용)"""
+    list_display = ['username', 'from_tier', 'to_tier', 'changed_by', 'created_at']
+    list_filter = ['to_tier']
+    search_fields = ['username']
+    list_select_related = ['changed_by']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(BoardPermission)
 class BoardPermissionAdmin(admin.ModelAdmin):
     list_display = ['board_type', 'get_board_name', 'read_permission', 'write_permission', 'is_active']
@@ -4,3 +4,6 @@ class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.accounts'
     verbose_name = '회원 관리'
+
+    def ready(self):
+        import apps.accounts.signals
@@ -0,0 +1,102 @@
+"""
+JWT 인증 - 읽기 요청은 토큰 클레임만으로 사용자 구성 (회원 조회 없음)
+
+액세스 토큰에 tier/admin_level/is_staff/is_superuser 클레임을 넣고(ClaimsTokenObtainPairSerializer),
+GET/HEAD/OPTIONS 요청은 ClaimsUser로 처리한다.
+- 쓰기 요청, requires_user_row = True 인 뷰, 클레임이 없는 이전 토큰은 실제 User를 조회
+- 등급/권한 변경·탈퇴 시 revoke_user_tokens()로 기록 → 커밋 이전에 발급된 토큰도 실제 User를 조회
+  (트랜잭션 커밋 후 기록, 액세스 토큰 수명 + 60초 뒤 만료 - 남는 것은 최근 변경분뿐)
+- 기록은 모든 워커가 보는 공유 캐시(Redis)에 있어야 함: 워커 2개 이상이면 시작 시 확인
+  (apps.core.cache.check_shared_cache, 운영 설정은 REDIS_URL 필수)
+  → 변경이 커밋되면 모든 워커에서 즉시 옛 클레임을 쓰지 않음
+  단, 캐시가 기록을 먼저 밀어내면(메모리 부족) 옛 클레임은 최대 액세스 토큰 수명 동안 쓰일 수 있음
+- 토큰 갱신 시 클레임을 현재 회원 정보로 다시 채움 (ClaimsTokenRefreshSerializer)
+"""
+import time
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+CLAIM_FIELDS = ('tier', 'admin_level', 'is_staff', 'is_superuser')
+REVOKED_KEY = 'token-revoked:{}'
+
+
+def set_user_claims(token, user):
+    for field in CLAIM_FIELDS:
+        token[field] = getattr(user, field)
+    return token
+
+
+def revoke_user_tokens(*user_ids, using=None):
+    """
+    지금까지 발급된 토큰의 클레임을 믿지 않도록 기록 (등급/권한 변경·탈퇴 후 호출)
+    트랜잭션 안이면 커밋 후 기록 (커밋 전에 갱신된 토큰도 옛 값을 담고 있으므로), 롤백되면 생략
+    """
+    transaction.on_commit(partial(_revoke_user_tokens, user_ids), using=using)
+
+
+def _revoke_user_tokens(user_ids):
+    timeout = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()) + 60
+    now = time.time()
+    cache.set_many({REVOKED_KEY.format(user_id): now for user_id in user_ids}, timeout)
+
+
+def claims_revoked(token):
+    issued_at = token.get('iat')
+    if issued_at is None:
+        return True
+    revoked_at = cache.get(REVOKED_KEY.format(token[api_settings.USER_ID_CLAIM]))
+    return revoked_at is not None and issued_at <= revoked_at
+
+
+class ClaimsUser(TokenUser):
+    """액세스 토큰 클레임으로 만든 사용자 (읽기 요청용 - 저장/삭제 불가)"""
+
+    @property
+    def tier(self):
+        return self.token.get('tier', 'FREE')
+
+    @property
+    def admin_level(self):
+        return self.token.get('admin_level', 'NONE')
+
+    @property
+    def is_supporter(self):
+        return self.tier == 'SUPPORTER'
+
+    @property
+    def is_admin(self):
+        return self.is_staff or self.is_superuser
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication + 읽기 요청은 ClaimsUser (회원 조회 생략)"""
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if self.use_claims(request, validated_token):
+            return ClaimsUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def use_claims(self, request, token):
+        if request.method not in SAFE_METHODS:
+            return False
+        view = (getattr(request, 'parser_context', None) or {}).get('view')
+        if getattr(view, 'requires_user_row', False):
+            return False
+        if any(field not in token for field in CLAIM_FIELDS):
+            return False
+        return not claims_revoked(token)
@@ -0,0 +1,146 @@
+"""
+비밀번호 해시 전용 스레드 풀
+
+PBKDF2는 요청 하나에 수십~수백 ms CPU를 쓰므로, 로그인이 몰리면 요청 스레드가 모두 해시 계산에 묶여
+가벼운 자료실 조회까지 밀린다. 해시 계산은 PASSWORD_HASH_WORKERS 크기의 별도 풀에서만 하고,
+대기 중인 작업이 PASSWORD_HASH_QUEUE_LIMIT를 넘으면 PasswordHashBusy를 올리고
+PasswordHashBusyMiddleware가 바로 503(Retry-After)으로 응답한다 (DRF API와 관리자 화면 모두).
+(해시를 기다리는 동안 요청 스레드가 묶이는 수가 WORKERS + QUEUE_LIMIT로 제한되어 나머지 스레드는 조회를 처리)
+- PooledPBKDF2PasswordHasher를 PASSWORD_HASHERS 첫 번째로 두면
+  로그인(ModelBackend)·가입·비밀번호 변경·탈퇴·관리자 화면의 해시 계산이 모두 풀을 거친다
+- 알고리즘 이름은 Django 기본(pbkdf2_sha256)과 같으므로 저장된 비밀번호는 그대로 사용
+- 처리 시간/대기 시간은 password_hash_pool.summary() (관리자 API: /auth/password-hash-stats/)
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+logger = logging.getLogger(__name__)
+
+RECENT_SAMPLES = 1000  # 백분위 계산에 쓰는 최근 측정값 수
+
+
+class PasswordHashBusy(Exception):
+    """해시 대기열이 가득 참 - 잠시 후 재시도 (PasswordHashBusyMiddleware가 503으로 응답)"""
+
+    def __init__(self, retry_after):
+        super().__init__(f'비밀번호 해시 대기열 초과 ({retry_after}초 후 재시도)')
+        self.retry_after = retry_after
+
+
+def percentile(values, ratio):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(len(values) * ratio), len(values) - 1)]
+
+
+class PasswordHashPool:
+    """요청 스레드와 분리된 해시 계산 풀 (대기열 길이 제한)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._workers = None  # configure()로 지정한 값 (없으면 설정값)
+        self._executor = None
+        self._pid = None
+        self._size = None
+        self._pending = 0  # 실행 중 + 대기 중
+        self._completed = 0
+        self._rejected = 0
+        self._samples = deque(maxlen=RECENT_SAMPLES)  # (대기 시간, 계산 시간) 초
+
+    @property
+    def workers(self):
+        if self._workers is not None:
+            return self._workers
+        return getattr(settings, 'PASSWORD_HASH_WORKERS', 2)
+
+    @property
+    def queue_limit(self):
+        return getattr(settings, 'PASSWORD_HASH_QUEUE_LIMIT', 2)
+
+    @property
+    def retry_after(self):
+        return getattr(settings, 'PASSWORD_HASH_RETRY_AFTER', 5)
+
+    def configure(self, workers):
+        """이 프로세스의 풀 크기 지정 (0이면 호출한 스레드에서 바로 계산)"""
+        self._workers = workers
+
+    def run(self, func, *args):
+        """func(*args)를 풀에서 실행하고 결과 반환 - 대기열이 가득 차면 PasswordHashBusy"""
+        if self.workers <= 0:
+            return func(*args)
+        with self._lock:
+            if self._pending >= self.workers + self.queue_limit:
+                self._rejected += 1
+                logger.warning('비밀번호 해시 대기열 초과 (대기 %d건)', self._pending)
+                raise PasswordHashBusy(self.retry_after)
+            self._pending += 1
+            executor = self._get_executor()
+        try:
+            return executor.submit(self._timed, func, args, time.perf_counter()).result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _get_executor(self):
+        # fork된 워커 프로세스는 부모의 스레드를 물려받지 않으므로 새로 생성 (설정 변경 시에도)
+        if self._executor is None or self._pid != os.getpid() or self._size != self.workers:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='password-hash')
+            self._pid = os.getpid()
+            self._size = self.workers
+        return self._executor
+
+    def _timed(self, func, args, queued_at):
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._completed += 1
+                self._samples.append((started - queued_at, finished - started))
+
+    def summary(self):
+        """이 프로세스의 해시 처리 통계 (시간 단위 ms, 백분위는 최근 RECENT_SAMPLES건 기준)"""
+        with self._lock:
+            samples = list(self._samples)
+            data = {
+                'workers': self.workers,
+                'queue_limit': self.queue_limit,
+                'pending': self._pending,
+                'completed': self._completed,
+                'rejected': self._rejected,
+            }
+        for name, index in (('wait', 0), ('hash', 1)):
+            values = [sample[index] * 1000 for sample in samples]
+            for label, ratio in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99)):
+                value = percentile(values, ratio)
+                data[f'{name}_{label}_ms'] = round(value, 2) if value is not None else None
+        return data
+
+
+password_hash_pool = PasswordHashPool()
+
+
+def init_hash_process(workers=0):
+    """일괄 작업용 프로세스 풀 초기화 - 자식 프로세스는 해시만 하므로 기본값은 password_hash_pool을 거치지 않음"""
+    django.setup()
+    password_hash_pool.configure(workers)
+
+
+class PooledPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2 해시 계산을 password_hash_pool에서 실행 (저장 형식은 기본 PBKDF2와 동일)"""
+
+    def encode(self, password, salt, iterations=None):
+        return password_hash_pool.run(super().encode, password, salt, iterations)
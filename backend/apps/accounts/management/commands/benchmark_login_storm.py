@@ -0,0 +1,116 @@
+"""
+로그인 폭주 중 자료실 조회 지연 측정
+
+    python manage.py benchmark_login_storm
+    python manage.py benchmark_login_storm --threads 8 --login-rate 20 --duration 10
+
+테스트 DB(test_<DB명>)에서 요청 스레드 풀(gunicorn gthread 워커처럼 고정 크기)에
+로그인 요청과 자료실 목록 요청을 섞어 넣고, 자료실 요청의 대기+처리 시간 p50/p99를 비교한다.
+1. 기준: 로그인 없이 자료실 조회만
+2. 해시 풀 없음: PASSWORD_HASH_WORKERS=0 (요청 스레드에서 바로 PBKDF2 계산)
+3. 해시 풀 사용: 현재 PASSWORD_HASH_WORKERS / PASSWORD_HASH_QUEUE_LIMIT 설정
+자료실 요청은 응답 캐시를 끄고(API_RESPONSE_CACHE=False) 매번 DB를 조회한다. (캐시 적중만 재면 스레드 경합이 드러나지 않음)
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.test.utils import (
+    setup_databases, setup_test_environment, teardown_databases, teardown_test_environment,
+)
+
+from apps.accounts.hashers import password_hash_pool, percentile
+from apps.accounts.models import User
+from apps.archive.models import Notice
+
+PASSWORD = 'bench-password-1234'
+
+
+class Command(BaseCommand):
+    help = '로그인 폭주 중 자료실 조회 p50/p99 측정 (비밀번호 해시 풀 사용/미사용 비교)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='요청 스레드 수 (기본 8)')
+        parser.add_argument('--duration', type=float, default=5, help='시나리오별 측정 시간(초, 기본 5)')
+        parser.add_argument('--login-rate', type=float, default=10, help='초당 로그인 요청 수 (기본 10)')
+        parser.add_argument('--read-rate', type=float, default=20, help='초당 자료실 요청 수 (기본 20)')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        self.sequence = 0
+        self.sequence_lock = threading.Lock()
+        try:
+            User.objects.create_user('bench-login', password=PASSWORD, phone='')
+            Notice.objects.bulk_create([
+                Notice(category='general', title=f'공지 {i}', content='내용', author='사무국') for i in range(50)
+            ])
+            pooled = settings.PASSWORD_HASH_WORKERS
+            with override_settings(API_RESPONSE_CACHE=False):
+                results = [
+                    ('기준 (로그인 없음)', self.run_scenario(options, logins=False)),
+                ]
+                with override_settings(PASSWORD_HASH_WORKERS=0):
+                    results.append(('해시 풀 없음', self.run_scenario(options)))
+                results.append((f'해시 풀 {pooled}스레드', self.run_scenario(options)))
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        self.stdout.write(f'{"시나리오":<20} {"자료실 p50":>10} {"자료실 p99":>10} {"로그인 성공":>10} {"503":>6}')
+        for label, (p50, p99, ok, busy) in results:
+            self.stdout.write(f'{label:<20} {p50:>8.1f}ms {p99:>8.1f}ms {ok:>10} {busy:>6}')
+        self.stdout.write(f'해시 풀 통계: {password_hash_pool.summary()}')
+        self.stdout.write(self.style.SUCCESS('측정을 마쳤습니다.'))
+
+    def client(self):
+        # 요청마다 다른 IP - 익명 요청 스로틀(IP 기준)에 걸리지 않도록
+        with self.sequence_lock:
+            self.sequence += 1
+            sequence = self.sequence
+        return Client(REMOTE_ADDR=f'10.{sequence >> 16 & 255}.{sequence >> 8 & 255}.{sequence & 255}')
+
+    def login(self):
+        response = self.client().post(
+            '/api/v1/auth/token/', {'username': 'bench-login', 'password': PASSWORD},
+            content_type='application/json',
+        )
+        return response.status_code
+
+    def read(self, submitted_at):
+        response = self.client().get('/api/v1/archive/notices/')
+        if response.status_code != 200:
+            raise CommandError(f'자료실 조회 실패: HTTP {response.status_code}')
+        return time.perf_counter() - submitted_at
+
+    def run_scenario(self, options, logins=True):
+        """(자료실 p50 ms, p99 ms, 로그인 성공 수, 503 수)"""
+        stop = threading.Event()
+        login_futures = []
+        with ThreadPoolExecutor(options['threads']) as requests:
+
+            def feed_logins():
+                while not stop.is_set():
+                    login_futures.append(requests.submit(self.login))
+                    time.sleep(1 / options['login_rate'])
+
+            feeder = threading.Thread(target=feed_logins) if logins else None
+            if feeder:
+                feeder.start()
+            read_futures = []
+            deadline = time.perf_counter() + options['duration']
+            while time.perf_counter() < deadline:
+                read_futures.append(requests.submit(self.read, time.perf_counter()))
+                time.sleep(1 / options['read_rate'])
+            stop.set()
+            if feeder:
+                feeder.join()
+            latencies = [future.result() * 1000 for future in read_futures]
+            statuses = [future.result() for future in login_futures]
+        return (
+            percentile(latencies, 0.5), percentile(latencies, 0.99),
+            statuses.count(200), statuses.count(503),
+        )
@@ -0,0 +1,283 @@
+"""
+기존 회원 명부(CSV/XLSX) 일괄 등록
+
+    python manage.py import_members members.xlsx
+    python manage.py import_members members.csv --workers 4 --batch-size 2000
+    python manage.py import_members members.xlsx --resume
+    python manage.py import_members members.csv --dry-run
+
+첫 행은 열 이름 (필드명 또는 한글 이름: 아이디, 이메일, 비밀번호, 이름, 연락처, 주소, 생년월일, 직업/소속,
+가입경로, 가입동기, 마케팅수신동의, 회원등급). 아이디·연락처 외에는 생략 가능 (연락처가 비어 있는 행은 거부).
+- 파일은 한 행씩 읽고(XLSX는 openpyxl 읽기 전용 모드) batch-size 행마다 bulk_create
+- 아이디/이메일 중복은 미리 불러온 목록으로 확인 (행마다 DB 조회 없음)
+- 비밀번호가 있으면 프로세스 풀에서 해시, 없으면 사용 불가 비밀번호(비밀번호 찾기로 설정)
+- 거부된 행은 원래 열 + 사유로 <파일>.rejects.csv 에 기록 (비밀번호 열은 빈 칸 - 평문을 파일로 남기지 않음)
+- 배치가 저장될 때마다 마지막 행 번호를 <파일>.import-state.json 에 기록 → --resume 으로 이어서 실행
+  (저장 직후 기록 전에 중단되면 그 배치는 다시 읽을 때 '이미 사용 중인 아이디'로 거부 파일에 남는다)
+"""
+import csv
+import json
+import os
+import re
+from datetime import date, datetime
+from pathlib import Path
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from openpyxl import load_workbook
+
+from apps.accounts.hashers import init_hash_process
+from apps.accounts.models import User
+from apps.core.processes import process_pool
+
+COLUMNS = {
+    'username': ('아이디',),
+    'email': ('이메일',),
+    'password': ('비밀번호',),
+    'first_name': ('이름', '성명'),
+    'last_name': ('성',),
+    'phone': ('연락처', '전화번호', '휴대폰'),
+    'address': ('주소',),
+    'birth_date': ('생년월일',),
+    'occupation': ('직업/소속', '직업', '소속'),
+    'join_source': ('가입경로',),
+    'join_message': ('가입동기',),
+    'marketing_agreed': ('마케팅수신동의',),
+    'tier': ('회원등급',),
+}
+TRUE_VALUES = {'1', 'y', 'yes', 'true', 'o', '예', '동의'}
+REASON_COLUMN = '거부사유'
+
+
+def cell_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def parse_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = cell_text(value)
+    if not text:
+        return None
+    digits = re.sub(r'\D', '', text)
+    if len(digits) != 8:
+        raise ValidationError('생년월일: 형식이 올바르지 않습니다 (예: 1990-01-31)')
+    try:
+        return date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+    except ValueError:
+        raise ValidationError('생년월일: 존재하지 않는 날짜입니다')
+
+
+def parse_phone(value):
+    digits = re.sub(r'\D', '', cell_text(value))
+    # 엑셀에서 숫자로 저장되어 앞자리 0이 빠진 번호 (1012345678)
+    if len(digits) == 10 and digits.startswith('1'):
+        digits = '0' + digits
+    return digits
+
+
+def parse_choice(value, field, default):
+    """선택 필드 값 - 코드(SNS: sns) 또는 표시 이름 모두 허용"""
+    text = cell_text(value)
+    if not text:
+        return default
+    field = User._meta.get_field(field)
+    for key, label in field.choices:
+        if text.lower() in (key.lower(), label.lower()):
+            return key
+    raise ValidationError(f'{field.verbose_name}: 허용되지 않는 값입니다 ({text})')
+
+
+class Command(BaseCommand):
+    help = '기존 회원 명부(CSV/XLSX)를 일괄 등록 (중복/오류 행은 거부 파일에 기록)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV 또는 XLSX 파일')
+        parser.add_argument('--sheet', help='XLSX 시트 이름 (기본: 첫 시트)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='해시 프로세스 수 (기본 CPU 수)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 저장할 회원 수')
+        parser.add_argument('--rejects', help='거부 파일 경로 (기본 <파일>.rejects.csv)')
+        parser.add_argument('--resume', action='store_true', help='이전 실행이 저장한 행 다음부터 이어서 등록')
+        parser.add_argument('--dry-run', action='store_true', help='저장하지 않고 검사만 (거부 파일은 작성)')
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        if not path.is_file():
+            raise CommandError(f'파일을 찾을 수 없습니다: {path}')
+        self.source_name = path.name
+        self.state_path = path.with_name(path.name + '.import-state.json')
+        rejects_path = Path(options['rejects'] or path.with_name(path.name + '.rejects.csv'))
+        start_after = self.load_state() if options['resume'] else 0
+        if options['resume']:
+            self.stdout.write(f'{start_after}행까지 등록된 상태에서 이어서 실행합니다.')
+
+        self.usernames = set(User.objects.values_list('username', flat=True))
+        self.emails = {email.lower() for email in User.objects.exclude(email='').values_list('email', flat=True)}
+        self.stdout.write(f'기존 회원 {len(self.usernames)}명 확인')
+
+        headers, rows = self.read_rows(path, options['sheet'])
+        fields = self.map_columns(headers)
+        self.blank_columns = {index for index, field in enumerate(fields) if field == 'password'}
+        self.counts = {'created': 0, 'rejected': 0}
+        append = options['resume'] and rejects_path.exists()
+        # 자식은 해시만 하므로 해시 풀 없이(workers=0) 바로 계산
+        with open(rejects_path, 'a' if append else 'w', newline='', encoding='utf-8-sig') as rejects_file, \
+                process_pool(options['workers'], init_hash_process, (0,)) as pool:
+            self.rejects = csv.writer(rejects_file)
+            if not append:
+                self.rejects.writerow(headers + [REASON_COLUMN])
+            self.rejects_file = rejects_file
+
+            batch, rejected, last_row = [], [], start_after
+            for number, values in rows:
+                if number <= start_after:
+                    continue
+                last_row = number
+                try:
+                    batch.append(self.build_user(dict(zip(fields, values))) + (values,))
+                except ValidationError as exc:
+                    rejected.append((values, '; '.join(exc.messages)))
+                if len(batch) + len(rejected) >= options['batch_size']:
+                    self.flush(batch, rejected, last_row, pool, options)
+                    batch, rejected = [], []
+            self.flush(batch, rejected, last_row, pool, options)
+
+        message = f'회원 {self.counts["created"]}명 등록, {self.counts["rejected"]}행 거부'
+        if options['dry_run']:
+            message = f'[검사만] 등록 가능 {self.counts["created"]}명, {self.counts["rejected"]}행 거부'
+        if self.counts['rejected']:
+            message += f' (거부 목록: {rejects_path})'
+        self.stdout.write(self.style.SUCCESS(message))
+
+    def read_rows(self, path, sheet):
+        """(열 이름 목록, (행 번호, 값 목록) 생성기) - 행 번호는 파일 기준 (열 이름 행이 1)"""
+        if path.suffix.lower() in ('.xlsx', '.xlsm'):
+            source = load_workbook(path, read_only=True, data_only=True)
+            worksheet = source[sheet] if sheet else source.worksheets[0]
+            values = worksheet.iter_rows(values_only=True)
+        elif path.suffix.lower() == '.csv':
+            source = open(path, newline='', encoding='utf-8-sig')
+            values = csv.reader(source)
+        else:
+            raise CommandError('CSV 또는 XLSX 파일만 가져올 수 있습니다.')
+
+        headers = [cell_text(value) for value in next(values, [])]
+        while headers and not headers[-1]:
+            headers.pop()
+
+        def generate():
+            try:
+                for number, row in enumerate(values, 2):
+                    row = list(row)[:len(headers)]
+                    if any(cell_text(value) for value in row):
+                        yield number, row + [None] * (len(headers) - len(row))
+            finally:
+                source.close()
+        return headers, generate()
+
+    def map_columns(self, headers):
+        aliases = {}
+        for field, names in COLUMNS.items():
+            for name in (field,) + names:
+                aliases[name.lower()] = field
+        fields = [aliases.get(header.lower()) for header in headers]
+        if 'username' not in fields:
+            raise CommandError('아이디(username) 열이 없습니다.')
+        unknown = [header for header, field in zip(headers, fields) if header and field is None]
+        if unknown:
+            self.stdout.write(f'무시하는 열: {", ".join(unknown)}')
+        return fields
+
+    def build_user(self, data):
+        """행 → (저장 전 User, 비밀번호) - 잘못된 행은 ValidationError"""
+        data.pop(None, None)
+        user = User(
+            username=cell_text(data.get('username')),
+            email=User.objects.normalize_email(cell_text(data.get('email'))),
+            first_name=cell_text(data.get('first_name')),
+            last_name=cell_text(data.get('last_name')),
+            phone=parse_phone(data.get('phone')),
+            address=cell_text(data.get('address')),
+            birth_date=parse_date(data.get('birth_date')),
+            occupation=cell_text(data.get('occupation')),
+            join_source=parse_choice(data.get('join_source'), 'join_source', ''),
+            join_message=cell_text(data.get('join_message')),
+            marketing_agreed=cell_text(data.get('marketing_agreed')).lower() in TRUE_VALUES,
+            tier=parse_choice(data.get('tier'), 'tier', 'FREE'),
+        )
+        try:
+            user.full_clean(exclude=['password'], validate_unique=False, validate_constraints=False)
+        except ValidationError as exc:
+            raise ValidationError([
+                f'{User._meta.get_field(field).verbose_name}: {message}'
+                for field, messages in exc.message_dict.items() for message in messages
+            ])
+        if user.username in self.usernames:
+            raise ValidationError('이미 사용 중인 아이디입니다.')
+        email = user.email.lower()
+        if email and email in self.emails:
+            raise ValidationError('이미 등록된 이메일입니다.')
+        self.usernames.add(user.username)
+        if email:
+            self.emails.add(email)
+        return user, cell_text(data.get('password'))
+
+    def flush(self, batch, rejected, last_row, pool, options):
+        if batch and not options['dry_run']:
+            passwords = [password for _, password, _ in batch if password]
+            chunksize = max(len(passwords) // (max(options['workers'], 1) * 4), 1)
+            hashed = iter(pool.map(make_password, passwords, chunksize=chunksize))
+            for user, password, _ in batch:
+                user.password = next(hashed) if password else make_password(None)
+            failed = self.save(batch, options['batch_size'])
+            rejected += failed
+        else:
+            failed = []
+        self.counts['created'] += len(batch) - len(failed)
+        for values, reason in rejected:
+            self.rejects.writerow([
+                '' if index in self.blank_columns else cell_text(value) for index, value in enumerate(values)
+            ] + [reason])
+        self.rejects_file.flush()
+        if not options['dry_run']:
+            self.save_state(last_row)
+        self.counts['rejected'] += len(rejected)
+        self.stdout.write(f'[{last_row}행] 등록 {self.counts["created"]}명, 거부 {self.counts["rejected"]}행')
+
+    def save(self, batch, batch_size):
+        """bulk_create - 그 사이 가입한 회원과 겹치면 행마다 다시 저장해 충돌 행만 거부"""
+        users = [user for user, _, _ in batch]
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=batch_size)
+            return []
+        except IntegrityError:
+            pass
+        failed = []
+        with transaction.atomic():
+            for user, _, values in batch:
+                try:
+                    with transaction.atomic():
+                        User.objects.bulk_create([user])
+                except IntegrityError:
+                    failed.append((values, '이미 사용 중인 아이디입니다.'))
+        return failed
+
+    def load_state(self):
+        if not self.state_path.exists():
+            return 0
+        state = json.loads(self.state_path.read_text())
+        if state.get('source') != self.source_name:
+            raise CommandError(f'다른 파일의 진행 기록입니다: {self.state_path}')
+        return state['row']
+
+    def save_state(self, row):
+        self.state_path.write_text(json.dumps({'source': self.source_name, 'row': row}))
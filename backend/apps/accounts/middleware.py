@@ -0,0 +1,29 @@
+"""
+비밀번호 해시 대기열 초과(PasswordHashBusy) → 503 + Retry-After
+
+해시 계산은 DRF 뷰(로그인·가입·비밀번호 변경)와 Django 뷰(관리자 로그인 등) 모두에서 일어나므로
+DRF 예외 처리기가 아닌 미들웨어에서 변환한다. (DRF는 APIException이 아닌 예외를 그대로 다시 올림)
+"""
+from django.http import HttpResponse, JsonResponse
+
+from .hashers import PasswordHashBusy
+
+BUSY_MESSAGE = '요청이 많아 잠시 후 다시 시도해주세요.'
+
+
+class PasswordHashBusyMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, PasswordHashBusy):
+            return None
+        if request.path.startswith('/api/'):
+            response = JsonResponse({'detail': BUSY_MESSAGE}, status=503)
+        else:
+            response = HttpResponse(BUSY_MESSAGE, status=503, content_type='text/plain; charset=utf-8')
+        response['Retry-After'] = str(exception.retry_after)
+        return response
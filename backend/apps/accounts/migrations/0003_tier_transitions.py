@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:01
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TierTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('username', models.CharField(max_length=150, verbose_name='아이디')),
+                ('from_tier', models.CharField(choices=[('FREE', '무료회원'), ('SUPPORTER', '후원회원')], max_length=10, verbose_name='이전 등급')),
+                ('to_tier', models.CharField(choices=[('FREE', '무료회원'), ('SUPPORTER', '후원회원')], max_length=10, verbose_name='변경 등급')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='변경일시')),
+                ('changed_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='처리 관리자')),
+                ('user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tier_transitions', to=settings.AUTH_USER_MODEL, verbose_name='회원')),
+            ],
+            options={
+                'verbose_name': '등급 변경 기록',
+                'verbose_name_plural': '등급 변경 기록',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['user', 'created_at'], name='tier_transition_user_idx')],
+            },
+        ),
+    ]
@@ -1,5 +1,12 @@
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
+
+from apps.core.cache import get_model_versions
 
 
 class User(AbstractUser):
@@ -86,6 +93,11 @@ class User(AbstractUser):
     class Meta:
         verbose_name = '회원'
         verbose_name_plural = '회원 관리'
+        indexes = [
+            models.Index(fields=['tier', 'created_at'], name='user_tier_idx'),
+            # 회원 목록 (UserListView) 정렬 + 키셋 보조 키
+            models.Index(fields=['created_at', 'id'], name='user_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.username} ({self.get_tier_display()})"
@@ -124,6 +136,48 @@ class User(AbstractUser):
         return True
 
 
+class TierTransition(models.Model):
+    """
+    회원등급 변경 기록 (추가 전용)
+    - apps.accounts.tiers.change_tier()가 등급 UPDATE와 같은 트랜잭션에서 bulk_create
+    - 회원이 탈퇴해도 기록은 남음 (user는 NULL, username은 변경 당시 값)
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='tier_transitions',
+        verbose_name='회원'
+    )
+    username = models.CharField(max_length=150, verbose_name='아이디')
+    from_tier = models.CharField(max_length=10, choices=User.TIER_CHOICES, verbose_name='이전 등급')
+    to_tier = models.CharField(max_length=10, choices=User.TIER_CHOICES, verbose_name='변경 등급')
+    changed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+',
+        verbose_name='처리 관리자'
+    )
+    created_at = models.DateTimeField(default=timezone.now, verbose_name='변경일시')
+
+    class Meta:
+        verbose_name = '등급 변경 기록'
+        verbose_name_plural = '등급 변경 기록'
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['user', 'created_at'], name='tier_transition_user_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.username}: {self.from_tier} → {self.to_tier}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('등급 변경 기록은 수정할 수 없습니다.')
+        super().save(*args, **kwargs)
+
+
 class BoardPermission(models.Model):
     """
     게시판별 접근 권한 설정
@@ -172,40 +226,64 @@ class BoardPermission(models.Model):
     def __str__(self):
         return f"{self.get_board_type_display()} - 읽기:{self.get_read_permission_display()}"
 
-    @classmethod
-    def check_read_permission(cls, board_type, user):
-        """사용자의 게시판 읽기 권한 확인"""
-        try:
-            perm = cls.objects.get(board_type=board_type)
-        except cls.DoesNotExist:
-            return True  # 권한 설정 없으면 기본 공개
-
-        if perm.read_permission == 'ALL':
+    @staticmethod
+    def level_allows(level, user):
+        """권한 단계(ALL/FREE/SUPPORTER/ADMIN)를 사용자가 만족하는지"""
+        if level == 'ALL':
             return True
-        if perm.read_permission == 'FREE':
+        if level == 'FREE':
             return user.is_authenticated
-        if perm.read_permission == 'SUPPORTER':
+        if level == 'SUPPORTER':
             return user.is_authenticated and (user.tier == 'SUPPORTER' or user.is_admin)
-        if perm.read_permission == 'ADMIN':
+        if level == 'ADMIN':
             return user.is_authenticated and user.is_admin
-
         return False
 
+    @classmethod
+    def check_read_permission(cls, board_type, user):
+        """사용자의 게시판 읽기 권한 확인"""
+        rule = board_permission_table.get().get(board_type)
+        if rule is None:
+            return True  # 권한 설정 없으면 기본 공개
+        return cls.level_allows(rule.read_permission, user)
+
     @classmethod
     def check_write_permission(cls, board_type, user):
         """사용자의 게시판 쓰기 권한 확인"""
-        try:
-            perm = cls.objects.get(board_type=board_type)
-        except cls.DoesNotExist:
+        rule = board_permission_table.get().get(board_type)
+        if rule is None:
             return user.is_authenticated and user.is_admin
+        # 쓰기는 '전체 공개'여도 로그인 필요
+        return user.is_authenticated and cls.level_allows(rule.write_permission, user)
 
-        if perm.write_permission == 'ALL':
-            return user.is_authenticated
-        if perm.write_permission == 'FREE':
-            return user.is_authenticated
-        if perm.write_permission == 'SUPPORTER':
-            return user.is_authenticated and (user.tier == 'SUPPORTER' or user.is_admin)
-        if perm.write_permission == 'ADMIN':
-            return user.is_authenticated and user.is_admin
 
-        return False
+BoardRule = namedtuple('BoardRule', 'read_permission write_permission is_active')
+
+
+class BoardPermissionTable:
+    """
+    BoardPermission 테이블 전체의 프로세스 단위 스냅샷 (읽기 전용 {board_type: BoardRule})
+    - 권한 확인마다 DB를 조회하지 않고 모델 버전(캐시)만 확인
+    - 버전은 모든 워커가 함께 보는 공유 캐시에 있어야 함 (워커 2개 이상이면 시작 시 확인, apps.core.cache.check_shared_cache)
+    - 저장/삭제 시그널(admin list_editable 포함)이 트랜잭션 커밋 후 버전을 올리면 각 워커가 다음 확인 때 다시 읽음
+    - QuerySet.update()처럼 시그널이 없는 변경 후에는 bump_model_version(BoardPermission) 필요
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = (None, MappingProxyType({}))
+
+    def get(self):
+        version = get_model_versions([BoardPermission])[0]
+        loaded, table = self._snapshot
+        if loaded == version:
+            return table
+        with self._lock:
+            if self._snapshot[0] != version:
+                # 읽기 전에 확인한 버전으로 기록 - 읽는 중에 바뀌면 다음 확인 때 다시 읽음
+                rows = BoardPermission.objects.values_list('board_type', 'read_permission', 'write_permission', 'is_active')
+                self._snapshot = (version, MappingProxyType({row[0]: BoardRule(*row[1:]) for row in rows}))
+            return self._snapshot[1]
+
+
+board_permission_table = BoardPermissionTable()
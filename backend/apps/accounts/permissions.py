@@ -0,0 +1,12 @@
+from rest_framework.permissions import BasePermission
+
+from .models import BoardPermission
+
+
+class BoardReadPermission(BasePermission):
+    """뷰의 board_type 게시판 읽기 권한 (BoardPermission 설정) - board_type이 None이면 확인하지 않음"""
+    message = '게시판 읽기 권한이 없습니다.'
+
+    def has_permission(self, request, view):
+        board_type = getattr(view, 'board_type', None)
+        return board_type is None or BoardPermission.check_read_permission(board_type, request.user)
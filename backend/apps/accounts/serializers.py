@@ -1,7 +1,35 @@
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from .authentication import set_user_claims
 from .models import User
 
 
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """로그인 토큰에 회원등급/관리자 클레임 추가 (읽기 요청은 클레임만으로 인증)"""
+
+    @classmethod
+    def get_token(cls, user):
+        return set_user_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """토큰 갱신 시 클레임을 현재 회원 정보로 다시 채움 (등급/권한 변경 반영)"""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        access = AccessToken(data['access'])
+        user = User.objects.filter(**{jwt_settings.USER_ID_FIELD: access[jwt_settings.USER_ID_CLAIM]}).first()
+        if user is None:
+            raise AuthenticationFailed('회원 정보를 찾을 수 없습니다.', 'user_not_found')
+        data['access'] = str(set_user_claims(access, user))
+        if 'refresh' in data:
+            data['refresh'] = str(set_user_claims(RefreshToken(data['refresh']), user))
+        return data
+
+
 class UserSerializer(serializers.ModelSerializer):
     """회원 정보 조회/수정용 Serializer"""
     tier_display = serializers.CharField(source='get_tier_display', read_only=True)
@@ -70,6 +98,15 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         return user
 
 
+class UserIdsSerializer(serializers.Serializer):
+    """회원 일괄 처리 대상 ID 목록"""
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=5000,
+    )
+
+
 class UserAdminSerializer(serializers.ModelSerializer):
     """관리자용 회원 정보 Serializer (모든 필드 수정 가능)"""
     tier_display = serializers.CharField(source='get_tier_display', read_only=True)
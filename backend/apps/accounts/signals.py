@@ -0,0 +1,7 @@
+from django.db.models.signals import post_delete, post_save
+from apps.core.cache import bump_version_on_change
+from .models import BoardPermission
+
+# 게시판 권한 스냅샷(board_permission_table) 갱신 - admin list_editable 저장도 save()를 거침
+post_save.connect(bump_version_on_change, sender=BoardPermission, dispatch_uid='cache-version-save-BoardPermission')
+post_delete.connect(bump_version_on_change, sender=BoardPermission, dispatch_uid='cache-version-delete-BoardPermission')
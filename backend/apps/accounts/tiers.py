@@ -0,0 +1,54 @@
+"""
+회원등급 일괄 변경
+
+후원회원 승인/해제를 회원마다 save() 하지 않고 한 번의 UPDATE로 처리한다.
+- 대상 행을 잠그고(select_for_update) 현재 등급을 읽은 뒤, 바뀌는 회원만 UPDATE
+- 같은 트랜잭션에서 TierTransition(변경 기록)을 bulk_create
+- 커밋 후 바뀐 회원의 토큰 클레임 무효화 (revoke_user_tokens)
+QuerySet.update()는 save()를 거치지 않으므로 admin_level 동기화도 하지 않는다 (등급만 변경)
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .authentication import revoke_user_tokens
+from .models import TierTransition, User
+
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'  # 이미 해당 등급
+NOT_FOUND = 'not_found'
+
+
+def change_tier(user_ids, tier, changed_by=None):
+    """user_ids의 등급을 tier로 변경 - {user_id: CHANGED/UNCHANGED/NOT_FOUND} (입력 순서, 중복 제거)"""
+    user_ids = list(dict.fromkeys(user_ids))
+    now = timezone.now()
+    with transaction.atomic():
+        current = {
+            pk: (username, old_tier)
+            for pk, username, old_tier in User.objects.select_for_update()
+            .filter(pk__in=user_ids).values_list('pk', 'username', 'tier')
+        }
+        changed = [pk for pk in user_ids if pk in current and current[pk][1] != tier]
+        if changed:
+            approved = tier == 'SUPPORTER'
+            User.objects.filter(pk__in=changed).update(
+                tier=tier,
+                tier_approved_at=now if approved else None,
+                tier_approved_by=changed_by if approved else None,
+                updated_at=now,
+            )
+            TierTransition.objects.bulk_create([
+                TierTransition(
+                    user_id=pk, username=current[pk][0], from_tier=current[pk][1], to_tier=tier,
+                    changed_by=changed_by, created_at=now,
+                )
+                for pk in changed
+            ])
+    if changed:
+        revoke_user_tokens(*changed)
+
+    changed = set(changed)
+    return {
+        pk: CHANGED if pk in changed else UNCHANGED if pk in current else NOT_FOUND
+        for pk in user_ids
+    }
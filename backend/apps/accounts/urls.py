@@ -19,13 +19,16 @@ urlpatterns = [
 
     # 관리자: 회원 관리
     path('users/', views.UserListView.as_view(), name='user_list'),
+    path('users/approve-supporter/', views.SupporterBulkApprovalView.as_view(), name='approve_supporters'),
     path('users/<int:user_id>/approve-supporter/', views.SupporterApprovalView.as_view(), name='approve_supporter'),
     path('users/<int:user_id>/revoke-supporter/', views.SupporterRevokeView.as_view(), name='revoke_supporter'),
     path('users/<int:user_id>/assign-staff/', views.StaffAssignView.as_view(), name='assign_staff'),
     path('users/<int:user_id>/revoke-staff/', views.StaffRevokeView.as_view(), name='revoke_staff'),
+    path('password-hash-stats/', views.PasswordHashStatsView.as_view(), name='password_hash_stats'),
 
     # 게시판 권한
     path('board-permissions/', views.BoardPermissionListView.as_view(), name='board_permissions'),
     path('board-permissions/<str:board_type>/', views.BoardPermissionUpdateView.as_view(), name='board_permission_update'),
+    path('check-permission/', views.CheckBoardPermissionsView.as_view(), name='check_permissions'),
     path('check-permission/<str:board_type>/', views.CheckBoardPermissionView.as_view(), name='check_permission'),
 ]
@@ -1,10 +1,13 @@
-from django.utils import timezone
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
-from .models import User, BoardPermission
-from .serializers import UserSerializer, UserRegisterSerializer
+from apps.core.conditional import ConditionalGetMixin
+from .authentication import revoke_user_tokens
+from .hashers import password_hash_pool
+from .models import User, BoardPermission, board_permission_table
+from .serializers import UserSerializer, UserRegisterSerializer, UserIdsSerializer
+from .tiers import CHANGED, NOT_FOUND, UNCHANGED, change_tier
 
 
 class UserRegisterView(generics.CreateAPIView):
@@ -28,14 +31,22 @@ class UserRegisterView(generics.CreateAPIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class UserProfileView(generics.RetrieveUpdateAPIView):
+class UserProfileView(ConditionalGetMixin, generics.RetrieveUpdateAPIView):
     """내 정보 조회/수정 API"""
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
+    conditional_cache_control = 'private, no-cache'
+    requires_user_row = True  # 토큰 클레임에 없는 회원 정보 전체 필요
 
     def get_object(self):
         return self.request.user
 
+    def get_validators(self, request):
+        # 인증 과정에서 이미 불러온 사용자 정보로 계산 (추가 조회 없음)
+        user = request.user
+        updated_at = user.updated_at.timestamp()
+        return f'W/"user-{user.pk}-{updated_at}"', updated_at
+
 
 class PasswordChangeView(APIView):
     """비밀번호 변경 API"""
@@ -71,7 +82,9 @@ class AccountDeleteView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        user_id = user.pk
         user.delete()
+        revoke_user_tokens(user_id)
         return Response({'message': '회원 탈퇴가 완료되었습니다.'})
 
 
@@ -95,16 +108,12 @@ class SupporterApprovalView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        if target_user.tier == 'SUPPORTER':
+        if change_tier([target_user.pk], 'SUPPORTER', request.user)[target_user.pk] != CHANGED:
             return Response(
                 {'detail': '이미 후원회원입니다.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-
-        target_user.tier = 'SUPPORTER'
-        target_user.tier_approved_at = timezone.now()
-        target_user.tier_approved_by = request.user
-        target_user.save()
+        target_user.refresh_from_db(fields=['tier', 'tier_approved_at'])
 
         return Response({
             'message': f'{target_user.username}님이 후원회원으로 승급되었습니다.',
@@ -130,16 +139,12 @@ class SupporterRevokeView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        if target_user.tier == 'FREE':
+        if change_tier([target_user.pk], 'FREE', request.user)[target_user.pk] != CHANGED:
             return Response(
                 {'detail': '이미 무료회원입니다.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-
         target_user.tier = 'FREE'
-        target_user.tier_approved_at = None
-        target_user.tier_approved_by = None
-        target_user.save()
 
         return Response({
             'message': f'{target_user.username}님이 무료회원으로 변경되었습니다.',
@@ -148,6 +153,33 @@ class SupporterRevokeView(APIView):
         })
 
 
+class SupporterBulkApprovalView(APIView):
+    """
+    후원회원 일괄 승인 API (관리자 전용)
+    - {"user_ids": [1, 2, ...]} (최대 5000명)
+    - 한 번의 UPDATE + 등급 변경 기록 bulk_create (apps.accounts.tiers.change_tier)
+    - results: 회원별 처리 결과 (approved / already_supporter / not_found)
+    """
+    permission_classes = [IsAdminUser]
+
+    RESULT_LABELS = {CHANGED: 'approved', UNCHANGED: 'already_supporter', NOT_FOUND: 'not_found'}
+
+    def post(self, request):
+        serializer = UserIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = change_tier(serializer.validated_data['user_ids'], 'SUPPORTER', request.user)
+        approved = sum(1 for result in results.values() if result == CHANGED)
+
+        return Response({
+            'message': f'{approved}명의 회원이 후원회원으로 승급되었습니다.',
+            'approved': approved,
+            'results': [
+                {'user_id': user_id, 'result': self.RESULT_LABELS[result]}
+                for user_id, result in results.items()
+            ],
+        })
+
+
 class UserListView(generics.ListAPIView):
     """
     회원 목록 조회 API (관리자 전용)
@@ -196,6 +228,7 @@ class StaffAssignView(APIView):
 
         target_user.is_staff = True
         target_user.save()
+        revoke_user_tokens(target_user.pk)
 
         return Response({
             'message': f'{target_user.username}님이 운영진으로 지정되었습니다.',
@@ -234,6 +267,7 @@ class StaffRevokeView(APIView):
 
         target_user.is_staff = False
         target_user.save()
+        revoke_user_tokens(target_user.pk)
 
         return Response({
             'message': f'{target_user.username}님의 운영진 권한이 해제되었습니다.',
@@ -242,6 +276,14 @@ class StaffRevokeView(APIView):
         })
 
 
+class PasswordHashStatsView(APIView):
+    """비밀번호 해시 풀 통계 (관리자 전용) - 응답한 워커 프로세스 기준"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(password_hash_pool.summary())
+
+
 # ========================================
 # 게시판 권한 API
 # ========================================
@@ -311,3 +353,28 @@ class CheckBoardPermissionView(APIView):
             'user_tier': user.tier if user.is_authenticated else None,
             'is_admin': user.is_admin if user.is_authenticated else False,
         })
+
+
+class CheckBoardPermissionsView(APIView):
+    """
+    전체 게시판 접근 권한 일괄 확인 API
+    - 로그인 직후 한 번 호출해 게시판마다 권한 확인 요청을 보내지 않도록 함
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        user = request.user
+        board_types = [board_type for board_type, _ in BoardPermission.BOARD_CHOICES]
+        board_types += sorted(set(board_permission_table.get()) - set(board_types))
+
+        return Response({
+            'boards': {
+                board_type: {
+                    'can_read': BoardPermission.check_read_permission(board_type, user),
+                    'can_write': BoardPermission.check_write_permission(board_type, user),
+                }
+                for board_type in board_types
+            },
+            'user_tier': user.tier if user.is_authenticated else None,
+            'is_admin': user.is_admin if user.is_authenticated else False,
+        })
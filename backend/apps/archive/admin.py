@@ -1,10 +1,13 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
+from django.template.response import TemplateResponse
 from .models import Notice, News, GalleryAlbum, GalleryImage, GalleryVideo
+from .uploads import BulkUploadError, bulk_upload_images
 
 
 @admin.register(Notice)
 class NoticeAdmin(admin.ModelAdmin):
-    list_display = ['id', 'category', 'title', 'author', 'views', 'is_pinned', 'created_at']
+    list_display = ['id', 'category', 'title', 'author', 'views', 'unique_visitors', 'is_pinned', 'created_at']
     list_filter = ['category', 'is_pinned', 'created_at']
     search_fields = ['title', 'content']
     list_editable = ['is_pinned']
@@ -28,16 +31,45 @@ class GalleryImageInline(admin.TabularInline):
 
 @admin.register(GalleryAlbum)
 class GalleryAlbumAdmin(admin.ModelAdmin):
-    list_display = ['id', 'category', 'title', 'event_date', 'image_count', 'is_featured', 'views']
+    list_display = ['id', 'category', 'title', 'event_date', 'image_count', 'is_featured', 'views', 'unique_visitors']
     list_filter = ['category', 'is_featured', 'event_date']
     search_fields = ['title', 'description']
     list_editable = ['is_featured']
     inlines = [GalleryImageInline]
     ordering = ['-event_date']
+    actions = ['bulk_upload']
+
+    @admin.action(description='선택한 앨범에 사진 일괄 업로드 (이미지 여러 장 / ZIP)')
+    def bulk_upload(self, request, queryset):
+        if queryset.count() != 1:
+            self.message_user(request, '사진을 추가할 앨범을 하나만 선택해주세요.', messages.WARNING)
+            return None
+        album = queryset.get()
+
+        files = request.FILES.getlist('files')
+        if request.POST.get('upload') and files:
+            try:
+                images, skipped = bulk_upload_images(album, files)
+            except BulkUploadError as e:
+                self.message_user(request, str(e), messages.ERROR)
+                return None
+            self.message_user(request, f'{album.title}: {len(images)}장을 업로드했습니다.')
+            for name, reason in skipped:
+                self.message_user(request, f'{name}: {reason}', messages.WARNING)
+            return None
+
+        # 파일 선택 화면 (제출하면 같은 액션으로 다시 전송)
+        return TemplateResponse(request, 'admin/archive/galleryalbum/bulk_upload.html', {
+            **self.admin_site.each_context(request),
+            'title': '사진 일괄 업로드',
+            'opts': self.model._meta,
+            'album': album,
+            'action_checkbox_name': helpers.ACTION_CHECKBOX_NAME,
+        })
 
 
 @admin.register(GalleryVideo)
 class GalleryVideoAdmin(admin.ModelAdmin):
-    list_display = ['id', 'title', 'duration', 'views', 'created_at']
+    list_display = ['id', 'title', 'duration', 'views', 'unique_visitors', 'created_at']
     search_fields = ['title']
     ordering = ['-created_at']
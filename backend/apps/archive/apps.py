@@ -4,3 +4,6 @@ class ArchiveConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.archive'
     verbose_name = '자료실'
+
+    def ready(self):
+        import apps.archive.signals
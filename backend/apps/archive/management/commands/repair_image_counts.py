@@ -0,0 +1,40 @@
+"""
+갤러리 앨범 이미지 수 재계산
+
+    python manage.py repair_image_counts
+    python manage.py repair_image_counts --dry-run
+
+GalleryAlbum.image_count는 GalleryImage 추가/삭제 시그널로 갱신된다.
+시그널을 거치지 않는 작업(raw SQL, loaddata 등) 후 값이 어긋나면 이 명령으로 맞춘다.
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F
+
+from apps.archive.models import GalleryAlbum
+
+
+class Command(BaseCommand):
+    help = '갤러리 앨범의 image_count를 실제 이미지 수로 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='변경하지 않고 불일치 앨범만 출력')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            mismatched = list(
+                GalleryAlbum.objects.with_live_image_count()
+                .exclude(image_count=F('num_images'))
+                .order_by('pk')
+                .values_list('pk', 'title', 'image_count', 'num_images')
+            )
+            for pk, title, stored, actual in mismatched:
+                self.stdout.write(f'#{pk} {title}: {stored} → {actual}')
+
+            if not options['dry_run'] and mismatched:
+                GalleryAlbum.objects.filter(pk__in=[row[0] for row in mismatched]).refresh_image_counts()
+
+        if options['dry_run']:
+            self.stdout.write(f'불일치 앨범 {len(mismatched)}개 (변경하지 않음)')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'앨범 {len(mismatched)}개의 이미지 수를 수정했습니다.'))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryalbum',
+            name='unique_visitors',
+            field=models.IntegerField(default=0, verbose_name='순방문자'),
+        ),
+        migrations.AddField(
+            model_name='galleryvideo',
+            name='unique_visitors',
+            field=models.IntegerField(default=0, verbose_name='순방문자'),
+        ),
+        migrations.AddField(
+            model_name='notice',
+            name='unique_visitors',
+            field=models.IntegerField(default=0, verbose_name='순방문자'),
+        ),
+    ]
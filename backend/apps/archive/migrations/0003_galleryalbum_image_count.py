@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:19
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_image_count(apps, schema_editor):
+    GalleryAlbum = apps.get_model('archive', 'GalleryAlbum')
+    GalleryImage = apps.get_model('archive', 'GalleryImage')
+    counts = GalleryImage.objects.filter(album=OuterRef('pk')).order_by().values('album').annotate(
+        total=Count('pk')
+    ).values('total')
+    GalleryAlbum.objects.update(image_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0002_unique_visitors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryalbum',
+            name='image_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='이미지 수'),
+        ),
+        migrations.RunPython(fill_image_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:21
+
+from django.db import migrations, models
+
+from apps.core.search import build_search_document
+
+SEARCH_FIELDS = {
+    'notice': ('title', 'content'),
+    'news': ('title', 'excerpt'),
+}
+
+
+def fill_search_document(apps, schema_editor):
+    for model_name, fields in SEARCH_FIELDS.items():
+        model = apps.get_model('archive', model_name)
+        for obj in model.objects.only('pk', *fields).iterator():
+            document = build_search_document(*(getattr(obj, f) for f in fields))
+            model.objects.filter(pk=obj.pk).update(search_document=document)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for model_name in SEARCH_FIELDS:
+        table = apps.get_model('archive', model_name)._meta.db_table
+        if vendor == 'postgresql':
+            # 한글 bigram 문서를 'simple' 설정으로 tsvector화 (형태소 사전 불필요)
+            schema_editor.execute(
+                f'ALTER TABLE "{table}" ADD COLUMN "search_vector" tsvector '
+                f"GENERATED ALWAYS AS (to_tsvector('simple', \"search_document\")) STORED"
+            )
+            schema_editor.execute(f'CREATE INDEX "{table}_search_vector" ON "{table}" USING GIN ("search_vector")')
+        elif vendor == 'sqlite':
+            # 개발용 FTS5 색인 - 저장/삭제 시그널로 갱신
+            try:
+                schema_editor.execute(f'CREATE VIRTUAL TABLE "{table}_fts" USING fts5(search_document)')
+            except Exception:
+                continue  # FTS5 미지원 SQLite - icontains 검색으로 동작
+            schema_editor.execute(
+                f'INSERT INTO "{table}_fts" (rowid, search_document) SELECT id, search_document FROM "{table}"'
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for model_name in SEARCH_FIELDS:
+        table = apps.get_model('archive', model_name)._meta.db_table
+        if vendor == 'postgresql':
+            schema_editor.execute(f'ALTER TABLE "{table}" DROP COLUMN IF EXISTS "search_vector"')
+        elif vendor == 'sqlite':
+            schema_editor.execute(f'DROP TABLE IF EXISTS "{table}_fts"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0003_galleryalbum_image_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='search_document',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='notice',
+            name='search_document',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(fill_search_document, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0004_search_document'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='galleryalbum',
+            index=models.Index(fields=['event_date', 'id'], name='album_event_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryalbum',
+            index=models.Index(fields=['category', 'event_date'], name='album_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryvideo',
+            index=models.Index(fields=['created_at', 'id'], name='video_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['published_date', 'id'], name='news_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['source', 'published_date'], name='news_source_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['is_pinned', 'created_at', 'id'], name='notice_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['category', 'is_pinned', 'created_at'], name='notice_category_idx'),
+        ),
+    ]
@@ -1,8 +1,15 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from apps.core.cache import bump_model_version
+from apps.core.images import ImagePlaceholderModel, ImageVariantsModel, image_processor
+from apps.core.search import SearchableModel
 
 
-class Notice(models.Model):
+class Notice(SearchableModel):
     """공지사항 - 프론트엔드: archive/notice.html"""
+    search_fields = ('title', 'content')
+
     CATEGORY_CHOICES = [
         ('important', '중요'),
         ('event', '행사'),
@@ -15,6 +22,7 @@ class Notice(models.Model):
     content = models.TextField(verbose_name='내용')
     author = models.CharField(max_length=50, verbose_name='작성부서')
     views = models.IntegerField(default=0, verbose_name='조회수')
+    unique_visitors = models.IntegerField(default=0, verbose_name='순방문자')  # HyperLogLog 추정값
     is_pinned = models.BooleanField(default=False, verbose_name='상단고정')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='작성일')
     updated_at = models.DateTimeField(auto_now=True)
@@ -23,13 +31,23 @@ class Notice(models.Model):
         verbose_name = '공지사항'
         verbose_name_plural = '공지사항 관리'
         ordering = ['-is_pinned', '-created_at']
+        indexes = [
+            # 목록 정렬 + 키셋 페이지네이션 보조 키(id)
+            models.Index(fields=['is_pinned', 'created_at', 'id'], name='notice_list_idx'),
+            models.Index(fields=['category', 'is_pinned', 'created_at'], name='notice_category_idx'),
+            # 조건부 GET 검증값 (COUNT + MAX(updated_at), apps.core.conditional)
+            models.Index(fields=['updated_at'], name='notice_updated_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.get_category_display()}] {self.title}"
 
 
-class News(models.Model):
+class News(SearchableModel, ImageVariantsModel):
     """보도자료 - 프론트엔드: archive/news.html"""
+    search_fields = ('title', 'excerpt')
+    variant_fields = ('thumbnail',)
+
     source = models.CharField(max_length=50, verbose_name='언론사')
     title = models.CharField(max_length=200, verbose_name='제목')
     excerpt = models.TextField(verbose_name='요약')
@@ -42,18 +60,44 @@ class News(models.Model):
     is_featured = models.BooleanField(default=False, verbose_name='주요보도')
     published_date = models.DateField(verbose_name='보도일')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = '보도자료'
         verbose_name_plural = '보도자료 관리'
         ordering = ['-published_date']
+        indexes = [
+            models.Index(fields=['published_date', 'id'], name='news_published_idx'),
+            models.Index(fields=['source', 'published_date'], name='news_source_idx'),
+            # 조건부 GET 검증값 (COUNT + MAX(updated_at), apps.core.conditional)
+            models.Index(fields=['updated_at'], name='news_updated_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.source}] {self.title}"
 
 
-class GalleryAlbum(models.Model):
+class GalleryAlbumQuerySet(models.QuerySet):
+
+    def with_live_image_count(self):
+        """저장된 image_count 대신 실제 이미지 수를 집계 (num_images)"""
+        return self.annotate(num_images=Count('images'))
+
+    def refresh_image_counts(self):
+        """image_count를 실제 이미지 수로 다시 계산 (UPDATE 한 번)"""
+        counts = GalleryImage.objects.filter(album=OuterRef('pk')).order_by().values('album').annotate(
+            total=Count('pk')
+        ).values('total')
+        rows = self.update(image_count=Coalesce(Subquery(counts), Value(0)))
+        bump_model_version(GalleryAlbum)
+        return rows
+
+
+class GalleryAlbum(ImagePlaceholderModel, ImageVariantsModel):
     """갤러리 앨범 - 프론트엔드: archive/gallery.html"""
+    variant_fields = ('cover_image',)
+    placeholder_fields = {'cover_image': ('cover_width', 'cover_height', 'cover_color', 'cover_blurhash')}
+
     CATEGORY_CHOICES = [
         ('contest', '웅변대회'),
         ('memorial', '추모행사'),
@@ -71,50 +115,118 @@ class GalleryAlbum(models.Model):
         blank=True,
         verbose_name='대표이미지'
     )
+    # 대표이미지 크기·대표색·BlurHash (저장 시 계산, 기존 데이터는 manage.py backfill_image_placeholders)
+    cover_width = models.PositiveIntegerField(null=True, editable=False)
+    cover_height = models.PositiveIntegerField(null=True, editable=False)
+    cover_color = models.CharField(max_length=7, blank=True, editable=False)
+    cover_blurhash = models.CharField(max_length=64, blank=True, editable=False)
     is_featured = models.BooleanField(default=False, verbose_name='최신앨범표시')
     views = models.IntegerField(default=0, verbose_name='조회수')
+    unique_visitors = models.IntegerField(default=0, verbose_name='순방문자')  # HyperLogLog 추정값
+    # GalleryImage 추가/삭제 시그널로 갱신 (불일치 시 manage.py repair_image_counts)
+    image_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='이미지 수')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = GalleryAlbumQuerySet.as_manager()
 
     class Meta:
         verbose_name = '갤러리 앨범'
         verbose_name_plural = '갤러리 앨범 관리'
         ordering = ['-event_date']
+        indexes = [
+            models.Index(fields=['event_date', 'id'], name='album_event_date_idx'),
+            models.Index(fields=['category', 'event_date'], name='album_category_idx'),
+            # 조건부 GET 검증값 (COUNT + MAX(updated_at), apps.core.conditional)
+            models.Index(fields=['updated_at'], name='album_updated_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.get_category_display()}] {self.title}"
 
-    @property
-    def image_count(self):
-        return self.images.count()
 
+class GalleryImageQuerySet(models.QuerySet):
+    """시그널이 발생하지 않는 대량 처리 후 앨범 image_count 재계산"""
 
-class GalleryImage(models.Model):
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        GalleryAlbum.objects.filter(pk__in={obj.album_id for obj in objs}).refresh_image_counts()
+        # post_save 대신 캐시 무효화 + 이미지 파생본 처리 예약
+        bump_model_version(GalleryImage)
+        for obj in objs:
+            if obj.pk is not None:
+                image_processor.schedule(obj)
+        return objs
+
+    def update(self, **kwargs):
+        if 'album' not in kwargs and 'album_id' not in kwargs:
+            return super().update(**kwargs)
+        album_ids = set(self.values_list('album_id', flat=True))
+        rows = super().update(**kwargs)
+        target = kwargs.get('album_id', kwargs.get('album'))
+        album_ids.add(getattr(target, 'pk', target))
+        GalleryAlbum.objects.filter(pk__in=album_ids).refresh_image_counts()
+        return rows
+
+
+class GalleryImage(ImagePlaceholderModel, ImageVariantsModel):
     """갤러리 이미지"""
+    variant_fields = ('image',)
+    placeholder_fields = {'image': ('width', 'height', 'dominant_color', 'blurhash')}
+
     album = models.ForeignKey(GalleryAlbum, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='gallery/images/%Y/%m/')
+    # 이미지 크기·대표색·BlurHash (저장 시 계산, 기존 데이터는 manage.py backfill_image_placeholders)
+    width = models.PositiveIntegerField(null=True, editable=False)
+    height = models.PositiveIntegerField(null=True, editable=False)
+    dominant_color = models.CharField(max_length=7, blank=True, editable=False)
+    blurhash = models.CharField(max_length=64, blank=True, editable=False)
     caption = models.CharField(max_length=200, blank=True, verbose_name='설명')
     order = models.IntegerField(default=0, verbose_name='정렬순서')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = GalleryImageQuerySet.as_manager()
 
     class Meta:
         verbose_name = '갤러리 이미지'
         verbose_name_plural = '갤러리 이미지'
         ordering = ['order', 'created_at']
+        indexes = [
+            # 조건부 GET 검증값 (COUNT + MAX(updated_at), apps.core.conditional)
+            models.Index(fields=['updated_at'], name='gallery_image_updated_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 앨범 이동 시 이전 앨범의 image_count 감소용
+        instance._loaded_album_id = instance.__dict__.get('album_id')
+        return instance
 
 
-class GalleryVideo(models.Model):
+class GalleryVideo(ImageVariantsModel):
     """영상 갤러리"""
+    variant_fields = ('thumbnail',)
+
     title = models.CharField(max_length=200, verbose_name='제목')
     youtube_url = models.URLField(verbose_name='YouTube 링크')
     thumbnail = models.ImageField(upload_to='gallery/videos/', blank=True, verbose_name='썸네일')
     duration = models.CharField(max_length=10, verbose_name='재생시간')
     views = models.IntegerField(default=0, verbose_name='조회수')
+    unique_visitors = models.IntegerField(default=0, verbose_name='순방문자')  # HyperLogLog 추정값
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = '영상'
         verbose_name_plural = '영상 갤러리 관리'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='video_created_idx'),
+            # 조건부 GET 검증값 (COUNT + MAX(updated_at), apps.core.conditional)
+            models.Index(fields=['updated_at'], name='video_updated_idx'),
+        ]
 
     def __str__(self):
         return self.title
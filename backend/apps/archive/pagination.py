@@ -0,0 +1,11 @@
+from django.conf import settings
+
+from apps.core.pagination import KeysetPagination
+
+
+class GalleryImagePagination(KeysetPagination):
+    """앨범 이미지 커서 페이지네이션 - (order, created_at, pk) 순서"""
+
+    @property
+    def page_size(self):
+        return getattr(settings, 'GALLERY_IMAGE_PAGE_SIZE', 40)
@@ -1,5 +1,9 @@
+from django.urls import reverse
 from rest_framework import serializers
+from apps.core.images import SrcsetField
+from apps.core.search import SNIPPET_LENGTH, SearchHighlightMixin
 from .models import Notice, News, GalleryAlbum, GalleryImage, GalleryVideo
+from .pagination import GalleryImagePagination
 
 
 class NoticeSerializer(serializers.ModelSerializer):
@@ -9,62 +13,101 @@ class NoticeSerializer(serializers.ModelSerializer):
         model = Notice
         fields = [
             'id', 'category', 'category_display', 'title', 'content',
-            'author', 'views', 'is_pinned', 'created_at'
+            'author', 'views', 'unique_visitors', 'is_pinned', 'created_at'
         ]
 
 
-class NoticeListSerializer(serializers.ModelSerializer):
+class NoticeListSerializer(SearchHighlightMixin, serializers.ModelSerializer):
     category_display = serializers.CharField(source='get_category_display', read_only=True)
 
     class Meta:
         model = Notice
         fields = [
             'id', 'category', 'category_display', 'title',
-            'author', 'views', 'is_pinned', 'created_at'
+            'author', 'views', 'unique_visitors', 'is_pinned', 'created_at', 'highlight'
         ]
+        highlight_fields = {'title': None, 'content': SNIPPET_LENGTH}
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(SearchHighlightMixin, serializers.ModelSerializer):
+    thumbnail_srcset = SrcsetField('thumbnail')
+
     class Meta:
         model = News
         fields = [
             'id', 'source', 'title', 'excerpt', 'link_url',
-            'thumbnail', 'is_featured', 'published_date'
+            'thumbnail', 'thumbnail_srcset', 'is_featured', 'published_date', 'highlight'
         ]
+        highlight_fields = {'title': None, 'excerpt': SNIPPET_LENGTH}
 
 
 class GalleryImageSerializer(serializers.ModelSerializer):
+    image_srcset = SrcsetField('image')
+
     class Meta:
         model = GalleryImage
-        fields = ['id', 'image', 'caption', 'order']
+        fields = [
+            'id', 'image', 'image_srcset', 'width', 'height', 'dominant_color', 'blurhash',
+            'caption', 'order'
+        ]
+
+
+class ImageCountMixin:
+    """with_live_image_count()로 집계한 값이 있으면 우선 사용"""
 
+    def get_image_count(self, obj):
+        return getattr(obj, 'num_images', obj.image_count)
 
-class GalleryAlbumSerializer(serializers.ModelSerializer):
+
+class GalleryAlbumSerializer(ImageCountMixin, serializers.ModelSerializer):
     category_display = serializers.CharField(source='get_category_display', read_only=True)
-    image_count = serializers.IntegerField(read_only=True)
+    image_count = serializers.SerializerMethodField()
+    cover_image_srcset = SrcsetField('cover_image')
 
     class Meta:
         model = GalleryAlbum
         fields = [
             'id', 'category', 'category_display', 'title', 'description',
-            'event_date', 'cover_image', 'is_featured', 'views', 'image_count'
+            'event_date', 'cover_image', 'cover_image_srcset', 'cover_width', 'cover_height',
+            'cover_color', 'cover_blurhash', 'is_featured', 'views', 'unique_visitors', 'image_count'
         ]
 
 
-class GalleryAlbumDetailSerializer(serializers.ModelSerializer):
+class GalleryAlbumDetailSerializer(ImageCountMixin, serializers.ModelSerializer):
+    """
+    앨범 상세 - 이미지는 첫 페이지만 포함
+    images_next: 다음 페이지 URL (이미지 목록 API 커서, 마지막 페이지면 null)
+    """
     category_display = serializers.CharField(source='get_category_display', read_only=True)
-    images = GalleryImageSerializer(many=True, read_only=True)
-    image_count = serializers.IntegerField(read_only=True)
+    image_count = serializers.SerializerMethodField()
+    cover_image_srcset = SrcsetField('cover_image')
 
     class Meta:
         model = GalleryAlbum
         fields = [
             'id', 'category', 'category_display', 'title', 'description',
-            'event_date', 'cover_image', 'is_featured', 'views', 'image_count', 'images'
+            'event_date', 'cover_image', 'cover_image_srcset', 'cover_width', 'cover_height',
+            'cover_color', 'cover_blurhash', 'is_featured', 'views', 'unique_visitors', 'image_count'
         ]
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        paginator = GalleryImagePagination()
+        page = paginator.first_page(
+            instance.images.all(), self.context['request'],
+            reverse('gallery-album-images', kwargs={'pk': instance.pk})
+        )
+        data['images'] = GalleryImageSerializer(page, many=True, context=self.context).data
+        data['images_next'] = paginator.get_next_link()
+        return data
+
 
 class GalleryVideoSerializer(serializers.ModelSerializer):
+    thumbnail_srcset = SrcsetField('thumbnail')
+
     class Meta:
         model = GalleryVideo
-        fields = ['id', 'title', 'youtube_url', 'thumbnail', 'duration', 'views', 'created_at']
+        fields = [
+            'id', 'title', 'youtube_url', 'thumbnail', 'thumbnail_srcset', 'duration',
+            'views', 'unique_visitors', 'created_at'
+        ]
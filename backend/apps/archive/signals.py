@@ -0,0 +1,54 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.core.cache import bump_version_on_change
+from apps.core.images import delete_variants_on_delete, process_images_on_save
+from apps.core.search import remove_search_index, update_search_index
+from .models import GalleryAlbum, GalleryImage, GalleryVideo, News, Notice
+
+
+@receiver(post_save, sender=GalleryImage)
+def increment_album_image_count(sender, instance, created, raw=False, **kwargs):
+    """이미지 추가/앨범 이동 시 image_count 갱신"""
+    if raw:
+        return
+    old_album_id = getattr(instance, '_loaded_album_id', None)
+    if created:
+        GalleryAlbum.objects.filter(pk=instance.album_id).update(image_count=F('image_count') + 1)
+    elif old_album_id is not None and old_album_id != instance.album_id:
+        GalleryAlbum.objects.filter(pk=old_album_id).update(image_count=F('image_count') - 1)
+        GalleryAlbum.objects.filter(pk=instance.album_id).update(image_count=F('image_count') + 1)
+    instance._loaded_album_id = instance.album_id
+
+
+@receiver(post_delete, sender=GalleryImage)
+def decrement_album_image_count(sender, instance, **kwargs):
+    """이미지 삭제 시 image_count 감소 (앨범째 삭제되는 경우 UPDATE 대상 없음)"""
+    GalleryAlbum.objects.filter(pk=instance.album_id, image_count__gt=0).update(
+        image_count=F('image_count') - 1
+    )
+
+
+@receiver(post_save, sender=Notice)
+@receiver(post_save, sender=News)
+def update_search_document_index(sender, instance, **kwargs):
+    """SQLite 개발 환경의 FTS5 색인 갱신 (PostgreSQL은 생성 컬럼이 자동 갱신)"""
+    update_search_index(instance)
+
+
+@receiver(post_delete, sender=Notice)
+@receiver(post_delete, sender=News)
+def remove_search_document_index(sender, instance, **kwargs):
+    remove_search_index(instance)
+
+
+# 목록 응답 캐시 무효화 (apps.core.cache)
+for model in (Notice, News, GalleryAlbum, GalleryImage, GalleryVideo):
+    post_save.connect(bump_version_on_change, sender=model, dispatch_uid=f'cache-version-save-{model.__name__}')
+    post_delete.connect(bump_version_on_change, sender=model, dispatch_uid=f'cache-version-delete-{model.__name__}')
+
+
+# 업로드 이미지 WebP/AVIF 파생본 (apps.core.images)
+for model in (News, GalleryAlbum, GalleryImage, GalleryVideo):
+    post_save.connect(process_images_on_save, sender=model, dispatch_uid=f'image-variants-save-{model.__name__}')
+    post_delete.connect(delete_variants_on_delete, sender=model, dispatch_uid=f'image-variants-delete-{model.__name__}')
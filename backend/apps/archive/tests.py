@@ -0,0 +1,153 @@
+"""
+자료실 목록 API 테스트
+
+    python manage.py test apps.archive
+"""
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.core.search import rebuild_search_index
+
+from .models import GalleryAlbum, GalleryImage, Notice
+
+
+class CachedConditionalListTests(TestCase):
+    """비로그인 목록 - 응답 캐시 적중이면 조건부 요청(ETag)까지 DB 조회 없음"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Notice.objects.bulk_create([
+            Notice(category='general', title=f'공지 {i}', content='내용', author='사무국') for i in range(3)
+        ])
+        GalleryAlbum.objects.create(title='앨범', category='meeting', event_date=date(2026, 5, 1))
+
+    def setUp(self):
+        cache.clear()
+
+    def fill(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        return response['ETag']
+
+    def test_cache_hit_without_queries(self):
+        etag = self.fill('/api/v1/archive/notices/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/archive/notices/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(len(response.json()['results']), 3)
+
+    def test_not_modified_without_queries(self):
+        etag = self.fill('/api/v1/archive/notices/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/archive/notices/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_multiple_cache_models(self):
+        etag = self.fill('/api/v1/archive/gallery/albums/')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/api/v1/archive/gallery/albums/').status_code, 200)
+            response = self.client.get('/api/v1/archive/gallery/albums/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_change_invalidates_cached_validators(self):
+        etag = self.fill('/api/v1/archive/notices/')
+        with self.captureOnCommitCallbacks(execute=True):
+            Notice.objects.create(category='general', title='새 공지', content='내용', author='사무국')
+        response = self.client.get('/api/v1/archive/notices/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len(response.json()['results']), 4)
+
+    def test_uncached_request_uses_database_validators(self):
+        # 응답 캐시를 쓰지 않는 요청은 DB 집계 한 번으로 같은 ETag 확인 (본문 조회 없이 304)
+        etag = self.fill('/api/v1/archive/notices/')
+        with override_settings(API_RESPONSE_CACHE=False), self.assertNumQueries(1):
+            response = self.client.get('/api/v1/archive/notices/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+
+class RankedSearchPaginationTests(TestCase):
+    """관련도순 검색 - 같은/비슷한 관련도가 페이지 경계에 걸쳐도 빠지거나 중복되지 않음"""
+
+    @classmethod
+    def setUpTestData(cls):
+        notices = [
+            # 같은 관련도 15건 + 본문 길이만 조금씩 다른(비슷한 관련도) 15건 + 검색되지 않는 5건
+            Notice(category='general', title='정기 총회 안내', content='총회 일정', author='사무국')
+            for _ in range(15)
+        ] + [
+            Notice(category='general', title='정기 총회 안내', content='총회 일정' + ' 참고' * i, author='사무국')
+            for i in range(1, 16)
+        ] + [
+            Notice(category='general', title='웅변대회 공고', content='접수 안내', author='사무국') for _ in range(5)
+        ]
+        for notice in notices:
+            notice.save()
+        rebuild_search_index(Notice)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_pages_cover_every_match_once(self):
+        data = self.client.get('/api/v1/archive/notices/', {'search': '총회'}).json()
+        ids = []
+        while True:
+            self.assertIn('count', data)  # 관련도순은 커서 대신 페이지 번호
+            ids.extend(item['id'] for item in data['results'])
+            if not data['next']:
+                break
+            data = self.client.get(data['next']).json()
+        self.assertEqual(len(ids), 30)
+        self.assertEqual(len(set(ids)), 30)
+        self.assertEqual(set(ids), set(Notice.objects.filter(title='정기 총회 안내').values_list('pk', flat=True)))
+
+    def test_rank_is_not_a_cursor_key(self):
+        data = self.client.get('/api/v1/archive/notices/', {'search': '총회'}).json()
+        self.assertNotIn('cursor=', data['next'])
+        self.assertIn('page=2', data['next'])
+
+
+class GalleryImageListTests(TestCase):
+    """앨범 이미지 목록 API"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.album = GalleryAlbum.objects.create(title='앨범', category='meeting', event_date=date(2026, 5, 1))
+        GalleryImage.objects.bulk_create([
+            GalleryImage(album=cls.album, image=f'gallery/images/2026/05/{i}.jpg', order=i) for i in range(3)
+        ])
+        cls.empty_album = GalleryAlbum.objects.create(title='빈 앨범', category='meeting', event_date=date(2026, 5, 2))
+
+    def setUp(self):
+        cache.clear()
+
+    def test_missing_album(self):
+        response = self.client.get('/api/v1/archive/gallery/albums/999999/images/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_empty_album(self):
+        response = self.client.get(f'/api/v1/archive/gallery/albums/{self.empty_album.pk}/images/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [])
+
+    def test_deleted_album_is_not_served_from_cache(self):
+        url = f'/api/v1/archive/gallery/albums/{self.empty_album.pk}/images/'
+        self.assertEqual(self.client.get(url).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.empty_album.delete()
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    @override_settings(GALLERY_IMAGE_PAGE_SIZE=2)
+    def test_page_size_setting(self):
+        data = self.client.get(f'/api/v1/archive/gallery/albums/{self.album.pk}/images/').json()
+        self.assertEqual(len(data['results']), 2)
+        data = self.client.get(data['next']).json()
+        self.assertEqual(len(data['results']), 1)
+        self.assertIsNone(data['next'])
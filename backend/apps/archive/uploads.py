@@ -0,0 +1,178 @@
+"""
+갤러리 앨범 사진 일괄 업로드 (관리자 액션 / API 공용)
+
+1. 이미지 파일과 ZIP을 받아 항목을 하나씩 스토리지에 저장
+   (ZIP은 항목 단위로 풀면서 저장하므로 압축 파일 전체를 메모리에 올리지 않음)
+2. 프로세스 풀에서 이미지를 디코딩해 검증하고 크기·대표색·BlurHash·EXIF 촬영일 확인 (손상 파일은 삭제 후 제외)
+3. 촬영일 순서로 GalleryImage bulk_create - 기존 사진 뒤에 이어서 정렬순서 부여
+   (image_count 재계산·캐시 무효화·파생본 예약은 GalleryImageQuerySet.bulk_create에서 처리)
+4. 대표 이미지가 없는 앨범은 첫 사진을 복사해 대표 이미지로 지정
+"""
+import os
+import zipfile
+
+from django.conf import settings
+from django.core.files.base import File
+from django.db import transaction
+from django.db.models import Max
+
+from apps.core.images import inspect_image
+from apps.core.processes import process_pool
+from .models import GalleryImage
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+ZIP_UTF8_FLAG = 0x800
+
+
+class BulkUploadError(Exception):
+    """업로드 전체를 처리할 수 없음 (파일 수 초과 등)"""
+
+
+def zip_entry_name(info):
+    """ZIP 항목 이름 - UTF-8 표시가 없으면 한국어 Windows 압축(CP949)으로 해석"""
+    if info.flag_bits & ZIP_UTF8_FLAG:
+        return info.filename
+    try:
+        return info.filename.encode('cp437').decode('cp949')
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return info.filename
+
+
+class BulkImageUpload:
+    """앨범 하나에 대한 일괄 업로드 - run() 결과: (생성된 GalleryImage 목록, [(파일명, 사유)])"""
+
+    def __init__(self, album, files):
+        self.album = album
+        self.files = files
+        self.field = GalleryImage._meta.get_field('image')
+        self.max_files = getattr(settings, 'GALLERY_BULK_UPLOAD_MAX_FILES', 1000)
+        self.max_file_size = getattr(settings, 'GALLERY_BULK_UPLOAD_MAX_FILE_SIZE', 30 * 1024 * 1024)
+        self.stored = []  # (저장 경로, 원래 파일명)
+        self.skipped = []
+        self.cover = None  # 복사한 대표이미지 경로 (실패 시 함께 삭제)
+
+    def run(self):
+        try:
+            self.store_files()
+            inspected = self.inspect()
+            with transaction.atomic():
+                images = self.create_images(inspected)
+                self.ensure_cover(images)
+        except BaseException:
+            self.delete_stored()
+            raise
+        return images, self.skipped
+
+    def store_files(self):
+        for upload in self.files:
+            if os.path.splitext(upload.name)[1].lower() == '.zip':
+                self.store_zip(upload)
+            elif self.accept(upload.name, upload.size):
+                self.store(upload.name, upload)
+
+    def store_zip(self, upload):
+        try:
+            archive = zipfile.ZipFile(upload)
+        except zipfile.BadZipFile:
+            self.skipped.append((upload.name, 'ZIP 파일을 열 수 없습니다.'))
+            return
+        with archive:
+            for info in archive.infolist():
+                name = zip_entry_name(info)
+                base = os.path.basename(name)
+                # 폴더, macOS 메타데이터(__MACOSX/._*), 숨김 파일 제외
+                if info.is_dir() or not base or base.startswith('.') or name.startswith('__MACOSX/'):
+                    continue
+                if not self.accept(name, info.file_size):
+                    continue
+                with archive.open(info) as entry:
+                    content = File(entry, name=base)
+                    content.size = info.file_size
+                    self.store(name, content)
+
+    def accept(self, name, size):
+        if os.path.splitext(name)[1].lower() not in IMAGE_EXTENSIONS:
+            self.skipped.append((name, '이미지 파일이 아닙니다.'))
+            return False
+        if size > self.max_file_size:
+            self.skipped.append((name, f'파일 크기는 {self.max_file_size // (1024 * 1024)}MB를 초과할 수 없습니다.'))
+            return False
+        if len(self.stored) >= self.max_files:
+            raise BulkUploadError(f'한 번에 {self.max_files}장까지 업로드할 수 있습니다.')
+        return True
+
+    def store(self, name, content):
+        path = self.field.generate_filename(None, os.path.basename(name))
+        self.stored.append((self.field.storage.save(path, content), name))
+
+    def inspect(self):
+        """디코딩 검증 결과 [(검사 결과, 원래 파일명)] - 실패한 파일은 삭제하고 skipped에 기록"""
+        workers = getattr(settings, 'GALLERY_BULK_UPLOAD_WORKERS', None) or os.cpu_count() or 1
+        if workers <= 1 or len(self.stored) <= 1:
+            outcomes = [self.inspect_inline(path) for path, _ in self.stored]
+        else:
+            with process_pool(min(workers, len(self.stored))) as pool:
+                futures = [pool.submit(inspect_image, path) for path, _ in self.stored]
+                outcomes = [self.result(future) for future in futures]
+
+        inspected = []
+        for (path, name), outcome in zip(self.stored, outcomes):
+            if isinstance(outcome, Exception):
+                self.field.storage.delete(path)
+                self.skipped.append((name, f'이미지를 읽을 수 없습니다. ({outcome.__class__.__name__})'))
+            else:
+                inspected.append((outcome, name))
+        self.stored = [(info['source'], name) for info, name in inspected]
+        return inspected
+
+    def inspect_inline(self, path):
+        try:
+            return inspect_image(path, self.field.storage)
+        except Exception as exc:
+            return exc
+
+    def result(self, future):
+        try:
+            return future.result()
+        except Exception as exc:
+            return exc
+
+    def create_images(self, inspected):
+        # 촬영일 순서 (촬영일이 없는 사진은 뒤에 파일명 순서로)
+        inspected.sort(key=lambda item: (item[0]['taken_at'] is None, item[0]['taken_at'] or '', item[1]))
+        last = self.album.images.aggregate(last=Max('order'))['last']
+        start = 0 if last is None else last + 1
+        return GalleryImage.objects.bulk_create([
+            GalleryImage(
+                album=self.album, image=info['source'], order=start + index,
+                width=info['width'], height=info['height'],
+                dominant_color=info['color'], blurhash=info['blurhash'],
+            )
+            for index, (info, _) in enumerate(inspected)
+        ])
+
+    def ensure_cover(self, images):
+        if self.album.cover_image or not images:
+            return
+        # 파생본이 원본 경로 기준이라 같은 파일을 공유하지 않도록 복사
+        source = images[0].image
+        with source.storage.open(source.name, 'rb') as file:
+            self.album.cover_image.save(os.path.basename(source.name), File(file), save=False)
+        self.cover = self.album.cover_image.name
+        first = images[0]
+        self.album.cover_width, self.album.cover_height = first.width, first.height
+        self.album.cover_color, self.album.cover_blurhash = first.dominant_color, first.blurhash
+        self.album.save(update_fields=['cover_image', 'cover_width', 'cover_height', 'cover_color', 'cover_blurhash'])
+
+    def delete_stored(self):
+        for path, _ in self.stored:
+            self.field.storage.delete(path)
+        if self.cover:
+            # 앨범 저장 또는 커밋이 실패해 대표이미지로 기록되지 않은 복사본
+            self.album.cover_image.storage.delete(self.cover)
+            self.album.cover_image = ''
+
+
+def bulk_upload_images(album, files):
+    """이미지/ZIP 파일 목록을 앨범에 추가 - (생성된 GalleryImage 목록, [(파일명, 사유)])"""
+    return BulkImageUpload(album, files).run()
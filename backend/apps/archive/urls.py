@@ -1,7 +1,8 @@
 from django.urls import path
 from .views import (
     NoticeListView, NoticeDetailView, NewsListView,
-    GalleryAlbumListView, GalleryAlbumDetailView, GalleryVideoListView
+    GalleryAlbumListView, GalleryAlbumDetailView, GalleryImageListView, GalleryAlbumUploadView,
+    GalleryAlbumDownloadView, GalleryVideoListView, GalleryVideoDetailView
 )
 
 urlpatterns = [
@@ -10,5 +11,9 @@ urlpatterns = [
     path('news/', NewsListView.as_view(), name='news-list'),
     path('gallery/albums/', GalleryAlbumListView.as_view(), name='gallery-album-list'),
     path('gallery/albums/<int:pk>/', GalleryAlbumDetailView.as_view(), name='gallery-album-detail'),
+    path('gallery/albums/<int:pk>/images/', GalleryImageListView.as_view(), name='gallery-album-images'),
+    path('gallery/albums/<int:pk>/upload/', GalleryAlbumUploadView.as_view(), name='gallery-album-upload'),
+    path('gallery/albums/<int:pk>/download.zip', GalleryAlbumDownloadView.as_view(), name='gallery-album-download'),
     path('gallery/videos/', GalleryVideoListView.as_view(), name='gallery-video-list'),
+    path('gallery/videos/<int:pk>/', GalleryVideoDetailView.as_view(), name='gallery-video-detail'),
 ]
@@ -1,43 +1,80 @@
-from rest_framework import generics
-from rest_framework.permissions import AllowAny
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.http import content_disposition_header
+from rest_framework import generics, status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import AllowAny, IsAdminUser
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter
-from .models import Notice, News, GalleryAlbum, GalleryVideo
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from apps.accounts.permissions import BoardReadPermission
+from apps.core.cache import CachedListMixin
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.counters import view_counter, visitor_key
+from apps.core.search import RankedSearchFilter
+from apps.core.views import AsyncListAPIView
+from apps.core.zipstream import StoredZipStream, ZipEntry
+from apps.frontend.sendfile import if_range_matches, parse_range
+from .models import Notice, News, GalleryAlbum, GalleryImage, GalleryVideo
+from .pagination import GalleryImagePagination
+from .uploads import BulkUploadError, bulk_upload_images
 from .serializers import (
     NoticeSerializer, NoticeListSerializer, NewsSerializer,
-    GalleryAlbumSerializer, GalleryAlbumDetailSerializer, GalleryVideoSerializer
+    GalleryAlbumSerializer, GalleryAlbumDetailSerializer, GalleryImageSerializer, GalleryVideoSerializer
 )
 
 
-class NoticeListView(generics.ListAPIView):
+class CountedRetrieveAPIView(ConditionalGetMixin, generics.RetrieveAPIView):
+    """
+    조회수/순방문자를 집계하는 상세 API
+    - 304(변경 없음) 응답도 조회로 집계
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_get(self.count_and_retrieve, request, *args, **kwargs)
+
+    def count_and_retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        view_counter.increment(instance, visitor=visitor_key(request))
+        # 아직 DB에 반영되지 않은 조회수까지 포함해서 응답
+        instance.views += view_counter.pending(instance)
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+    def not_modified(self, request, *args, **kwargs):
+        # 같은 버전의 상세를 이미 받은 요청이므로 객체가 존재함 - 조회 없이 pk만으로 집계
+        model = self.get_queryset().model
+        instance = model(pk=model._meta.pk.to_python(kwargs[self.lookup_url_kwarg or self.lookup_field]))
+        view_counter.increment(instance, visitor=visitor_key(request))
+
+
+class NoticeListView(ConditionalGetMixin, CachedListMixin, AsyncListAPIView):
     """공지사항 목록"""
     queryset = Notice.objects.all()
     serializer_class = NoticeListSerializer
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, SearchFilter]
+    filter_backends = [DjangoFilterBackend, RankedSearchFilter]
     filterset_fields = ['category', 'is_pinned']
     search_fields = ['title', 'content']
 
 
-class NoticeDetailView(generics.RetrieveAPIView):
+class NoticeDetailView(CountedRetrieveAPIView):
     """공지사항 상세"""
     queryset = Notice.objects.all()
     serializer_class = NoticeSerializer
     permission_classes = [AllowAny]
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.views += 1
-        instance.save(update_fields=['views'])
-        return super().retrieve(request, *args, **kwargs)
-
 
-class NewsListView(generics.ListAPIView):
+class NewsListView(ConditionalGetMixin, CachedListMixin, AsyncListAPIView):
     """보도자료 목록"""
     queryset = News.objects.all()
     serializer_class = NewsSerializer
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, SearchFilter]
+    filter_backends = [DjangoFilterBackend, RankedSearchFilter]
     filterset_fields = ['is_featured', 'source']
     search_fields = ['title', 'excerpt']
 
@@ -49,30 +86,147 @@ class NewsListView(generics.ListAPIView):
         return queryset
 
 
-class GalleryAlbumListView(generics.ListAPIView):
+class GalleryAlbumListView(ConditionalGetMixin, CachedListMixin, AsyncListAPIView):
     """갤러리 앨범 목록"""
     queryset = GalleryAlbum.objects.all()
+    cache_models = (GalleryAlbum, GalleryImage)
     serializer_class = GalleryAlbumSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category', 'is_featured']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if settings.GALLERY_LIVE_IMAGE_COUNT:
+            # 저장된 image_count 대신 COUNT 집계 (annotate 시 Meta.ordering이 빠지므로 재지정)
+            queryset = queryset.with_live_image_count().order_by(*GalleryAlbum._meta.ordering)
+        return queryset
+
 
-class GalleryAlbumDetailView(generics.RetrieveAPIView):
-    """갤러리 앨범 상세 (이미지 포함)"""
-    queryset = GalleryAlbum.objects.prefetch_related('images')
+class GalleryAlbumDetailView(CountedRetrieveAPIView):
+    """갤러리 앨범 상세 (이미지 첫 페이지 + 다음 페이지 커서)"""
+    queryset = GalleryAlbum.objects.all()
     serializer_class = GalleryAlbumDetailSerializer
+    conditional_models = (GalleryAlbum, GalleryImage)
     permission_classes = [AllowAny]
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.views += 1
-        instance.save(update_fields=['views'])
-        return super().retrieve(request, *args, **kwargs)
 
+class GalleryImageListView(ConditionalGetMixin, CachedListMixin, AsyncListAPIView):
+    """앨범 이미지 목록 (커서 페이지네이션 - 상세 API의 images_next부터 이어서 조회)"""
+    cache_models = (GalleryAlbum, GalleryImage)  # 앨범 삭제 시 캐시된 목록도 무효화 (이미지 없는 앨범 포함)
+    serializer_class = GalleryImageSerializer
+    pagination_class = GalleryImagePagination
+    permission_classes = [AllowAny]
+
+    def get_queryset(self):
+        # 없는 앨범은 빈 목록 대신 404 (캐시 적중 시에는 목록을 만들지 않으므로 조회하지 않음)
+        album = get_object_or_404(GalleryAlbum.objects.only('pk'), pk=self.kwargs['pk'])
+        return GalleryImage.objects.filter(album=album)
+
+
+class GalleryAlbumUploadView(APIView):
+    """
+    앨범 사진 일괄 업로드 API (관리자 전용)
+    - files: 이미지 파일 또는 ZIP (여러 개 가능), 촬영일 순서로 기존 사진 뒤에 추가
+    """
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, pk):
+        album = get_object_or_404(GalleryAlbum, pk=pk)
+        files = request.FILES.getlist('files')
+        if not files:
+            return Response(
+                {'detail': '업로드할 파일을 선택해주세요.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            images, skipped = bulk_upload_images(album, files)
+        except BulkUploadError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        album.refresh_from_db(fields=['image_count', 'cover_image'])
+        return Response({
+            'message': f'{len(images)}장을 업로드했습니다.',
+            'created': len(images),
+            'image_count': album.image_count,
+            'skipped': [{'name': name, 'reason': reason} for name, reason in skipped],
+        }, status=status.HTTP_201_CREATED if images else status.HTTP_400_BAD_REQUEST)
+
+
+class GalleryAlbumDownloadView(APIView):
+    """
+    앨범 전체 사진 ZIP 다운로드 (무압축 스트리밍, Range 이어받기 지원)
+    - 항목 순서/이름은 정렬순서 기준으로 고정: 001_파일명.jpg ...
+    - GALLERY_DOWNLOAD_BOARD 게시판 읽기 권한 확인 (None이면 공개)
+    """
+    permission_classes = [BoardReadPermission]
+
+    @property
+    def board_type(self):
+        return getattr(settings, 'GALLERY_DOWNLOAD_BOARD', None)
+
+    def perform_content_negotiation(self, request, force=False):
+        # 응답은 항상 ZIP - Accept 헤더가 맞지 않아도 406 대신 기본 렌더러(오류 응답용) 사용
+        return super().perform_content_negotiation(request, force=True)
 
-class GalleryVideoListView(generics.ListAPIView):
+    def get(self, request, pk):
+        album = get_object_or_404(GalleryAlbum, pk=pk)
+        archive = StoredZipStream(self.get_entries(album), GalleryImage._meta.get_field('image').storage)
+        etag = archive.etag
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            response = HttpResponse(status=304)
+            response['ETag'] = etag
+            return response
+
+        byte_range = None
+        if 'HTTP_RANGE' in request.META and if_range_matches(request, etag, None):
+            byte_range = parse_range(request.META['HTTP_RANGE'], archive.size)
+
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{archive.size}'
+            return response
+        if byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(archive.stream(start, end), status=206, content_type='application/zip')
+            response['Content-Range'] = f'bytes {start}-{end}/{archive.size}'
+        else:
+            start, end = 0, archive.size - 1
+            response = StreamingHttpResponse(archive.stream(), content_type='application/zip')
+        response['Content-Length'] = str(end - start + 1)
+        response['Accept-Ranges'] = 'bytes'
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        response['Content-Disposition'] = content_disposition_header(True, f'{album.title}.zip')
+        return response
+
+    def get_entries(self, album):
+        """저장소에 있는 사진만 (없는 파일은 제외) - 같은 상태면 항상 같은 목록"""
+        storage = GalleryImage._meta.get_field('image').storage
+        rows = list(album.images.order_by('order', 'created_at', 'pk').values_list('image', 'created_at'))
+        width = max(len(str(len(rows))), 3)
+        entries = []
+        for index, (name, created_at) in enumerate(rows, 1):
+            try:
+                size = storage.size(name)
+            except OSError:
+                continue
+            arcname = f'{index:0{width}d}_{os.path.basename(name)}'
+            entries.append(ZipEntry(arcname, name, size, timezone.localtime(created_at)))
+        return entries
+
+
+class GalleryVideoListView(ConditionalGetMixin, CachedListMixin, AsyncListAPIView):
     """영상 목록"""
     queryset = GalleryVideo.objects.all()
     serializer_class = GalleryVideoSerializer
     permission_classes = [AllowAny]
+
+
+class GalleryVideoDetailView(CountedRetrieveAPIView):
+    """영상 상세 (조회수 증가)"""
+    queryset = GalleryVideo.objects.all()
+    serializer_class = GalleryVideoSerializer
+    permission_classes = [AllowAny]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contest', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contestapplication',
+            index=models.Index(fields=['email', 'contact_parent', 'created_at'], name='contest_applicant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contestapplication',
+            index=models.Index(fields=['contest_year', 'status'], name='contest_year_status_idx'),
+        ),
+    ]
@@ -81,6 +81,11 @@ class ContestApplication(models.Model):
         verbose_name = '웅변대회 신청서'
         verbose_name_plural = '웅변대회 신청서 관리'
         ordering = ['-created_at']
+        indexes = [
+            # 내 신청 조회 (MyApplicationView)
+            models.Index(fields=['email', 'contact_parent', 'created_at'], name='contest_applicant_idx'),
+            models.Index(fields=['contest_year', 'status'], name='contest_year_status_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.contest_year}] {self.name} - {self.get_division_display()}"
@@ -0,0 +1,4 @@
+def can_download_script(request, path):
+    """웅변 원고 파일은 관리자(운영진)만 다운로드 가능"""
+    user = request.user
+    return user.is_authenticated and (user.is_staff or user.is_superuser)
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.core'
+    verbose_name = '공통'
+
+    def ready(self):
+        from .cache import check_shared_cache
+
+        check_shared_cache()
@@ -0,0 +1,184 @@
+"""
+모델 버전 기반 응답 캐시
+
+모델마다 버전 번호를 캐시에 두고, 저장/삭제 시그널에서 버전을 올린다.
+응답 캐시 키에 관련 모델들의 버전이 들어가므로 내용이 바뀌면 이전 캐시는 더 이상 조회되지 않는다
+(삭제할 필요 없이 만료 시간이 지나면 사라짐).
+- 버전은 트랜잭션 커밋 후에 올림 (커밋 전 내용이 새 버전 키로 캐시되지 않도록)
+- 여러 워커가 같은 버전을 보려면 공유 캐시(REDIS_URL)가 필요 -
+  APP_WORKERS가 2 이상인데 프로세스별 캐시(LocMemCache 등)면 시작 시 오류 (check_shared_cache)
+"""
+import hashlib
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from rest_framework.response import Response
+
+VERSION_KEY = 'model-version:{}'
+MODIFIED_KEY = 'model-modified:{}'
+
+# 프로세스마다 따로 저장되는 캐시 - 워커 간에 버전/토큰 무효화 기록이 공유되지 않음
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def cache_is_shared(alias='default'):
+    return settings.CACHES[alias]['BACKEND'] not in PROCESS_LOCAL_BACKENDS
+
+
+def check_shared_cache():
+    """워커가 여러 개인데 캐시가 프로세스별이면 ImproperlyConfigured (CoreConfig.ready에서 호출)"""
+    workers = getattr(settings, 'APP_WORKERS', 1)
+    if workers > 1 and not cache_is_shared():
+        raise ImproperlyConfigured(
+            f'워커 {workers}개가 캐시를 공유하지 않습니다 ({settings.CACHES["default"]["BACKEND"]}). '
+            'REDIS_URL로 공유 캐시를 지정하거나 워커를 1개로 실행하세요.'
+        )
+
+
+def version_key(model):
+    return VERSION_KEY.format(model._meta.label_lower)
+
+
+def modified_key(model):
+    return MODIFIED_KEY.format(model._meta.label_lower)
+
+
+def bump_model_version(model, using=None):
+    """모델 내용 변경 - 해당 모델을 쓰는 응답 캐시 무효화 (트랜잭션 안이면 커밋 후, 롤백되면 생략)"""
+    transaction.on_commit(partial(_bump_model_version, model), using=using)
+
+
+def _bump_model_version(model):
+    key = version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # 버전이 없으면 현재 시각으로 시작 (캐시 재시작 후에도 이전 키와 겹치지 않음)
+        cache.set(key, int(time.time() * 1000), None)
+    cache.set(modified_key(model), time.time(), None)
+
+
+def bump_version_on_change(sender, **kwargs):
+    """post_save / post_delete 수신 함수"""
+    bump_model_version(sender, using=kwargs.get('using'))
+
+
+def get_model_versions(models):
+    keys = [version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            versions[key] = int(time.time() * 1000)
+            if not cache.add(key, versions[key], None):
+                versions[key] = cache.get(key, versions[key])
+    return [versions[key] for key in keys]
+
+
+async def aget_model_versions(models):
+    keys = [version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            versions[key] = int(time.time() * 1000)
+            if not await cache.aadd(key, versions[key], None):
+                versions[key] = await cache.aget(key, versions[key])
+    return [versions[key] for key in keys]
+
+
+def get_last_modified(models):
+    """모델들의 마지막 변경 시각 (timestamp, 기록이 없으면 None)"""
+    times = cache.get_many([modified_key(model) for model in models])
+    if len(times) < len(models):
+        return None
+    return max(times.values())
+
+
+async def aget_last_modified(models):
+    times = await cache.aget_many([modified_key(model) for model in models])
+    if len(times) < len(models):
+        return None
+    return max(times.values())
+
+
+class CachedListMixin:
+    """
+    비로그인 GET 목록 응답 캐시 (ListAPIView / AsyncListAPIView)
+    - cache_models: 응답 내용이 의존하는 모델 (하나라도 바뀌면 캐시 무효)
+    - 캐시 키: 전체 URL(필터·검색·페이지 파라미터 포함) + 모델 버전
+    - cache_timeout: 시간에 따라 결과가 바뀌는 목록(노출 기간 등)은 짧게 지정
+    - 저장 항목: {'data': 응답 데이터, 'validators': 채울 때의 (ETag, Last-Modified) - ConditionalGetMixin}
+      → 캐시 적중이면 검증값도 캐시에서 가져오므로 조건부 요청(304)까지 DB 조회 없음
+    """
+    cache_models = ()
+    cache_timeout = None
+
+    def get_cache_models(self):
+        return self.cache_models or (self.get_queryset().model,)
+
+    def get_cache_timeout(self):
+        if self.cache_timeout is not None:
+            return self.cache_timeout
+        return getattr(settings, 'API_CACHE_TIMEOUT', 60 * 60)
+
+    def use_response_cache(self, request):
+        if not getattr(settings, 'API_RESPONSE_CACHE', True):
+            return False
+        return request.method == 'GET' and not request.user.is_authenticated
+
+    def get_response_cache_key(self, request, versions):
+        params = sorted(request.query_params.lists())
+        raw = f'{request.build_absolute_uri(request.path)}?{params}|{request.accepted_media_type}'
+        digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+        return f'list-response:{digest}:' + '.'.join(str(v) for v in versions)
+
+    def get_cached_entry(self, request):
+        """(캐시 키, 저장 항목 또는 None) - 요청마다 한 번만 조회"""
+        if not hasattr(self, '_cached_entry'):
+            key = self.get_response_cache_key(request, get_model_versions(self.get_cache_models()))
+            self._cached_entry = (key, cache.get(key))
+        return self._cached_entry
+
+    async def aget_cached_entry(self, request):
+        if not hasattr(self, '_cached_entry'):
+            key = self.get_response_cache_key(request, await aget_model_versions(self.get_cache_models()))
+            self._cached_entry = (key, await cache.aget(key))
+        return self._cached_entry
+
+    def make_cache_entry(self, response):
+        return {'data': response.data, 'validators': getattr(self, 'response_validators', None)}
+
+    def cached_response(self, entry):
+        response = Response(entry['data'])
+        response['X-Cache'] = 'HIT'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_response_cache(request):
+            return super().list(request, *args, **kwargs)
+        key, entry = self.get_cached_entry(request)
+        if entry is not None:
+            return self.cached_response(entry)
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, self.make_cache_entry(response), self.get_cache_timeout())
+            response['X-Cache'] = 'MISS'
+        return response
+
+    async def alist(self, request, *args, **kwargs):
+        if not self.use_response_cache(request):
+            return await super().alist(request, *args, **kwargs)
+        key, entry = await self.aget_cached_entry(request)
+        if entry is not None:
+            return self.cached_response(entry)
+        response = await super().alist(request, *args, **kwargs)
+        if response.status_code == 200:
+            await cache.aset(key, self.make_cache_entry(response), self.get_cache_timeout())
+            response['X-Cache'] = 'MISS'
+        return response
@@ -0,0 +1,144 @@
+"""
+조건부 GET (ETag / Last-Modified)
+
+쿼리셋·serializer를 실행하기 전에 가벼운 검증값만 계산해서
+If-None-Match / If-Modified-Since와 일치하면 304로 응답한다.
+기본 검증값은 요청 URL + 관련 모델별 DB 집계(COUNT, MAX(updated_at) - updated_at 인덱스 사용)
++ 모델 버전(apps.core.cache)이며 뷰에서 get_validators()를 재정의해 바꿀 수 있다.
+- DB 집계: 저장·추가·삭제는 캐시 상태와 관계없이 검증값에 반영
+- 모델 버전: updated_at이 바뀌지 않는 QuerySet.update() 변경(이미지 파생본 등) 반영
+- Last-Modified는 삭제 시각까지 아는 경우(캐시의 변경 시각이 있을 때)에만 보냄
+- 응답 캐시(CachedListMixin)를 쓰는 비로그인 목록은 캐시 항목에 함께 저장한 검증값을 먼저 확인
+  → 캐시 적중이면 DB 집계 없이 200/304 (캐시 키에 모델 버전이 있으므로 변경 후에는 다시 계산)
+"""
+import hashlib
+import time
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .cache import aget_last_modified, aget_model_versions, get_last_modified, get_model_versions
+
+
+def table_aggregates(model):
+    """검증값용 집계 - COUNT(*) + MAX(updated_at) (updated_at이 없는 모델은 COUNT만)"""
+    aggregates = {'count': Count('pk')}
+    if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+        aggregates['modified'] = Max('updated_at')
+    return aggregates
+
+
+def get_table_states(models):
+    return [model._default_manager.aggregate(**table_aggregates(model)) for model in models]
+
+
+async def aget_table_states(models):
+    return [await model._default_manager.aaggregate(**table_aggregates(model)) for model in models]
+
+
+class ConditionalGetMixin:
+    """
+    generic view용 조건부 GET (list / retrieve / 비동기 alist)
+    - conditional_models: 검증값에 쓸 모델 (없으면 cache_models 또는 queryset 모델)
+    - validator_interval: 시간에 따라 결과가 바뀌는 목록은 N초마다 ETag 변경
+    """
+    conditional_models = ()
+    validator_interval = None
+    conditional_cache_control = 'no-cache'
+
+    def get_conditional_models(self):
+        models = self.conditional_models or getattr(self, 'cache_models', ())
+        return models or (self.get_queryset().model,)
+
+    def get_validators(self, request):
+        """(ETag, Last-Modified timestamp 또는 None)"""
+        cached = self.get_cached_validators(request)
+        if cached:
+            return cached
+        models = self.get_conditional_models()
+        return self.build_validators(
+            request, get_table_states(models), get_model_versions(models), get_last_modified(models)
+        )
+
+    async def aget_validators(self, request):
+        cached = await self.aget_cached_validators(request)
+        if cached:
+            return cached
+        models = self.get_conditional_models()
+        return self.build_validators(
+            request, await aget_table_states(models),
+            await aget_model_versions(models), await aget_last_modified(models),
+        )
+
+    def get_cached_validators(self, request):
+        """응답 캐시 항목에 저장된 검증값 (CachedListMixin 목록이 아니거나 캐시에 없으면 None)"""
+        if not hasattr(self, 'get_cached_entry') or not self.use_response_cache(request):
+            return None
+        entry = self.get_cached_entry(request)[1]
+        return entry and entry['validators']
+
+    async def aget_cached_validators(self, request):
+        if not hasattr(self, 'aget_cached_entry') or not self.use_response_cache(request):
+            return None
+        entry = (await self.aget_cached_entry(request))[1]
+        return entry and entry['validators']
+
+    def build_validators(self, request, states, versions, last_modified):
+        parts = [request.get_full_path(), request.accepted_media_type, *versions]
+        for state in states:
+            modified = state.get('modified')
+            parts.append(f'{state["count"]}:{modified.timestamp() if modified else ""}')
+            # 삭제는 updated_at에 남지 않으므로 캐시의 변경 시각(삭제 포함)이 없으면 Last-Modified 생략
+            if modified and last_modified is not None:
+                last_modified = max(last_modified, modified.timestamp())
+        if self.validator_interval:
+            parts.append(int(time.time() // self.validator_interval))
+            last_modified = None
+        digest = hashlib.md5('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+        # 조회수 등 사소한 차이는 무시하는 약한 검증값
+        return f'W/"{digest}"', last_modified
+
+    def not_modified(self, request, *args, **kwargs):
+        """304 응답 직전 호출 (조회수 집계 등)"""
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_get(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_get(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        # 응답 캐시에 저장할 때 함께 기록 (CachedListMixin.make_cache_entry)
+        etag, last_modified = self.response_validators = await self.aget_validators(request)
+        response = self.conditional_response(request, etag, last_modified)
+        if response is not None:
+            self.not_modified(request, *args, **kwargs)
+            return response
+        return self.set_validators(await super().alist(request, *args, **kwargs), etag, last_modified)
+
+    def conditional_get(self, handler, request, *args, **kwargs):
+        etag, last_modified = self.response_validators = self.get_validators(request)
+        response = self.conditional_response(request, etag, last_modified)
+        if response is not None:
+            self.not_modified(request, *args, **kwargs)
+            return response
+        return self.set_validators(handler(request, *args, **kwargs), etag, last_modified)
+
+    def conditional_response(self, request, etag, last_modified):
+        response = get_conditional_response(
+            request, etag=etag, last_modified=int(last_modified) if last_modified else None
+        )
+        if response is not None:
+            self.set_validators(response, etag, last_modified)
+        return response
+
+    def set_validators(self, response, etag, last_modified):
+        if response.status_code not in (200, 304):
+            return response
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        if not response.has_header('Cache-Control'):
+            response['Cache-Control'] = self.conditional_cache_control
+        return response
@@ -0,0 +1,197 @@
+"""
+조회수 지연 반영(write-behind) 카운터
+
+상세 조회마다 UPDATE를 실행하지 않고 프로세스 메모리에 증가분을 모아 두었다가
+일정 주기(VIEW_COUNTER_FLUSH_INTERVAL) 또는 누적 건수(VIEW_COUNTER_FLUSH_THRESHOLD)에
+도달하면 F('views') + n 으로 한 번에 반영한다.
+프로세스 종료 시(atexit)에도 남은 증가분을 반영한다.
+
+visitor를 함께 넘기면 순방문자도 집계한다. 방문자 식별값은 저장하지 않고
+일별/누적 HyperLogLog 스케치(VisitorSketch)에 합친 뒤 모델의 unique_visitors에 추정값을 기록한다.
+"""
+import atexit
+import logging
+import os
+import re
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .hyperloglog import HyperLogLog
+from .models import VisitorSketch
+
+logger = logging.getLogger(__name__)
+
+BOT_USER_AGENT_RE = re.compile(r'bot|crawl|spider|slurp|preview|fetch|monitor', re.IGNORECASE)
+
+
+def visitor_key(request):
+    """
+    순방문자 식별값 - 로그인 사용자는 사용자 ID, 비로그인은 IP + User-Agent
+    검색엔진/미리보기 봇은 None (순방문자에서 제외)
+    """
+    agent = request.META.get('HTTP_USER_AGENT', '')
+    if BOT_USER_AGENT_RE.search(agent):
+        return None
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+    return f'anon:{request.META.get("REMOTE_ADDR", "")}:{agent}'
+
+
+class ViewCounter:
+    """모델별 조회수 증가분 버퍼"""
+
+    def __init__(self, field='views', unique_field='unique_visitors'):
+        self.field = field
+        self.unique_field = unique_field
+        self._lock = threading.Lock()
+        self._pending = defaultdict(int)  # (model, pk) -> 증가분
+        self._visitors = defaultdict(HyperLogLog)  # (model, pk, 일자) -> 스케치
+        self._hits = 0
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+        atexit.register(self.flush)
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 10)
+
+    @property
+    def flush_threshold(self):
+        return getattr(settings, 'VIEW_COUNTER_FLUSH_THRESHOLD', 1000)
+
+    def increment(self, instance, count=1, visitor=None):
+        """조회수 증가 예약 (DB 쿼리 없음), visitor: visitor_key(request)"""
+        model, day = type(instance), timezone.localdate()
+        if self.flush_interval <= 0:
+            # 지연 반영 비활성화 - 즉시 UPDATE
+            self._apply(model, {instance.pk: count})
+            if visitor:
+                sketch = HyperLogLog()
+                sketch.add(visitor)
+                self._apply_visitors(model, {(instance.pk, day): sketch})
+            return
+
+        self._ensure_worker()
+        with self._lock:
+            self._pending[(model, instance.pk)] += count
+            if visitor:
+                self._visitors[(model, instance.pk, day)].add(visitor)
+            self._hits += count
+            if self._hits >= self.flush_threshold:
+                self._wakeup.set()
+
+    def pending(self, instance):
+        """아직 DB에 반영되지 않은 증가분"""
+        with self._lock:
+            return self._pending.get((type(instance), instance.pk), 0)
+
+    def flush(self):
+        """모아 둔 증가분을 DB에 반영"""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            visitors, self._visitors = self._visitors, defaultdict(HyperLogLog)
+            self._hits = 0
+
+        by_model = defaultdict(dict)
+        for (model, pk), count in pending.items():
+            by_model[model][pk] = count
+
+        for model, counts in by_model.items():
+            try:
+                self._apply(model, counts)
+            except Exception:
+                logger.exception('View counter flush failed for %s', model._meta.label)
+                # 반영 실패한 증가분은 다음 주기에 재시도
+                with self._lock:
+                    for pk, count in counts.items():
+                        self._pending[(model, pk)] += count
+                        self._hits += count
+
+        sketches_by_model = defaultdict(dict)
+        for (model, pk, day), sketch in visitors.items():
+            sketches_by_model[model][(pk, day)] = sketch
+
+        for model, sketches in sketches_by_model.items():
+            try:
+                self._apply_visitors(model, sketches)
+            except Exception:
+                logger.exception('Visitor sketch flush failed for %s', model._meta.label)
+                with self._lock:
+                    for (pk, day), sketch in sketches.items():
+                        self._visitors[(model, pk, day)].merge(sketch)
+
+    def _apply(self, model, counts):
+        # 같은 증가분끼리 묶어 UPDATE 한 번으로 처리 (대부분 +1)
+        by_count = defaultdict(list)
+        for pk, count in counts.items():
+            by_count[count].append(pk)
+
+        with transaction.atomic():
+            for count, pks in by_count.items():
+                model.objects.filter(pk__in=sorted(pks)).update(
+                    **{self.field: F(self.field) + count}
+                )
+
+    def _apply_visitors(self, model, sketches):
+        # 일별 스케치와 누적 스케치에 합친 뒤 누적 추정값을 모델에 기록
+        content_type = ContentType.objects.get_for_model(model)
+        by_pk = defaultdict(list)
+        for (pk, day), sketch in sketches.items():
+            by_pk[pk].append((day, sketch))
+
+        with transaction.atomic():
+            for pk in sorted(by_pk):
+                total = HyperLogLog()
+                for day, sketch in by_pk[pk]:
+                    self._merge_sketch(content_type, pk, day, sketch)
+                    total.merge(sketch)
+                total = self._merge_sketch(content_type, pk, None, total)
+                model.objects.filter(pk=pk).update(**{self.unique_field: total.count()})
+
+    def _merge_sketch(self, content_type, pk, day, sketch):
+        row = VisitorSketch.objects.select_for_update().filter(
+            content_type=content_type, object_id=pk, day=day
+        ).first()
+        if row is None:
+            row = VisitorSketch(content_type=content_type, object_id=pk, day=day)
+        else:
+            sketch = row.sketch.merge(sketch)
+        row.registers = sketch.to_bytes()
+        row.save()
+        return sketch
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid:
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid:
+                return
+            if self._pid is not None and self._pid != pid:
+                # fork된 워커 - 부모 프로세스의 버퍼는 부모가 반영
+                self._pending = defaultdict(int)
+                self._visitors = defaultdict(HyperLogLog)
+                self._hits = 0
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name='view-counter', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                connections.close_all()
+
+
+view_counter = ViewCounter()
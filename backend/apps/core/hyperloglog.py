@@ -0,0 +1,70 @@
+"""
+HyperLogLog 순방문자 추정
+
+방문자 식별값을 저장하지 않고 고정 크기 레지스터(2^precision 바이트)만으로
+서로 다른 방문자 수를 추정한다. precision 12 기준 4KB, 표준 오차 약 1.6%.
+두 스케치는 레지스터별 최댓값으로 합칠 수 있다 (일별 스케치 → 기간/전체 합산).
+"""
+import hashlib
+import math
+
+DEFAULT_PRECISION = 12
+
+
+class HyperLogLog:
+    """HyperLogLog 스케치 (64비트 해시)"""
+
+    def __init__(self, precision=DEFAULT_PRECISION, registers=None):
+        if not 4 <= precision <= 16:
+            raise ValueError('precision은 4~16 사이여야 합니다.')
+        self.precision = precision
+        self.size = 1 << precision
+        if registers is None:
+            registers = bytearray(self.size)
+        elif len(registers) != self.size:
+            raise ValueError(f'레지스터 크기가 맞지 않습니다: {len(registers)} != {self.size}')
+        self.registers = bytearray(registers)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """저장된 레지스터 바이트로 복원 (크기에서 precision 계산)"""
+        precision = len(data).bit_length() - 1
+        return cls(precision, data)
+
+    def to_bytes(self):
+        return bytes(self.registers)
+
+    def add(self, value):
+        """방문자 식별값 추가 (레지스터가 바뀌면 True)"""
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        x = int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), 'big')
+        index = x >> (64 - self.precision)
+        rest_bits = 64 - self.precision
+        rest = x & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+            return True
+        return False
+
+    def merge(self, other):
+        """다른 스케치를 합침 (레지스터별 최댓값)"""
+        if other.precision != self.precision:
+            raise ValueError('precision이 다른 스케치는 합칠 수 없습니다.')
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self):
+        """순방문자 추정값"""
+        m = self.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # 소규모 구간은 선형 카운팅이 더 정확
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def __bool__(self):
+        return any(self.registers)
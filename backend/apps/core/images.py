@@ -0,0 +1,377 @@
+"""
+업로드 이미지 파생본 (다중 너비 WebP/AVIF)
+
+ImageVariantsModel의 variant_fields 이미지가 바뀌면 트랜잭션 커밋 후
+백그라운드 스레드(IMAGE_PROCESSING_WORKERS)에서 IMAGE_VARIANT_WIDTHS 너비별 파생본을 만든다.
+- EXIF 방향대로 회전하고 EXIF/XMP 등 메타데이터는 저장하지 않음 (ICC 색상 프로필만 유지)
+- 원본보다 큰 너비는 만들지 않음 (원본이 더 작으면 원본 너비로 하나 생성)
+- 파일명은 원본 경로로 결정: derivatives/<원본 경로>.<너비>w.<형식>
+처리 결과는 image_variants(JSON)에 기록되고, serializer의 SrcsetField가 srcset 문자열로 응답한다.
+기존 파일은 manage.py process_images로 일괄 처리한다.
+"""
+import io
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, models, transaction
+from PIL import Image, ImageOps, features
+from rest_framework import serializers
+
+from . import blurhash
+from .cache import bump_model_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WIDTHS = (320, 640, 1024, 1600)
+DEFAULT_FORMATS = ('avif', 'webp')
+DEFAULT_QUALITY = {'avif': 60, 'webp': 80, 'jpeg': 82}
+SAVE_OPTIONS = {
+    'avif': {'format': 'AVIF', 'speed': 6},
+    'webp': {'format': 'WEBP', 'method': 4},
+    'jpeg': {'format': 'JPEG', 'optimize': True, 'progressive': True},
+}
+EXIF_ORIENTATION = 0x0112
+EXIF_DATETIME = 0x0132
+EXIF_IFD = 0x8769
+EXIF_DATETIME_ORIGINAL = 0x9003
+PLACEHOLDER_SIZE = 32  # BlurHash/대표색 계산용 축소 크기
+PLACEHOLDER_DECODE_SIZE = 64
+EXIF_DATETIME_RE = re.compile(r'^\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}')
+
+
+def variant_widths():
+    return sorted(set(getattr(settings, 'IMAGE_VARIANT_WIDTHS', DEFAULT_WIDTHS)))
+
+
+@lru_cache
+def format_supported(fmt):
+    """설치된 Pillow가 저장할 수 있는 형식인지 (AVIF는 Pillow 11.2+)"""
+    return fmt in SAVE_OPTIONS and (fmt == 'jpeg' or features.check(fmt))
+
+
+def variant_formats():
+    """설정된 형식 중 저장할 수 있는 것"""
+    return [fmt for fmt in getattr(settings, 'IMAGE_VARIANT_FORMATS', DEFAULT_FORMATS) if format_supported(fmt)]
+
+
+def variant_name(source, width, fmt):
+    return f'derivatives/{source}.{width}w.{fmt}'
+
+
+def target_widths(width, widths):
+    """원본 너비 기준으로 만들 너비 목록 (확대 없음)"""
+    targets = [w for w in widths if w < width]
+    if not widths or width <= widths[-1]:
+        targets.append(width)
+    return targets
+
+
+def prepare_image(image, max_side=None):
+    """
+    열린 이미지를 EXIF 방향대로 회전해 RGB/RGBA로 디코딩
+    (image, 회전 반영한 원본 크기, ICC 프로필) - max_side가 있으면 JPEG는 그 크기까지만 디코딩
+    """
+    width, height = image.size
+    if image.getexif().get(EXIF_ORIENTATION) in (5, 6, 7, 8):
+        width, height = height, width
+    if max_side:
+        # DCT 축소 디코딩 - 카메라 원본에서 효과가 큼 (회전 전 기준이므로 정사각형으로 요청)
+        image.draft('RGB', (max_side, max_side))
+    image = ImageOps.exif_transpose(image)
+    image.load()  # 끝까지 디코딩 (잘린 파일은 여기서 예외)
+
+    icc_profile = image.info.get('icc_profile') if image.mode in ('RGB', 'RGBA') else None
+    if image.mode not in ('RGB', 'RGBA'):
+        has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+    return image, (width, height), icc_profile
+
+
+def open_image(source, storage=None, max_side=None):
+    """스토리지의 원본 이미지를 prepare_image로 열기"""
+    storage = storage or default_storage
+    with storage.open(source, 'rb') as file:
+        return prepare_image(Image.open(file), max_side)
+
+
+def encode_image(image, fmt, icc_profile=None):
+    """메타데이터 없이 인코딩한 바이트 (EXIF/XMP 제거, ICC 프로필만 유지)"""
+    quality = {**DEFAULT_QUALITY, **getattr(settings, 'IMAGE_VARIANT_QUALITY', {})}
+    options = {**SAVE_OPTIONS[fmt], 'quality': quality[fmt]}
+    if icc_profile:
+        options['icc_profile'] = icc_profile
+    if fmt == 'jpeg' and image.mode == 'RGBA':
+        image = image.convert('RGB')
+    image.info = {}
+    buffer = io.BytesIO()
+    image.save(buffer, **options)
+    return buffer.getvalue()
+
+
+def generate_variants(source, storage=None):
+    """
+    원본 이미지의 파생본 파일 생성 후 image_variants에 저장할 정보 반환
+    (DB를 사용하지 않으므로 process_images의 프로세스 풀에서도 실행)
+    """
+    storage = storage or default_storage
+    widths, formats = variant_widths(), variant_formats()
+    image, (width, height), icc_profile = open_image(source, storage, widths[-1] if widths else None)
+
+    targets = target_widths(width, widths)
+    for target in targets:
+        resized = image.resize((target, max(round(height * target / width), 1)), Image.Resampling.LANCZOS)
+        for fmt in formats:
+            name = variant_name(source, target, fmt)
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(encode_image(resized, fmt, icc_profile)))
+    return {'source': source, 'width': width, 'height': height, 'widths': targets, 'formats': formats}
+
+
+def image_placeholder(image):
+    """디코딩된 이미지의 (대표색 '#rrggbb', BlurHash)"""
+    small = image.convert('RGB')
+    small.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    palette = small.quantize(colors=5)
+    _, index = max(palette.getcolors())
+    r, g, b = palette.getpalette()[index * 3:index * 3 + 3]
+    components = (4, 3) if small.width >= small.height else (3, 4)
+    return f'#{r:02x}{g:02x}{b:02x}', blurhash.encode(small, *components)
+
+
+def read_placeholder(file):
+    """FieldFile(저장 전 업로드 포함)의 {'width', 'height', 'color', 'blurhash'}"""
+    committed = file._committed
+    file.open('rb')
+    try:
+        image, (width, height), _ = prepare_image(Image.open(file), PLACEHOLDER_DECODE_SIZE)
+    finally:
+        if committed:
+            file.close()
+        else:
+            file.seek(0)  # 이어서 스토리지에 저장되도록
+    color, hash_ = image_placeholder(image)
+    return {'width': width, 'height': height, 'color': color, 'blurhash': hash_}
+
+
+def inspect_image(source, storage=None):
+    """
+    업로드 이미지 디코딩 검증 + 크기/대표색/BlurHash/촬영일 확인 (손상·위장 파일이면 예외)
+    촬영일은 EXIF DateTimeOriginal(없으면 DateTime) 'YYYY:MM:DD HH:MM:SS' 문자열 또는 None
+    """
+    storage = storage or default_storage
+    with storage.open(source, 'rb') as file:
+        image = Image.open(file)
+        exif = image.getexif()
+        image, (width, height), _ = prepare_image(image, PLACEHOLDER_DECODE_SIZE)
+    taken_at = exif.get_ifd(EXIF_IFD).get(EXIF_DATETIME_ORIGINAL) or exif.get(EXIF_DATETIME)
+    if not isinstance(taken_at, str) or not EXIF_DATETIME_RE.match(taken_at) or taken_at.startswith('0000'):
+        taken_at = None
+    color, hash_ = image_placeholder(image)
+    return {
+        'source': source, 'width': width, 'height': height,
+        'color': color, 'blurhash': hash_, 'taken_at': taken_at,
+    }
+
+
+def delete_variants(info, storage=None):
+    storage = storage or default_storage
+    for width in info.get('widths', []):
+        for fmt in info.get('formats', []):
+            storage.delete(variant_name(info['source'], width, fmt))
+
+
+class ImageVariantsModel(models.Model):
+    """variant_fields 이미지의 파생본을 image_variants에 기록하는 모델"""
+    variant_fields = ()
+
+    # {필드명: {'source', 'width', 'height', 'widths', 'formats'}}
+    image_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name='이미지 파생본')
+
+    class Meta:
+        abstract = True
+
+    def get_variants(self, field):
+        """현재 이미지의 파생본 정보 (아직 처리 전이거나 이전 이미지의 것이면 None)"""
+        file = getattr(self, field)
+        info = (self.image_variants or {}).get(field)
+        if not file or not info or info.get('source') != file.name:
+            return None
+        return info
+
+    def variants_outdated(self):
+        """파생본 생성/정리가 필요한 이미지가 있는지"""
+        variants = self.image_variants or {}
+        return any(
+            (getattr(self, field) and self.get_variants(field) is None)
+            or (not getattr(self, field) and field in variants)
+            for field in self.variant_fields
+        )
+
+    def get_srcset(self, field, build_url=None):
+        """{'avif': 'URL 320w, URL 640w', 'webp': ...} (파생본이 없으면 None)"""
+        info = self.get_variants(field)
+        if info is None:
+            return None
+        storage = getattr(self, field).storage
+        srcset = {}
+        for fmt in info['formats']:
+            urls = [storage.url(variant_name(info['source'], width, fmt)) for width in info['widths']]
+            if build_url:
+                urls = [build_url(url) for url in urls]
+            srcset[fmt] = ', '.join(f'{url} {width}w' for url, width in zip(urls, info['widths']))
+        return srcset
+
+
+class ImagePlaceholderModel(models.Model):
+    """
+    이미지 크기·대표색·BlurHash를 저장 시점에 계산해 두는 모델 (프론트엔드 자리 확보/흐린 미리보기용)
+    placeholder_fields = {이미지 필드명: (너비, 높이, 대표색, BlurHash 필드명)}
+    """
+    placeholder_fields = {}
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        changed = self.update_placeholders(update_fields)
+        if update_fields is not None and changed:
+            kwargs['update_fields'] = {*update_fields, *changed}
+        super().save(*args, **kwargs)
+
+    def update_placeholders(self, fields=None, force=False):
+        """새로 올린 이미지(또는 아직 계산 전인 이미지)의 값 계산 - 바뀐 필드명 목록"""
+        changed = []
+        for field, targets in self.placeholder_fields.items():
+            if fields is not None and field not in fields:
+                continue
+            file = getattr(self, field)
+            if file and file._committed and getattr(self, targets[0]) is not None and not force:
+                continue
+            if not file and getattr(self, targets[0]) is None:
+                continue
+            values = (None, None, '', '')
+            if file:
+                try:
+                    info = read_placeholder(file)
+                    values = (info['width'], info['height'], info['color'], info['blurhash'])
+                except (OSError, ValueError, Image.DecompressionBombError):
+                    logger.warning('이미지 자리표시 값 계산 실패: %s', file.name, exc_info=True)
+            for name, value in zip(targets, values):
+                setattr(self, name, value)
+            changed.extend(targets)
+        return changed
+
+
+def process_instance_images(model, pk, force=False):
+    """객체의 이미지 파생본 생성 / 바뀐 이미지의 이전 파생본 삭제"""
+    instance = model.objects.filter(pk=pk).only('pk', 'image_variants', *model.variant_fields).first()
+    if instance is None:
+        return
+    variants = dict(instance.image_variants or {})
+    changed = False
+    for field in model.variant_fields:
+        file = getattr(instance, field)
+        old = variants.get(field)
+        if old and (force or old.get('source') != file.name):
+            delete_variants(old, file.storage)
+            del variants[field]
+            changed = True
+        if file and field not in variants:
+            try:
+                variants[field] = generate_variants(file.name, file.storage)
+            except (OSError, ValueError, Image.DecompressionBombError):
+                logger.exception('이미지 파생본 생성 실패: %s', file.name)
+                continue
+            changed = True
+    if changed:
+        model.objects.filter(pk=pk).update(image_variants=variants)
+        bump_model_version(model)
+
+
+class ImageProcessor:
+    """요청 처리와 분리된 이미지 작업 스레드 풀 (같은 객체는 대기 중 작업 하나만 유지)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._queued = set()
+
+    @property
+    def workers(self):
+        return getattr(settings, 'IMAGE_PROCESSING_WORKERS', 2)
+
+    def schedule(self, instance):
+        """트랜잭션 커밋 후 파생본 처리 예약"""
+        model, pk = type(instance), instance.pk
+        transaction.on_commit(lambda: self.submit(model, pk))
+
+    def submit(self, model, pk):
+        if self.workers <= 0:
+            # 백그라운드 처리 비활성화 - 즉시 처리 (개발/디버깅용)
+            process_instance_images(model, pk)
+            return
+        key = (model, pk)
+        with self._lock:
+            if key in self._queued:
+                return
+            self._queued.add(key)
+            executor = self._get_executor()
+        executor.submit(self._run, key)
+
+    def _get_executor(self):
+        if self._executor is None or self._pid != os.getpid():
+            # fork된 워커 프로세스는 부모의 스레드를 물려받지 않으므로 새로 생성
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='image-variants')
+            self._pid = os.getpid()
+            self._queued = set()
+        return self._executor
+
+    def _run(self, key):
+        with self._lock:
+            self._queued.discard(key)
+        try:
+            process_instance_images(*key)
+        except Exception:
+            logger.exception('이미지 파생본 처리 실패: %s #%s', key[0]._meta.label, key[1])
+        finally:
+            connections.close_all()
+
+
+image_processor = ImageProcessor()
+
+
+def process_images_on_save(sender, instance, raw=False, **kwargs):
+    """post_save 수신 함수 - 이미지가 바뀌었으면 파생본 처리 예약"""
+    if not raw and instance.variants_outdated():
+        image_processor.schedule(instance)
+
+
+def delete_variants_on_delete(sender, instance, **kwargs):
+    """post_delete 수신 함수 - 파생본 파일 정리 (원본 파일은 Django 기본 동작대로 유지)"""
+    variants = [info for info in (instance.image_variants or {}).values() if info]
+    if variants:
+        transaction.on_commit(lambda: [delete_variants(info) for info in variants])
+
+
+class SrcsetField(serializers.Field):
+    """이미지 필드의 파생본 srcset - {'avif': 'URL 320w, ...', 'webp': ...}, 처리 전이면 null"""
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        request = self.context.get('request')
+        return instance.get_srcset(self.image_field, request.build_absolute_uri if request else None)
@@ -0,0 +1,75 @@
+"""
+이미지 크기·대표색·BlurHash 일괄 계산 (기존 업로드 이미지용)
+
+    python manage.py backfill_image_placeholders
+    python manage.py backfill_image_placeholders --workers 4 --force
+
+아직 값이 없는 이미지를 프로세스 풀에서 디코딩하고, 결과는 batch-size 단위로 bulk_update 한다.
+새로 올린 이미지는 저장 시 ImagePlaceholderModel이 계산하므로 처음 한 번만 실행하면 된다.
+"""
+import os
+from concurrent.futures import as_completed
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.cache import bump_model_version
+from apps.core.images import ImagePlaceholderModel, inspect_image
+from apps.core.processes import process_pool
+
+
+class Command(BaseCommand):
+    help = '기존 업로드 이미지의 크기·대표색·BlurHash를 일괄 계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='프로세스 수 (기본 CPU 수)')
+        parser.add_argument('--force', action='store_true', help='이미 계산된 이미지도 다시 계산')
+        parser.add_argument('--batch-size', type=int, default=500, help='한 번에 저장할 객체 수')
+
+    def handle(self, *args, **options):
+        models = [model for model in apps.get_models() if issubclass(model, ImagePlaceholderModel)]
+        jobs = []  # (모델, pk, 이미지 필드, 원본 경로)
+        for model in models:
+            for field, targets in model.placeholder_fields.items():
+                queryset = model.objects.exclude(**{field: ''})
+                if not options['force']:
+                    queryset = queryset.filter(**{f'{targets[0]}__isnull': True})
+                for pk, name in queryset.values_list('pk', field).iterator():
+                    jobs.append((model, pk, field, name))
+
+        self.stdout.write(f'처리 대상 이미지 {len(jobs)}개')
+        pending = {model: [] for model in models}
+        failed = 0
+        with process_pool(options['workers']) as pool:
+            futures = {pool.submit(inspect_image, job[3]): job for job in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                model, pk, field, name = futures[future]
+                try:
+                    info = future.result()
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f'[실패] {name}: {exc}')
+                    continue
+                instance = model(pk=pk)
+                values = (info['width'], info['height'], info['color'], info['blurhash'])
+                for target, value in zip(model.placeholder_fields[field], values):
+                    setattr(instance, target, value)
+                pending[model].append((instance, field))
+                self.stdout.write(f'[{done}/{len(jobs)}] {name}')
+                if len(pending[model]) >= options['batch_size']:
+                    self.flush(model, pending[model])
+
+        for model in models:
+            self.flush(model, pending[model])
+            bump_model_version(model)
+        if failed:
+            raise CommandError(f'{failed}개 이미지 처리에 실패했습니다.')
+        self.stdout.write(self.style.SUCCESS(f'이미지 {len(jobs)}개의 자리표시 값을 계산했습니다.'))
+
+    def flush(self, model, pending):
+        """이미지 필드별로 묶어 bulk_update (save()를 거치지 않으므로 다시 디코딩하지 않음)"""
+        for field, targets in model.placeholder_fields.items():
+            objs = [instance for instance, name in pending if name == field]
+            if objs:
+                model.objects.bulk_update(objs, targets)
+        pending.clear()
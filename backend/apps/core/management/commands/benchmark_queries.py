@@ -0,0 +1,204 @@
+"""
+조회 쿼리 실행 계획 점검
+
+    python manage.py benchmark_queries
+    python manage.py benchmark_queries --rows 50000 --keepdb
+
+테스트 DB(test_<DB명>)를 만들어 주요 테이블에 대량 데이터를 넣고,
+각 API 엔드포인트/관리자 목록이 실행하는 SELECT의 EXPLAIN 결과를 확인한다.
+대량 테이블을 순차 스캔(PostgreSQL Seq Scan / SQLite SCAN)하는 쿼리가 있으면 실패한다.
+응답 캐시(API_RESPONSE_CACHE)는 끄고 실행하며, 200이 아닌 응답이나 SELECT가 없는 시나리오도 실패로 본다.
+"""
+import json
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import (
+    CaptureQueriesContext, setup_databases, setup_test_environment,
+    teardown_databases, teardown_test_environment,
+)
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.archive.models import GalleryAlbum, GalleryVideo, News, Notice
+from apps.contest.models import ContestApplication
+from apps.core.pagination import make_cursor
+from apps.join.models import Donation
+from apps.popup.models import Popup
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = '대량 데이터로 주요 조회 쿼리의 EXPLAIN을 확인 (순차 스캔이면 실패)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='테이블별 데이터 건수 (기본 20000)')
+        parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 유지 (재실행 시 데이터 재사용)')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False, keepdb=options['keepdb'])
+        try:
+            if not Notice.objects.exists():
+                started = time.monotonic()
+                self.seed(options['rows'])
+                self.stdout.write(f'데이터 생성: {options["rows"]}건/테이블 ({time.monotonic() - started:.1f}초)')
+            with connection.cursor() as cursor:
+                # 플래너 통계 갱신 (PostgreSQL은 VACUUM으로 visibility map도 채워 운영 DB처럼 index-only scan 가능)
+                cursor.execute('VACUUM ANALYZE' if connection.vendor == 'postgresql' else 'ANALYZE')
+
+            failures = []
+            for label, run in self.get_scenarios():
+                with override_settings(API_RESPONSE_CACHE=False), CaptureQueriesContext(connection) as captured:
+                    response = run()
+                status_code = getattr(response, 'status_code', 200)
+                if status_code != 200:
+                    failures.append(label)
+                    self.stdout.write(self.style.ERROR(f'[HTTP {status_code}] {label}'))
+                    continue
+                selects = [
+                    query for query in captured.captured_queries
+                    if query['sql'].lstrip().upper().startswith('SELECT')
+                ]
+                if not selects:
+                    failures.append(label)
+                    self.stdout.write(self.style.ERROR(f'[쿼리 없음] {label}'))
+                for query in selects:
+                    sql = query['sql']
+                    scans = self.sequential_scans(sql)
+                    if scans:
+                        failures.append(label)
+                        self.stdout.write(self.style.ERROR(f'[SEQ SCAN] {label}: {", ".join(scans)}'))
+                        self.stdout.write(f'    {sql[:300]}')
+                    else:
+                        self.stdout.write(f'[OK] {label} ({float(query["time"]) * 1000:.1f}ms)')
+        finally:
+            teardown_databases(old_config, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        if failures:
+            raise CommandError(f'실패한 시나리오 {len(set(failures))}개: {", ".join(dict.fromkeys(failures))}')
+        self.stdout.write(self.style.SUCCESS('모든 쿼리가 인덱스를 사용합니다.'))
+
+    def seed(self, rows):
+        rng = random.Random(0)
+        today = date.today()
+
+        def days_ago(i):
+            return today - timedelta(days=i % 3650)
+
+        def create(model, make):
+            for start in range(0, rows, BATCH_SIZE):
+                model.objects.bulk_create([make(i) for i in range(start, min(start + BATCH_SIZE, rows))])
+
+        categories = [c for c, _ in Notice.CATEGORY_CHOICES]
+        create(Notice, lambda i: Notice(
+            category=rng.choice(categories), title=f'공지 {i}', content=f'유관순 공지 내용 {i}',
+            author='사무국', is_pinned=(i % 500 == 0),
+        ))
+        create(News, lambda i: News(
+            source=rng.choice(['연합뉴스', '조선일보', '한겨레', 'KBS']), title=f'보도 {i}',
+            excerpt=f'보도 요약 {i}', link_url='https://example.com/', published_date=days_ago(i),
+        ))
+        album_categories = [c for c, _ in GalleryAlbum.CATEGORY_CHOICES]
+        create(GalleryAlbum, lambda i: GalleryAlbum(
+            category=rng.choice(album_categories), title=f'앨범 {i}', event_date=days_ago(i),
+        ))
+        create(GalleryVideo, lambda i: GalleryVideo(
+            title=f'영상 {i}', youtube_url='https://youtu.be/x', duration='3:00',
+        ))
+        statuses = [s for s, _ in ContestApplication.STATUS_CHOICES]
+        create(ContestApplication, lambda i: ContestApplication(
+            contest_year=2000 + i % 25, name=f'참가자{i}', birth_date=date(2010, 1, 1),
+            school_name='천안초등학교', grade='초5', division='korean', speech_title='제목',
+            parent_name='보호자', contact_parent=f'010{i:08d}', email=f'user{i}@example.com',
+            script_file='contest/scripts/bench.pdf', status=rng.choice(statuses),
+        ))
+        create(Donation, lambda i: Donation(
+            donation_type='once', amount=10000, donor_name=f'후원자{i}', phone=f'010{i:08d}',
+            email=f'donor{i}@example.com', is_confirmed=(i % 10 != 0),
+        ))
+        now = timezone.now()
+        create(Popup, lambda i: Popup(
+            title=f'팝업 {i}', pc_image='popup/pc.jpg', mobile_image='popup/m.jpg',
+            start_at=now - timedelta(days=i + 30), end_at=now - timedelta(days=i),
+            is_active=(i % 20 == 0),
+        ))
+        create(User, lambda i: User(
+            username=f'bench{i}', password='!', phone=f'010{i:08d}',
+            tier='SUPPORTER' if i % 20 == 0 else 'FREE',
+        ))
+
+    def get_scenarios(self):
+        # 공개 API는 실제 트래픽처럼 비로그인, 관리자 API는 관리자 계정으로 요청
+        anonymous = APIClient()
+        admin = APIClient()
+        admin.force_authenticate(User.objects.create_superuser('bench-admin', password=None, phone=''))
+
+        middle = Notice.objects.order_by('-is_pinned', '-created_at', '-id')[Notice.objects.count() // 2]
+        deep_cursor = make_cursor([middle.is_pinned, middle.created_at, middle.pk])
+        applicant = ContestApplication.objects.order_by('pk')[ContestApplication.objects.count() // 2]
+
+        def get(path, params=None, client=anonymous):
+            return lambda: client.get(f'/api/v1/{path}', params or {})
+
+        return [
+            ('공지 목록', get('archive/notices/')),
+            ('공지 목록 (중간 커서)', get('archive/notices/', {'cursor': deep_cursor})),
+            ('공지 카테고리', get('archive/notices/', {'category': 'event'})),
+            ('공지 검색', get('archive/notices/', {'search': '유관순'})),
+            ('보도자료 목록', get('archive/news/')),
+            ('보도자료 언론사', get('archive/news/', {'source': 'KBS'})),
+            ('앨범 목록', get('archive/gallery/albums/')),
+            ('앨범 카테고리', get('archive/gallery/albums/', {'category': 'contest'})),
+            ('영상 목록', get('archive/gallery/videos/')),
+            ('노출 팝업', get('popups/active/')),
+            ('내 신청 조회', get('contest/my-application/', {
+                'email': applicant.email, 'phone': applicant.contact_parent,
+            })),
+            ('회원 목록', get('auth/users/', client=admin)),
+            ('회원 등급별', get('auth/users/', {'tier': 'SUPPORTER'}, client=admin)),
+            ('신청서 연도/상태 (관리자)', lambda: list(
+                ContestApplication.objects.filter(contest_year=2024, status='SUBMITTED')[:100]
+            )),
+            ('미확인 후원 (관리자)', lambda: list(
+                Donation.objects.filter(is_confirmed=False).order_by('-created_at')[:100]
+            )),
+        ]
+
+    def get_seeded_tables(self):
+        models = [Notice, News, GalleryAlbum, GalleryVideo, ContestApplication, Donation, Popup, User]
+        return {model._meta.db_table for model in models}
+
+    def sequential_scans(self, sql):
+        """EXPLAIN 결과에서 대량 테이블 순차 스캔 목록"""
+        tables = self.get_seeded_tables()
+        scans = []
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                nodes = [plan[0]['Plan']]
+                while nodes:
+                    node = nodes.pop()
+                    if node.get('Node Type') == 'Seq Scan' and node.get('Relation Name') in tables:
+                        scans.append(node['Relation Name'])
+                    nodes.extend(node.get('Plans', []))
+            elif connection.vendor == 'sqlite':
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                for row in cursor.fetchall():
+                    detail = row[-1].split()
+                    # 'SCAN 테이블' (USING INDEX 없음) = 전체 스캔
+                    if len(detail) == 2 and detail[0] == 'SCAN' and detail[1] in tables:
+                        scans.append(detail[1])
+            else:
+                raise CommandError(f'{connection.vendor}는 지원하지 않습니다 (PostgreSQL/SQLite).')
+        return scans
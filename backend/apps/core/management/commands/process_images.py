@@ -0,0 +1,88 @@
+"""
+업로드 이미지 파생본 일괄 생성
+
+    python manage.py process_images
+    python manage.py process_images --workers 4 --force
+    python manage.py process_images --model archive.GalleryImage
+
+파생본이 없거나 이전 이미지의 것인 파일을 프로세스 풀에서 변환한다.
+자식 프로세스는 이미지 변환과 파일 저장만 하고 DB 기록은 이 프로세스에서 한다.
+"""
+import os
+from concurrent.futures import as_completed
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.cache import bump_model_version
+from apps.core.images import ImageVariantsModel, delete_variants, generate_variants
+from apps.core.processes import process_pool
+
+
+class Command(BaseCommand):
+    help = '기존 업로드 이미지의 WebP/AVIF 파생본을 일괄 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='프로세스 수 (기본 CPU 수)')
+        parser.add_argument('--force', action='store_true', help='이미 처리된 이미지도 다시 생성')
+        parser.add_argument('--model', action='append', help='대상 모델 (app_label.Model, 여러 번 지정 가능)')
+
+    def handle(self, *args, **options):
+        models = self.get_models(options['model'])
+        variants = {}  # (모델, pk) -> image_variants
+        jobs = []  # (모델, pk, 필드, 원본 경로)
+        for model in models:
+            for instance in model.objects.only('pk', 'image_variants', *model.variant_fields).iterator():
+                current = dict(instance.image_variants or {})
+                changed = False
+                for field in model.variant_fields:
+                    file = getattr(instance, field)
+                    old = current.get(field)
+                    if old and (options['force'] or old.get('source') != file.name):
+                        delete_variants(old, file.storage)
+                        del current[field]
+                        changed = True
+                    if file and field not in current:
+                        jobs.append((model, instance.pk, field, file.name))
+                        changed = True
+                if changed:
+                    variants[(model, instance.pk)] = current
+
+        # 이전 파생본 정리 결과를 먼저 기록 (이미지가 지워진 객체는 변환 작업이 없음)
+        for (model, pk), current in variants.items():
+            model.objects.filter(pk=pk).update(image_variants=current)
+
+        self.stdout.write(f'처리 대상 이미지 {len(jobs)}개')
+        failed = 0
+        with process_pool(options['workers']) as pool:
+            futures = {pool.submit(generate_variants, job[3]): job for job in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                model, pk, field, name = futures[future]
+                try:
+                    variants[(model, pk)][field] = future.result()
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f'[실패] {name}: {exc}')
+                else:
+                    self.stdout.write(f'[{done}/{len(jobs)}] {name}')
+                model.objects.filter(pk=pk).update(image_variants=variants[(model, pk)])
+
+        for model in models:
+            bump_model_version(model)
+        if failed:
+            raise CommandError(f'{failed}개 이미지 처리에 실패했습니다.')
+        self.stdout.write(self.style.SUCCESS(f'이미지 {len(jobs)}개의 파생본을 생성했습니다.'))
+
+    def get_models(self, labels):
+        if not labels:
+            return [model for model in apps.get_models() if issubclass(model, ImageVariantsModel)]
+        models = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError):
+                raise CommandError(f'모델을 찾을 수 없습니다: {label}')
+            if not issubclass(model, ImageVariantsModel):
+                raise CommandError(f'{label}은 이미지 파생본 대상 모델이 아닙니다.')
+            models.append(model)
+        return models
@@ -0,0 +1,23 @@
+"""
+검색 색인 재구성
+
+    python manage.py rebuild_search_index
+
+저장 시그널을 거치지 않은 변경(QuerySet.update, loaddata 등) 후
+search_document와 SQLite FTS5 색인을 다시 만든다.
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from apps.core.search import SearchableModel, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'SearchableModel의 검색 문서와 색인을 재구성'
+
+    def handle(self, *args, **options):
+        for model in apps.get_models():
+            if issubclass(model, SearchableModel):
+                rebuild_search_index(model)
+                self.stdout.write(f'{model._meta.label}: {model.objects.count()}건')
+        self.stdout.write(self.style.SUCCESS('검색 색인을 재구성했습니다.'))
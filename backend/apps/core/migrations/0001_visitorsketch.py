@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VisitorSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('day', models.DateField(blank=True, null=True, verbose_name='일자')),
+                ('registers', models.BinaryField(verbose_name='레지스터')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': '순방문자 스케치',
+                'verbose_name_plural': '순방문자 스케치',
+                'constraints': [models.UniqueConstraint(condition=models.Q(('day__isnull', False)), fields=('content_type', 'object_id', 'day'), name='unique_daily_visitor_sketch'), models.UniqueConstraint(condition=models.Q(('day__isnull', True)), fields=('content_type', 'object_id'), name='unique_total_visitor_sketch')],
+            },
+        ),
+    ]
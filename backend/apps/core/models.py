@@ -0,0 +1,73 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import Q
+
+from .hyperloglog import HyperLogLog
+
+
+class VisitorSketchManager(models.Manager):
+
+    def for_object(self, instance):
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_id=instance.pk,
+        )
+
+    def estimate(self, instance, start=None, end=None):
+        """
+        기간 순방문자 추정 (일별 스케치 합산)
+        - start/end 모두 없으면 누적 스케치 사용
+        """
+        queryset = self.for_object(instance)
+        if start is None and end is None:
+            sketch = queryset.filter(day__isnull=True).first()
+            return sketch.sketch.count() if sketch else 0
+
+        queryset = queryset.filter(day__isnull=False)
+        if start:
+            queryset = queryset.filter(day__gte=start)
+        if end:
+            queryset = queryset.filter(day__lte=end)
+        merged = None
+        for sketch in queryset.iterator():
+            merged = sketch.sketch if merged is None else merged.merge(sketch.sketch)
+        return merged.count() if merged else 0
+
+
+class VisitorSketch(models.Model):
+    """
+    게시물별 순방문자 HyperLogLog 스케치
+    - day가 있으면 해당 일자, 없으면 누적 (일별 스케치를 모두 합친 것과 같음)
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    day = models.DateField(null=True, blank=True, verbose_name='일자')
+    registers = models.BinaryField(verbose_name='레지스터')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = VisitorSketchManager()
+
+    class Meta:
+        verbose_name = '순방문자 스케치'
+        verbose_name_plural = '순방문자 스케치'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id', 'day'],
+                condition=Q(day__isnull=False),
+                name='unique_daily_visitor_sketch',
+            ),
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id'],
+                condition=Q(day__isnull=True),
+                name='unique_total_visitor_sketch',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.content_type} #{self.object_id} ({self.day or "누적"})'
+
+    @property
+    def sketch(self):
+        if not self.registers:
+            return HyperLogLog()
+        return HyperLogLog.from_bytes(bytes(self.registers))
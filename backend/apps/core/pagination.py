@@ -0,0 +1,234 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import FloatField, Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class PageNumberPagination(pagination.PageNumberPagination):
+    """
+    페이지 번호 페이지네이션 (DRF 기본 + 비동기 뷰 지원)
+    - apaginate_queryset(): COUNT와 페이지 조회를 async ORM으로 실행
+    """
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count(cached_property)를 미리 채워 동기 COUNT 쿼리 방지
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+
+        self.page.object_list = [obj async for obj in self.page.object_list]
+
+        if paginator.num_pages > 1 and self.template is not None:
+            # The browsable API should display pagination controls.
+            self.display_page_controls = True
+
+        return list(self.page)
+
+
+class CursorEncoder(json.JSONEncoder):
+    """날짜/시간은 마이크로초까지 그대로 (DjangoJSONEncoder는 밀리초로 자름)"""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        return str(o)
+
+
+def make_cursor(values, reverse=False):
+    """정렬 키 값 → cursor 파라미터 값 (base64 JSON)"""
+    data = {'v': values}
+    if reverse:
+        data['r'] = 1
+    payload = json.dumps(data, cls=CursorEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    키셋(커서) 페이지네이션 - COUNT/OFFSET 없이 직전 페이지 마지막 항목의 정렬 키 다음부터 조회
+    - 정렬: 쿼리셋 order_by (없으면 Meta.ordering) + pk 보조 키 (같은 값이어도 순서 고정)
+    - 응답: {next, previous, results} (전체 개수 없음)
+    - ?page= 요청 또는 커서로 쓸 수 없는 정렬은 PageNumberPagination
+      (관계 필드, null 허용 필드, 표현식, annotate 값 - 검색 관련도 등, 실수 필드)
+      annotate 값은 WHERE에서 다시 계산해야 하고, 실수(float4 ts_rank_cd 등)는 JSON을 거쳐 돌아온 값과
+      =, < 비교가 정확히 맞지 않아 페이지 경계에서 행이 빠지거나 중복될 수 있음
+    """
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    page_number_class = PageNumberPagination
+    invalid_cursor_message = '잘못된 커서입니다.'
+
+    def __init__(self):
+        self.page_number = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_page_number(queryset, request):
+            self.page_number = self.page_number_class()
+            return self.page_number.paginate_queryset(queryset, request, view=view)
+        queryset = self.prepare(queryset, request)
+        return self.finish(list(queryset[:self.page_size + 1]))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        if self.use_page_number(queryset, request):
+            self.page_number = self.page_number_class()
+            return await self.page_number.apaginate_queryset(queryset, request, view=view)
+        queryset = self.prepare(queryset, request)
+        return self.finish([obj async for obj in queryset[:self.page_size + 1]])
+
+    def get_paginated_response(self, data):
+        if self.page_number is not None:
+            return self.page_number.get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def use_page_number(self, queryset, request):
+        self.request = request
+        if self.page_number_class.page_query_param in request.query_params:
+            return True
+        self.ordering = self.get_ordering(queryset)
+        return self.ordering is None
+
+    def get_ordering(self, queryset):
+        """[(필드명, 내림차순 여부, 모델 필드)] - 키셋 불가 정렬이면 None"""
+        query = queryset.query
+        names = list(query.order_by or (query.default_ordering and queryset.model._meta.ordering) or [])
+        ordering = []
+        for name in names:
+            if not isinstance(name, str) or name == '?':
+                return None
+            descending = name.startswith('-')
+            name = name.lstrip('-')
+            if name == 'pk':
+                name = queryset.model._meta.pk.name
+            if name in query.annotations:
+                return None
+            try:
+                field = queryset.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.null or field.is_relation or isinstance(field, FloatField):
+                return None
+            ordering.append((name, descending, field))
+
+        pk = queryset.model._meta.pk
+        if pk.name not in [name for name, _, _ in ordering]:
+            # 보조 키는 마지막 정렬 방향을 따름 (복합 인덱스 역방향 스캔 가능)
+            ordering.append((pk.name, ordering[-1][1] if ordering else True, pk))
+        return ordering
+
+    def first_page(self, queryset, request, url):
+        """
+        다른 응답(상세 API 등)에 포함할 첫 페이지 - next 링크는 url(목록 API) 기준
+        요청의 cursor/page 파라미터는 보지 않음 (키셋으로 쓸 수 있는 정렬만 가능)
+        """
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        self.base_url = request.build_absolute_uri(url)
+        self.has_cursor, self.reverse = False, False
+        return self.finish(list(self.order_queryset(queryset)[:self.page_size + 1]))
+
+    def prepare(self, queryset, request):
+        self.base_url = request.build_absolute_uri()
+        self.has_cursor = self.cursor_query_param in request.query_params
+        values, self.reverse = self.decode_cursor(request)
+        queryset = self.order_queryset(queryset)
+        if values is not None:
+            queryset = queryset.filter(self.keyset_filter(values))
+        return queryset
+
+    def order_queryset(self, queryset):
+        return queryset.order_by(*[
+            ('-' if descending != self.reverse else '') + name
+            for name, descending, _ in self.ordering
+        ])
+
+    def keyset_filter(self, values):
+        """(a, b, c) 다음 행 조건: a > x OR (a = x AND b > y) OR ... (+ 첫 키 범위 조건)"""
+        condition = Q()
+        equal = Q()
+        for (name, descending, _), value in zip(self.ordering, values):
+            lookup = 'lt' if descending != self.reverse else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+
+        # 첫 키 범위 조건 - 인덱스 범위 스캔으로 시작 위치를 바로 찾도록 함
+        name, descending, _ = self.ordering[0]
+        bound = Q(**{f'{name}__{"lte" if descending != self.reverse else "gte"}': values[0]})
+        return bound & condition
+
+    def finish(self, rows):
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.has_cursor
+        self.page = rows
+        return rows
+
+    def get_position(self, obj):
+        return [getattr(obj, field.attname) for _, _, field in self.ordering]
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def encode_cursor(self, values, reverse):
+        return replace_query_param(self.base_url, self.cursor_query_param, make_cursor(values, reverse))
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            data = json.loads(payload)
+            values = data['v']
+            if len(values) != len(self.ordering):
+                raise ValueError
+            values = [field.to_python(value) for (_, _, field), value in zip(self.ordering, values)]
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return values, bool(data.get('r'))
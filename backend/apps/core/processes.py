@@ -0,0 +1,22 @@
+"""
+프로세스 풀 (이미지 검사·변환, 비밀번호 해시 등 CPU 작업)
+
+웹 워커와 관리 명령은 스레드(조회수 집계, 해시 풀, 이미지 처리)와 DB 연결을 가지고 있으므로
+그대로 fork하지 않고 forkserver(없으면 spawn)로 자식 프로세스를 시작한다.
+- 자식은 새 인터프리터에서 initializer(기본 django.setup)로 Django를 초기화 → 부모의 DB 연결·잠금을 물려받지 않음
+  (fork 전에 connections.close_all()을 부를 필요 없음)
+- initializer는 Django 초기화 전에 자식에서 import되므로 모델을 불러오지 않는 모듈에 둘 것
+  (작업 함수는 initializer 실행 후에 import됨)
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+
+
+def process_pool(workers, initializer=django.setup, initargs=()):
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    return ProcessPoolExecutor(
+        max_workers=max(workers, 1), mp_context=context, initializer=initializer, initargs=initargs
+    )
@@ -0,0 +1,206 @@
+"""
+한국어 전문 검색
+
+한국어는 띄어쓰기 단위로 조사가 붙어 단어 검색이 잘 맞지 않으므로
+한글 어절을 2글자 단위(bigram)로 쪼갠 검색 문서(search_document)를 저장해 두고 색인한다.
+- PostgreSQL: search_document의 tsvector('simple') 생성 컬럼 + GIN 인덱스, ts_rank_cd 순위
+- SQLite(개발용): FTS5 가상 테이블 <테이블>_fts, bm25 순위
+- 그 외 / 색인 없음: DRF SearchFilter(icontains)로 동작
+검색 결과는 ?search= 파라미터 그대로 관련도순으로 정렬되고,
+SearchHighlightMixin을 쓴 serializer는 일치 부분을 <mark>로 감싼 highlight를 함께 응답한다.
+관련도(search_rank)는 실수 annotate 값이므로 KeysetPagination은 커서 대신 페이지 번호 방식으로 응답한다.
+"""
+import re
+
+from django.db import connection, models
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+from rest_framework import serializers
+from rest_framework.filters import SearchFilter
+
+WORD_RE = re.compile(r'\w+')
+HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎ]')
+SNIPPET_LENGTH = 120
+
+
+def tokenize(text):
+    """검색 문서용 토큰 - 한글이 포함된 어절은 2글자 단위, 그 외는 단어 그대로"""
+    tokens = []
+    for word in WORD_RE.findall((text or '').lower()):
+        if HANGUL_RE.search(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def parse_query(terms):
+    """검색어 → [(토큰, 접두사 검색 여부)] - 모든 토큰이 일치해야 검색됨"""
+    parsed = []
+    for term in terms:
+        for word in WORD_RE.findall(term.lower()):
+            if HANGUL_RE.search(word) and len(word) > 1:
+                parsed.extend((word[i:i + 2], False) for i in range(len(word) - 1))
+            else:
+                # 한 글자 / 영문·숫자는 앞부분 일치 (icontains와 비슷한 결과)
+                parsed.append((word, True))
+    return list(dict.fromkeys(parsed))
+
+
+def build_search_document(*texts):
+    return ' '.join(token for text in texts for token in tokenize(text))
+
+
+def search_table(model):
+    return f'{model._meta.db_table}_fts'
+
+
+class SearchableModel(models.Model):
+    """search_fields 내용을 search_document로 색인하는 모델"""
+    search_fields = ()
+
+    search_document = models.TextField(blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.search_document = build_search_document(*(getattr(self, f) for f in self.search_fields))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(update_fields) & set(self.search_fields):
+            kwargs['update_fields'] = {*update_fields, 'search_document'}
+        super().save(*args, **kwargs)
+
+
+_sqlite_indexes = set()
+
+
+def sqlite_index_exists(model):
+    table = search_table(model)
+    if table not in _sqlite_indexes and table in connection.introspection.table_names():
+        _sqlite_indexes.add(table)  # 생성 이후에는 조회하지 않음
+    return table in _sqlite_indexes
+
+
+def update_search_index(instance):
+    """SQLite FTS5 색인 갱신 (PostgreSQL은 생성 컬럼이라 불필요)"""
+    if connection.vendor != 'sqlite' or not sqlite_index_exists(type(instance)):
+        return
+    table = search_table(type(instance))
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {table} WHERE rowid = %s', [instance.pk])
+        cursor.execute(
+            f'INSERT INTO {table} (rowid, search_document) VALUES (%s, %s)',
+            [instance.pk, instance.search_document]
+        )
+
+
+def remove_search_index(instance):
+    if connection.vendor != 'sqlite' or not sqlite_index_exists(type(instance)):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {search_table(type(instance))} WHERE rowid = %s', [instance.pk])
+
+
+def rebuild_search_index(model):
+    """search_document 재생성 후 색인 전체 재구성"""
+    for instance in model.objects.only('pk', *model.search_fields).iterator():
+        document = build_search_document(*(getattr(instance, f) for f in model.search_fields))
+        model.objects.filter(pk=instance.pk).update(search_document=document)
+    if connection.vendor == 'sqlite' and sqlite_index_exists(model):
+        table = search_table(model)
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table}')
+            cursor.execute(
+                f'INSERT INTO {table} (rowid, search_document) '
+                f'SELECT id, search_document FROM {model._meta.db_table}'
+            )
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    ?search= 색인 검색 + 관련도순 정렬
+    SearchableModel이 아니거나 색인이 없으면 기본 SearchFilter(icontains)로 동작
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        model = queryset.model
+        terms = self.get_search_terms(request)
+        if not terms or not issubclass(model, SearchableModel):
+            return super().filter_queryset(request, queryset, view)
+
+        query = parse_query(terms)
+        if not query:
+            return queryset.none()
+
+        if connection.vendor == 'postgresql':
+            tsquery = ' & '.join(f"'{token}':*" if prefix else f"'{token}'" for token, prefix in query)
+            table = model._meta.db_table
+            return queryset.alias(
+                search_match=RawSQL(
+                    f'"{table}"."search_vector" @@ to_tsquery(\'simple\', %s)', [tsquery],
+                    output_field=BooleanField()
+                ),
+            ).filter(search_match=True).annotate(
+                search_rank=RawSQL(
+                    f'ts_rank_cd("{table}"."search_vector", to_tsquery(\'simple\', %s))', [tsquery],
+                    output_field=FloatField()
+                ),
+            ).order_by('-search_rank', *model._meta.ordering)
+
+        if connection.vendor == 'sqlite' and sqlite_index_exists(model):
+            match = ' '.join(f'"{token}"*' if prefix else f'"{token}"' for token, prefix in query)
+            fts = search_table(model)
+            table = model._meta.db_table
+            return queryset.filter(
+                pk__in=RawSQL(f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [match])
+            ).annotate(
+                # bm25는 관련도가 높을수록 작은 값
+                search_rank=RawSQL(
+                    f'(SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s AND {fts}.rowid = "{table}"."id")',
+                    [match], output_field=FloatField()
+                ),
+            ).order_by('-search_rank', *model._meta.ordering)
+
+        return super().filter_queryset(request, queryset, view)
+
+
+def highlight(text, words, length=None):
+    """일치하는 검색어를 <mark>로 감싼 HTML (나머지는 escape), length가 있으면 첫 일치 주변만"""
+    text = text or ''
+    pattern = '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True) if word)
+    match = re.search(pattern, text, re.IGNORECASE) if pattern else None
+    if length and len(text) > length:
+        start = max((match.start() if match else 0) - length // 4, 0)
+        text = ('…' if start else '') + text[start:start + length] + ('…' if start + length < len(text) else '')
+    if not pattern:
+        return escape(text)
+
+    parts = []
+    last = 0
+    for m in re.finditer(pattern, text, re.IGNORECASE):
+        parts.append(escape(text[last:m.start()]))
+        parts.append(f'<mark>{escape(m.group())}</mark>')
+        last = m.end()
+    parts.append(escape(text[last:]))
+    return ''.join(parts)
+
+
+class SearchHighlightMixin(serializers.Serializer):
+    """
+    ?search= 요청일 때 highlight 필드 추가
+    Meta.highlight_fields = {'필드명': 스니펫 길이 또는 None(전체)}
+    """
+    highlight = serializers.SerializerMethodField()
+
+    def get_highlight(self, obj):
+        request = self.context.get('request')
+        terms = request.query_params.get('search', '') if request else ''
+        words = WORD_RE.findall(terms)
+        if not words:
+            return None
+        return {
+            field: highlight(getattr(obj, field), words, length)
+            for field, length in self.Meta.highlight_fields.items()
+        }
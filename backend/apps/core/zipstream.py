@@ -0,0 +1,189 @@
+"""
+무압축(stored) ZIP 스트리밍
+
+스토리지 파일을 다시 압축하지 않고 ZIP 구조만 붙여 바로 전송한다 (임시 파일 없음, 메모리 일정).
+- 각 항목은 데이터 기술자(data descriptor) 방식: CRC는 데이터를 보낸 뒤에 기록
+  → 파일 이름·크기만으로 전체 바이트 배치가 정해지므로 Content-Length와 Range(이어받기) 지원
+- 이어받기로 앞 파일을 건너뛰면 그 CRC는 캐시(없으면 파일을 읽어 계산)에서 가져옴
+- 오프셋/항목 수가 ZIP 한도를 넘으면 ZIP64 레코드 사용 (항목 하나는 4GB 미만만)
+"""
+import hashlib
+import struct
+import zlib
+from collections import namedtuple
+
+from django.core.cache import cache
+
+CHUNK_SIZE = 64 * 1024
+CRC_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+MAX_ENTRY_SIZE = 0xFFFFFFFF - 1
+
+FLAGS = 0x08 | 0x800  # 데이터 기술자 사용 + UTF-8 파일명
+VERSION = 20
+VERSION_ZIP64 = 45
+MADE_BY = (3 << 8) | VERSION_ZIP64  # Unix
+EXTERNAL_ATTR = 0o100644 << 16
+
+LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+DATA_DESCRIPTOR = struct.Struct('<IIII')
+CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+ZIP64_OFFSET_EXTRA = struct.Struct('<HHQ')
+ZIP64_END = struct.Struct('<IQHHIIQQQQ')
+ZIP64_LOCATOR = struct.Struct('<IIQI')
+END_RECORD = struct.Struct('<IHHHHIIH')
+
+ZipEntry = namedtuple('ZipEntry', 'arcname source size modified')
+
+
+def dos_datetime(value):
+    """datetime → (DOS 시각, DOS 날짜)"""
+    year = min(max(value.year, 1980), 2107)
+    return (
+        (value.hour << 11) | (value.minute << 5) | (value.second // 2),
+        ((year - 1980) << 9) | (value.month << 5) | value.day,
+    )
+
+
+class StoredZipStream:
+    """
+    ZipEntry 목록(스토리지 경로·크기·수정 시각)으로 만드는 무압축 ZIP
+    - size: 전체 바이트 수 / etag: 배치(이름·크기·시각)가 같으면 같은 값
+    - stream(start, end): [start, end] 구간 바이트 생성기
+    """
+
+    def __init__(self, entries, storage):
+        self.entries = list(entries)
+        self.storage = storage
+        self.crcs = {}
+        self.offsets = []
+        position = 0
+        for entry in self.entries:
+            if entry.size > MAX_ENTRY_SIZE:
+                raise ValueError(f'ZIP 항목은 4GB 미만이어야 합니다: {entry.source}')
+            self.offsets.append(position)
+            position += LOCAL_HEADER.size + len(self.encoded_name(entry)) + entry.size + DATA_DESCRIPTOR.size
+        self.central_offset = position
+        self.central_size = sum(
+            CENTRAL_HEADER.size + len(self.encoded_name(entry)) + len(self.offset_extra(offset))
+            for entry, offset in zip(self.entries, self.offsets)
+        )
+        self.size = self.central_offset + self.central_size + len(self.end_records())
+
+    @property
+    def etag(self):
+        digest = hashlib.md5()
+        for entry in self.entries:
+            digest.update(f'{entry.arcname}\0{entry.source}\0{entry.size}\0{entry.modified.isoformat()}\n'.encode())
+        return f'"{digest.hexdigest()}"'
+
+    def encoded_name(self, entry):
+        return entry.arcname.encode('utf-8')
+
+    def offset_extra(self, offset):
+        return ZIP64_OFFSET_EXTRA.pack(0x0001, 8, offset) if offset >= 0xFFFFFFFF else b''
+
+    def local_header(self, entry):
+        name = self.encoded_name(entry)
+        time, date = dos_datetime(entry.modified)
+        return LOCAL_HEADER.pack(0x04034B50, VERSION, FLAGS, 0, time, date, 0, 0, 0, len(name), 0) + name
+
+    def data_descriptor(self, index):
+        size = self.entries[index].size
+        return DATA_DESCRIPTOR.pack(0x08074B50, self.crc(index), size, size)
+
+    def central_directory(self):
+        parts = []
+        for index, (entry, offset) in enumerate(zip(self.entries, self.offsets)):
+            name = self.encoded_name(entry)
+            extra = self.offset_extra(offset)
+            time, date = dos_datetime(entry.modified)
+            parts.append(CENTRAL_HEADER.pack(
+                0x02014B50, MADE_BY, VERSION_ZIP64 if extra else VERSION, FLAGS, 0, time, date,
+                self.crc(index), entry.size, entry.size, len(name), len(extra), 0, 0, 0,
+                EXTERNAL_ATTR, min(offset, 0xFFFFFFFF),
+            ) + name + extra)
+        return b''.join(parts)
+
+    def end_records(self):
+        count = len(self.entries)
+        records = b''
+        if count >= 0xFFFF or self.central_offset >= 0xFFFFFFFF or self.central_size >= 0xFFFFFFFF:
+            zip64_offset = self.central_offset + self.central_size
+            records += ZIP64_END.pack(
+                0x06064B50, ZIP64_END.size - 12, MADE_BY, VERSION_ZIP64, 0, 0,
+                count, count, self.central_size, self.central_offset,
+            )
+            records += ZIP64_LOCATOR.pack(0x07064B50, 0, zip64_offset, 1)
+        return records + END_RECORD.pack(
+            0x06054B50, 0, 0, min(count, 0xFFFF), min(count, 0xFFFF),
+            min(self.central_size, 0xFFFFFFFF), min(self.central_offset, 0xFFFFFFFF), 0,
+        )
+
+    def crc_cache_key(self, entry):
+        return 'zipcrc:' + hashlib.md5(f'{entry.source}\0{entry.size}'.encode('utf-8')).hexdigest()
+
+    def crc(self, index):
+        """항목 CRC32 - 전송하면서 계산한 값 → 캐시 → 파일 읽어서 계산 순"""
+        if index not in self.crcs:
+            entry = self.entries[index]
+            value = cache.get(self.crc_cache_key(entry))
+            if value is None:
+                value = 0
+                for chunk in self.read(entry, 0, entry.size - 1):
+                    value = zlib.crc32(chunk, value)
+                cache.set(self.crc_cache_key(entry), value, CRC_CACHE_TIMEOUT)
+            self.crcs[index] = value
+        return self.crcs[index]
+
+    def read(self, entry, first, last):
+        """스토리지 파일의 [first, last] 구간 (크기가 목록과 다르면 OSError)"""
+        remaining = last - first + 1
+        if remaining <= 0:
+            return
+        with self.storage.open(entry.source, 'rb') as f:
+            f.seek(first)
+            while remaining > 0:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise OSError(f'ZIP 생성 중 파일 크기가 바뀌었습니다: {entry.source}')
+                remaining -= len(chunk)
+                yield chunk
+
+    def stream(self, start=0, end=None):
+        end = self.size - 1 if end is None else end
+        position = 0
+        for index, entry in enumerate(self.entries):
+            if position > end:
+                return
+            header = self.local_header(entry)
+            yield from self.clip(header, position, start, end)
+            position += len(header)
+
+            first, last = max(start - position, 0), min(end - position, entry.size - 1)
+            if first <= last:
+                if first == 0 and last == entry.size - 1 and index not in self.crcs:
+                    # 파일 전체를 보내는 경우 전송하면서 CRC 계산
+                    value = 0
+                    for chunk in self.read(entry, first, last):
+                        value = zlib.crc32(chunk, value)
+                        yield chunk
+                    self.crcs[index] = value
+                    cache.set(self.crc_cache_key(entry), value, CRC_CACHE_TIMEOUT)
+                else:
+                    yield from self.read(entry, first, last)
+            position += entry.size
+
+            if position + DATA_DESCRIPTOR.size > start and position <= end:
+                yield from self.clip(self.data_descriptor(index), position, start, end)
+            position += DATA_DESCRIPTOR.size
+
+        if position <= end:
+            yield from self.clip(self.central_directory() + self.end_records(), position, start, end)
+
+    def clip(self, data, position, start, end):
+        """position에서 시작하는 data 중 [start, end]에 해당하는 부분"""
+        if position + len(data) <= start or position > end:
+            return
+        chunk = data[max(start - position, 0):end - position + 1]
+        if chunk:
+            yield chunk
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+class FrontendConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.frontend'
+    verbose_name = '프론트엔드'
+
+    def ready(self):
+        # 서버 시작 시 라우트 테이블을 미리 구성
+        from .routes import route_table
+        route_table.refresh()
@@ -0,0 +1,133 @@
+"""
+프론트엔드 배포용 빌드
+
+    python manage.py collectfrontend
+    python manage.py collectfrontend --clear --no-compress
+
+루트 폴더의 HTML/CSS/JS를 FRONTEND_BUILD_DIR로 복사하면서
+- CSS/JS를 압축하고 내용 해시가 붙은 이름(style.3f2a9c1b04de.css)으로도 저장
+- 모든 HTML의 <link>/<script> 참조를 해시 이름으로 변경
+- 원본 경로 → 해시 경로 매핑을 manifest.json에 기록
+빌드 폴더에 manifest.json이 있으면 serve_frontend가 빌드 폴더를 서빙하고,
+해시가 붙은 파일은 immutable 캐시로 응답한다.
+"""
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from apps.frontend.minify import minify_css, minify_js
+from apps.frontend.routes import MANIFEST_NAME, RouteTable
+
+# 해시 이름을 붙일 파일 (HTML은 URL이 고정되어야 하므로 제외)
+HASHED_EXTENSIONS = {
+    '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico',
+    '.woff', '.woff2', '.ttf',
+}
+
+HTML_REF_RE = re.compile(r'''(<(?:link|script|img)\b[^>]*?\b(?:href|src)=)(["'])([^"']+)\2''', re.IGNORECASE)
+CSS_URL_RE = re.compile(r'''url\(\s*(["']?)([^"')]+)\1\s*\)''')
+
+
+def hashed_name(rel_path, content):
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    base, ext = posixpath.splitext(rel_path)
+    return f'{base}.{digest}{ext}'
+
+
+def rewrite_url(url, base_dir, manifest):
+    """상대/절대 경로 참조를 해시 이름으로 변환 (외부 URL은 그대로)"""
+    if re.match(r'^([a-z][a-z0-9+.-]*:|//|#)', url, re.IGNORECASE):
+        return url
+    path, suffix = re.match(r'^([^?#]*)(.*)$', url, re.DOTALL).groups()
+    if path.startswith('/'):
+        target = posixpath.normpath(path.lstrip('/'))
+    else:
+        target = posixpath.normpath(posixpath.join(base_dir, path))
+    hashed = manifest.get(target)
+    if not hashed:
+        return url
+    return path[:path.rfind('/') + 1] + posixpath.basename(hashed) + suffix
+
+
+class Command(BaseCommand):
+    help = '프론트엔드 HTML/CSS/JS를 압축·해시 처리하여 빌드 폴더로 복사'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clear', action='store_true', help='빌드 폴더를 비우고 새로 생성')
+        parser.add_argument('--no-compress', action='store_true', help='.gz / .br 압축본을 만들지 않음')
+
+    def handle(self, *args, **options):
+        source_root = str(settings.FRONTEND_DIR)
+        build_root = str(settings.FRONTEND_BUILD_DIR)
+
+        if options['clear'] and os.path.isdir(build_root):
+            shutil.rmtree(build_root)
+        os.makedirs(build_root, exist_ok=True)
+
+        files = {}
+        for route in RouteTable(root=source_root).files():
+            rel_path = os.path.relpath(route.path, source_root).replace(os.sep, '/')
+            with open(route.path, 'rb') as f:
+                files[rel_path] = f.read()
+
+        # 참조 관계 순서대로 처리: 이미지/폰트 → CSS(url 참조) → JS → HTML(link/script 참조)
+        def build_order(rel_path):
+            ext = posixpath.splitext(rel_path)[1].lower()
+            return {'.css': 1, '.js': 2, '.html': 3}.get(ext, 0), rel_path
+
+        manifest = {}
+        outputs = {}
+        for rel_path in sorted(files, key=build_order):
+            content = files[rel_path]
+            ext = posixpath.splitext(rel_path)[1].lower()
+            base_dir = posixpath.dirname(rel_path)
+
+            if ext == '.css':
+                text = CSS_URL_RE.sub(
+                    lambda m: f'url({m.group(1)}{rewrite_url(m.group(2), base_dir, manifest)}{m.group(1)})',
+                    content.decode('utf-8')
+                )
+                content = minify_css(text).encode('utf-8')
+            elif ext == '.js':
+                content = minify_js(content.decode('utf-8')).encode('utf-8')
+            elif ext == '.html':
+                content = HTML_REF_RE.sub(
+                    lambda m: m.group(1) + m.group(2) + rewrite_url(m.group(3), base_dir, manifest) + m.group(2),
+                    content.decode('utf-8')
+                ).encode('utf-8')
+
+            outputs[rel_path] = content
+            if ext in HASHED_EXTENSIONS:
+                manifest[rel_path] = hashed_name(rel_path, content)
+                outputs[manifest[rel_path]] = content
+
+        for rel_path, content in outputs.items():
+            self._write(build_root, rel_path, content)
+
+        # manifest는 마지막에 기록 - serve_frontend는 manifest가 있을 때만 빌드 폴더를 사용
+        manifest_data = json.dumps({'version': 1, 'files': manifest}, indent=2, sort_keys=True)
+        self._write(build_root, MANIFEST_NAME, manifest_data.encode('utf-8'))
+
+        self.stdout.write(f'{len(files)}개 파일, 해시 파일 {len(manifest)}개 → {build_root}')
+        if not options['no_compress']:
+            call_command('compressfrontend', root=build_root, stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS('프론트엔드 빌드가 완료되었습니다.'))
+
+    def _write(self, root, rel_path, content):
+        path = os.path.join(root, *rel_path.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                if f.read() == content:
+                    return  # 변경 없는 파일은 mtime 유지 (ETag/압축본 재사용)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
@@ -0,0 +1,96 @@
+"""
+프론트엔드 정적 파일 사전 압축
+
+    python manage.py compressfrontend
+    python manage.py compressfrontend --force
+
+HTML/CSS/JS 파일 옆에 .gz / .br 압축본을 만들어 두면
+serve_frontend가 Accept-Encoding에 맞춰 가장 작은 파일로 응답한다.
+brotli 패키지가 설치되어 있지 않으면 .gz만 생성한다.
+"""
+import gzip
+import os
+
+from django.core.management.base import BaseCommand
+
+from apps.frontend.routes import ENCODINGS, RouteTable, route_table
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_SIZE = 256  # 이보다 작은 파일은 압축 이득이 없음
+
+
+def compress_gzip(data):
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_brotli(data):
+    return brotli.compress(data, quality=11)
+
+
+def get_compressors():
+    compressors = {'gzip': compress_gzip}
+    if brotli is not None:
+        compressors['br'] = compress_brotli
+    return compressors
+
+
+def compress_route(route, compressors, force=False):
+    """파일 하나의 압축본 생성. (인코딩, 원본 크기, 압축 크기) 목록 반환"""
+    results = []
+    data = None
+    for suffix, encoding in ENCODINGS.items():
+        compress = compressors.get(encoding)
+        if compress is None:
+            continue
+        target = route.path + suffix
+        if not force and os.path.exists(target) and os.stat(target).st_mtime_ns >= route.mtime_ns:
+            continue
+
+        if data is None:
+            with open(route.path, 'rb') as f:
+                data = f.read()
+        compressed = compress(data)
+        if len(compressed) >= len(data):
+            if os.path.exists(target):
+                os.remove(target)
+            continue
+
+        tmp_path = target + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, target)
+        # 원본과 같은 mtime으로 맞춰 두면 원본이 수정됐을 때 오래된 압축본으로 판단됨
+        os.utime(target, ns=(route.mtime_ns, route.mtime_ns))
+        results.append((encoding, len(data), len(compressed)))
+    return results
+
+
+class Command(BaseCommand):
+    help = '프론트엔드 HTML/CSS/JS 파일의 .gz / .br 압축본 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--root', help='대상 폴더 (기본값: FRONTEND_DIR)')
+        parser.add_argument('--force', action='store_true', help='최신 압축본이 있어도 다시 생성')
+
+    def handle(self, *args, **options):
+        table = RouteTable(root=options['root']) if options['root'] else route_table
+        compressors = get_compressors()
+        if 'br' not in compressors:
+            self.stdout.write(self.style.WARNING('brotli 패키지가 없어 .gz 파일만 생성합니다.'))
+
+        count = 0
+        for route in table.files():
+            if route.size < MIN_SIZE or not route.content_type.startswith(COMPRESSIBLE_TYPES):
+                continue
+            for encoding, original, compressed in compress_route(route, compressors, options['force']):
+                count += 1
+                rel_path = os.path.relpath(route.path, table.root)
+                self.stdout.write(f'  {rel_path} [{encoding}] {original:,} → {compressed:,} bytes')
+
+        table.refresh()
+        self.stdout.write(self.style.SUCCESS(f'{count}개의 압축 파일을 생성했습니다.'))
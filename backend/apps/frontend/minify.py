@@ -0,0 +1,177 @@
+"""
+CSS / JS 경량 압축 (collectfrontend 빌드용)
+
+외부 도구 없이 안전하게 줄일 수 있는 부분만 처리한다.
+- CSS: 주석 제거, 공백 축소
+- JS: 주석 제거, 들여쓰기/빈 줄 제거 (줄바꿈은 유지 - 자동 세미콜론 삽입 보호)
+문자열, 템플릿 리터럴, 정규식 리터럴 내부는 건드리지 않는다.
+"""
+import re
+
+# 이 문자/키워드 뒤의 '/'는 나눗셈이 아니라 정규식 리터럴의 시작
+REGEX_PRECEDING_CHARS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_PRECEDING_WORDS = {
+    'return', 'typeof', 'instanceof', 'case', 'do', 'else', 'in', 'of',
+    'new', 'delete', 'void', 'throw', 'yield', 'await',
+}
+
+CSS_SPACE_RE = re.compile(r'\s+')
+CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,>])\s*')
+CSS_COLON_RE = re.compile(r':\s+')
+
+
+def _skip_quoted(source, i):
+    """따옴표 문자열의 끝 위치 (닫는 따옴표 다음 인덱스)"""
+    quote = source[i]
+    i += 1
+    n = len(source)
+    while i < n:
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == quote or (c == '\n' and quote != '`'):
+            return i + 1
+        if quote == '`' and source.startswith('${', i):
+            i = _skip_template_expression(source, i + 2)
+            continue
+        i += 1
+    return n
+
+
+def _skip_template_expression(source, i):
+    """템플릿 리터럴의 ${ ... } 구간 끝 위치"""
+    depth = 1
+    n = len(source)
+    while i < n:
+        c = source[i]
+        if c in '\'"`':
+            i = _skip_quoted(source, i)
+            continue
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def _skip_regex(source, i):
+    """정규식 리터럴의 끝 위치 (플래그 포함)"""
+    i += 1
+    n = len(source)
+    in_class = False
+    while i < n:
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            return i
+        if c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            i += 1
+            while i < n and (source[i].isalnum() or source[i] == '_'):
+                i += 1
+            return i
+        i += 1
+    return n
+
+
+def minify_js(source):
+    lines = []
+    line = []
+    last_char = ''
+    last_word = ''
+    i = 0
+    n = len(source)
+
+    while i < n:
+        c = source[i]
+
+        if c in '\'"`':
+            end = _skip_quoted(source, i)
+            line.append(source[i:end])
+            last_char, last_word = c, ''
+            i = end
+            continue
+
+        if c == '/' and source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end == -1 else end
+            continue
+
+        if c == '/' and source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            comment = source[i:n if end == -1 else end + 2]
+            i = n if end == -1 else end + 2
+            if '\n' in comment:
+                lines.append(''.join(line))
+                line = []
+            else:
+                line.append(' ')
+            continue
+
+        if c == '/' and (not last_char or last_char in REGEX_PRECEDING_CHARS
+                         or last_word in REGEX_PRECEDING_WORDS):
+            end = _skip_regex(source, i)
+            line.append(source[i:end])
+            last_char, last_word = '/', ''
+            i = end
+            continue
+
+        if c == '\n':
+            lines.append(''.join(line))
+            line = []
+            i += 1
+            continue
+
+        line.append(c)
+        if c.isalnum() or c in '_$':
+            last_word = last_word + c if last_char.isalnum() or last_char in '_$' else c
+            last_char = c
+        elif not c.isspace():
+            last_char, last_word = c, ''
+        i += 1
+
+    lines.append(''.join(line))
+    return '\n'.join(stripped for stripped in (l.strip() for l in lines) if stripped) + '\n'
+
+
+def _compact_css(code):
+    code = CSS_SPACE_RE.sub(' ', code)
+    code = CSS_PUNCTUATION_RE.sub(r'\1', code)
+    code = CSS_COLON_RE.sub(':', code)
+    return code.replace(';}', '}')
+
+
+def minify_css(source):
+    parts = []
+    code = []
+    i = 0
+    n = len(source)
+
+    while i < n:
+        c = source[i]
+        if c in '\'"':
+            end = _skip_quoted(source, i)
+            parts.append(_compact_css(''.join(code)))
+            parts.append(source[i:end])
+            code = []
+            i = end
+            continue
+        if source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            code.append(' ')
+            i = n if end == -1 else end + 2
+            continue
+        code.append(c)
+        i += 1
+    parts.append(_compact_css(''.join(code)))
+
+    return ''.join(parts).strip() + '\n'
@@ -0,0 +1,207 @@
+"""
+이미지 리사이즈 디스크 캐시 (/media/resize/<너비>x<높이>/<형식>/<경로>)
+
+업로드 이미지(ImageField 업로드 경로)를 첫 요청 때 변환해 IMAGE_RESIZE_CACHE_DIR에 저장하고,
+이후 요청은 저장된 파일을 send_file로 전송한다 (X-Accel-Redirect 위임 가능).
+- 크기: IMAGE_RESIZE_SIZES 목록만 허용, 높이 0이면 너비 기준 비율 유지, 둘 다 있으면 가운데를 잘라 맞춤
+- 원본보다 크게 확대하지 않음
+- 캐시 파일명: 원본 경로·크기·수정 시각의 해시 + 크기/형식
+  (삭제 후 같은 이름으로 다시 올린 파일은 다른 캐시 파일, 원본이 없으면 캐시가 남아 있어도 404)
+- 같은 파일을 동시에 요청하면 잠금 파일로 한 번만 변환
+- 캐시 용량이 IMAGE_RESIZE_CACHE_MAX_BYTES를 넘으면 오래 사용하지 않은 파일부터 삭제 (LRU)
+  사용 시각은 접근 시각(atime)에 기록 - 수정 시각(mtime)은 응답 ETag/Last-Modified에 쓰이므로 그대로 둠
+"""
+import hashlib
+import os
+import threading
+import time
+from functools import lru_cache
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import models
+from PIL import Image, ImageOps
+
+from apps.core.images import encode_image, format_supported, open_image
+
+LOCK_TIMEOUT = 60  # 이 시간이 지난 잠금 파일은 변환 중 종료된 것으로 보고 제거
+LOCK_POLL_INTERVAL = 0.05
+TOUCH_INTERVAL = 60 * 60  # 사용 시각(atime) 갱신 주기 - 캐시 적중마다 쓰지 않도록
+EVICT_RATIO = 0.9  # 정리 시 용량의 90%까지 삭제
+
+
+class ResizeNotAllowed(Exception):
+    """허용하지 않는 크기/형식/경로"""
+
+
+@lru_cache
+def upload_prefixes():
+    """ImageField의 upload_to 고정 접두사 (날짜 형식 앞부분) - 리사이즈 허용 경로"""
+    prefixes = set()
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, models.ImageField) and isinstance(field.upload_to, str):
+                prefix = field.upload_to.split('%')[0]
+                if prefix:
+                    prefixes.add(prefix.rstrip('/') + '/')
+    return tuple(sorted(prefixes))
+
+
+def allowed_sizes():
+    sizes = set()
+    for size in getattr(settings, 'IMAGE_RESIZE_SIZES', []):
+        width, height = size.split('x')
+        sizes.add((int(width), int(height)))
+    return sizes
+
+
+def resize_image(image, width, height):
+    """높이 0: 너비 기준 비율 유지 / 둘 다 지정: 가운데 기준으로 비율을 맞춰 자름 (확대 없음)"""
+    if not height:
+        if image.width <= width:
+            return image
+        return image.resize((width, max(round(image.height * width / image.width), 1)), Image.Resampling.LANCZOS)
+    ratio = width / height
+    crop_width = min(image.width, round(image.height * ratio))
+    if crop_width < width:
+        # 원본이 더 작으면 비율만 맞춰 자름
+        width, height = crop_width, max(round(crop_width / ratio), 1)
+    return ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+
+
+class ResizeCache:
+    """리사이즈 결과 디스크 캐시 (프로세스 간에는 파일시스템으로 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._size = None  # 캐시 폴더 전체 크기 추정값 (처음 필요할 때 계산)
+
+    @property
+    def root(self):
+        return str(settings.IMAGE_RESIZE_CACHE_DIR)
+
+    @property
+    def max_bytes(self):
+        return getattr(settings, 'IMAGE_RESIZE_CACHE_MAX_BYTES', 1024 ** 3)
+
+    def validate(self, path, width, height, fmt):
+        if (width, height) not in allowed_sizes():
+            raise ResizeNotAllowed(f'허용하지 않는 크기: {width}x{height}')
+        if fmt not in getattr(settings, 'IMAGE_RESIZE_FORMATS', []) or not format_supported(fmt):
+            raise ResizeNotAllowed(f'허용하지 않는 형식: {fmt}')
+        if '..' in path.split('/') or not path.startswith(upload_prefixes()):
+            raise ResizeNotAllowed(f'허용하지 않는 경로: {path}')
+
+    def source_key(self, path):
+        """원본 식별값 - 경로 + 크기 + 수정 시각 (원본이 없으면 OSError)"""
+        size = default_storage.size(path)
+        modified = default_storage.get_modified_time(path).timestamp()
+        return f'{path}\0{size}\0{modified}'
+
+    def cache_path(self, source_key, width, height, fmt):
+        digest = hashlib.sha256(source_key.encode('utf-8')).hexdigest()
+        return os.path.join(self.root, digest[:2], f'{digest}-{width}x{height}.{fmt}')
+
+    def get(self, path, width, height, fmt):
+        """
+        캐시 파일 경로 (없으면 변환 후 저장)
+        원본이 없거나 이미지가 아니면 OSError / ResizeNotAllowed
+        """
+        self.validate(path, width, height, fmt)
+        target = self.cache_path(self.source_key(path), width, height, fmt)
+        if self._touch(target):
+            return target
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        lock = target + '.lock'
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                # 다른 요청(프로세스)이 변환 중 - 끝날 때까지 대기
+                if os.path.exists(target):
+                    return target
+                if time.monotonic() > deadline or self._lock_expired(lock):
+                    self._remove(lock)
+                    deadline = time.monotonic() + LOCK_TIMEOUT
+                time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            if not os.path.exists(target):
+                self._render(path, width, height, fmt, target)
+        finally:
+            os.close(fd)
+            self._remove(lock)
+        return target
+
+    def _render(self, path, width, height, fmt, target):
+        image, _, icc_profile = open_image(path, max_side=max(width, height))
+        data = encode_image(resize_image(image, width, height), fmt, icc_profile)
+        temp = f'{target}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, target)
+        self._added(len(data))
+
+    def _touch(self, target):
+        """캐시 적중 시 사용 시각(atime) 갱신 - mtime은 유지, 파일이 없으면 False"""
+        try:
+            st = os.stat(target)
+        except FileNotFoundError:
+            return False
+        if time.time() - st.st_atime > TOUCH_INTERVAL:
+            try:
+                os.utime(target, ns=(time.time_ns(), st.st_mtime_ns))
+            except OSError:
+                pass
+        return True
+
+    def _lock_expired(self, lock):
+        try:
+            return time.time() - os.stat(lock).st_mtime > LOCK_TIMEOUT
+        except FileNotFoundError:
+            return False
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _added(self, size):
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._scan())
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._size = self.evict(int(self.max_bytes * EVICT_RATIO))
+
+    def _scan(self):
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if name.endswith(('.lock', '.tmp')):
+                    continue
+                full_path = os.path.join(directory, name)
+                try:
+                    st = os.stat(full_path)
+                except FileNotFoundError:
+                    continue
+                # 사용 시각: atime (noatime 마운트여도 _touch의 utime은 기록됨)
+                yield full_path, st.st_size, max(st.st_atime, st.st_mtime)
+
+    def evict(self, budget):
+        """오래 사용하지 않은 파일부터 삭제해 budget 바이트 이하로 만들고 남은 크기 반환"""
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for full_path, size, _ in entries:
+            if total <= budget:
+                break
+            self._remove(full_path)
+            total -= size
+        return total
+
+
+resize_cache = ResizeCache()
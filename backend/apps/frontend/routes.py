@@ -0,0 +1,272 @@
+"""
+프론트엔드 라우트 테이블
+
+- 서버 시작 시 프론트엔드 폴더를 한 번 훑어서 URL 경로 → 파일 정보를 메모리에 보관
+- 요청마다 파일시스템을 조회하지 않고, 일정 주기로 mtime만 확인해 변경 시 재구성
+- collectfrontend 빌드(manifest.json)가 있으면 빌드 폴더를 우선 사용
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.utils.http import http_date
+
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+    '.ttf': 'font/ttf',
+}
+
+# 프론트엔드로 서빙하지 않는 폴더 (백엔드 소스, 문서 등)
+EXCLUDED_DIRS = {'backend', 'docs', 'node_modules', 'venv'}
+
+# collectfrontend가 빌드 폴더에 기록하는 원본 → 해시 파일명 매핑
+MANIFEST_NAME = 'manifest.json'
+
+# 미리 압축해 둔 파일 확장자 → Content-Encoding (compressfrontend 명령으로 생성)
+ENCODINGS = {
+    '.br': 'br',
+    '.gz': 'gzip',
+}
+
+
+class Variant:
+    """미리 압축된 파일 (.gz / .br)"""
+    __slots__ = ('path', 'encoding', 'size')
+
+    def __init__(self, path, encoding, size):
+        self.path = path
+        self.encoding = encoding
+        self.size = size
+
+
+class Route:
+    """URL 경로 하나에 대응하는 파일 정보"""
+    __slots__ = ('path', 'content_type', 'size', 'mtime_ns', 'digest', 'variants', 'immutable')
+
+    def __init__(self, path, content_type, size, mtime_ns, digest, variants=None, immutable=False):
+        self.path = path
+        self.content_type = content_type
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.digest = digest
+        self.variants = variants or {}
+        self.immutable = immutable  # 내용 해시가 파일명에 포함된 빌드 파일
+
+    @property
+    def mtime(self):
+        return self.mtime_ns // 1_000_000_000
+
+    @property
+    def etag(self):
+        return f'"{self.digest[:32]}"'
+
+    @property
+    def last_modified(self):
+        return http_date(self.mtime)
+
+    def select_variant(self, accept_encoding):
+        """Accept-Encoding에서 허용된 압축본 중 가장 작은 것 (원본이 가장 작으면 None)"""
+        accepted = parse_accept_encoding(accept_encoding)
+        best = None
+        for encoding, variant in self.variants.items():
+            if not accepted.get(encoding, accepted.get('*', 0)):
+                continue
+            if variant.size < (best.size if best else self.size):
+                best = variant
+        return best
+
+    def variant_etag(self, variant):
+        if variant is None:
+            return self.etag
+        return f'"{self.digest[:32]}-{variant.encoding}"'
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 헤더를 {인코딩: q값} 으로 변환"""
+    accepted = {}
+    for item in (header or '').split(','):
+        encoding, _, params = item.strip().partition(';')
+        encoding = encoding.strip().lower()
+        if not encoding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[encoding] = q
+    return accepted
+
+
+def file_digest(path):
+    """파일 내용의 sha256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RouteTable:
+    """
+    프론트엔드 파일 라우트 테이블
+    - resolve(): URL 경로를 Route로 변환 (없으면 None)
+    - check_interval 초마다 폴더/파일 mtime을 비교해 변경이 있으면 재구성
+    """
+
+    def __init__(self, root=None, check_interval=None):
+        self._root = root
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._routes = None
+        self._signature = None
+        self._checked_at = 0.0
+
+    @property
+    def root(self):
+        if self._root:
+            return str(self._root)
+        build_dir = getattr(settings, 'FRONTEND_BUILD_DIR', None)
+        if build_dir and os.path.isfile(os.path.join(build_dir, MANIFEST_NAME)):
+            return str(build_dir)
+        return str(settings.FRONTEND_DIR)
+
+    @property
+    def check_interval(self):
+        if self._check_interval is not None:
+            return self._check_interval
+        return getattr(settings, 'FRONTEND_ROUTE_CHECK_INTERVAL', 2)
+
+    def resolve(self, path):
+        routes = self._routes
+        if routes is None or time.monotonic() - self._checked_at >= self.check_interval:
+            routes = self.refresh(force=False)
+
+        path = (path or '').lstrip('/')
+        route = routes.get(path)
+        if route is None and path.endswith('/'):
+            route = routes.get(path.rstrip('/'))
+        return route
+
+    def files(self):
+        """서빙 중인 파일 목록 (별칭 중복 제외)"""
+        routes = self.refresh(force=False)
+        return sorted({route.path: route for route in routes.values()}.values(), key=lambda r: r.path)
+
+    def refresh(self, force=True):
+        """변경이 있으면(또는 force) 라우트 테이블 재구성"""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            signature = self._scan()
+            if force or self._routes is None or signature != self._signature:
+                self._routes = self._build(signature)
+                self._signature = signature
+            return self._routes
+
+    def invalidate(self):
+        with self._lock:
+            self._routes = None
+            self._signature = None
+
+    def _scan(self):
+        """서빙 대상 파일 목록과 mtime/크기 (폴더 mtime 포함 - 파일 추가/삭제 감지용)"""
+        root = self.root
+        entries = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(
+                d for d in dirnames
+                if not d.startswith('.') and not (dirpath == root and d in EXCLUDED_DIRS)
+            )
+            stat = os.stat(dirpath)
+            entries.append((dirpath, None, stat.st_mtime_ns))
+            for name in sorted(filenames):
+                base, ext = os.path.splitext(name.lower())
+                if ext in ENCODINGS:
+                    ext = os.path.splitext(base)[1]
+                if name.startswith('.') or ext not in CONTENT_TYPES:
+                    continue
+                if dirpath == root and name == MANIFEST_NAME:
+                    continue
+                full_path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(full_path)
+                except OSError:
+                    continue
+                entries.append((full_path, stat.st_size, stat.st_mtime_ns))
+        return tuple(entries)
+
+    def _load_hashed_files(self, root):
+        """manifest.json에 기록된 해시 파일 경로 목록"""
+        try:
+            with open(os.path.join(root, MANIFEST_NAME), encoding='utf-8') as f:
+                return set(json.load(f).get('files', {}).values())
+        except (OSError, ValueError):
+            return set()
+
+    def _build(self, signature):
+        root = self.root
+        previous = {route.path: route for route in (self._routes or {}).values()}
+        hashed_files = self._load_hashed_files(root)
+        routes = {}
+        aliases = {}
+
+        # 압축본은 원본보다 오래되지 않은 경우에만 사용
+        files = {full_path: (size, mtime_ns) for full_path, size, mtime_ns in signature if size is not None}
+        variants = {}
+        for full_path, (size, mtime_ns) in files.items():
+            base, ext = os.path.splitext(full_path)
+            source = files.get(base)
+            if ext.lower() in ENCODINGS and source and mtime_ns >= source[1]:
+                encoding = ENCODINGS[ext.lower()]
+                variants.setdefault(base, {})[encoding] = Variant(full_path, encoding, size)
+
+        for full_path, (size, mtime_ns) in files.items():
+            ext = os.path.splitext(full_path)[1].lower()
+            if ext in ENCODINGS:
+                continue
+            old = previous.get(full_path)
+            if old and old.size == size and old.mtime_ns == mtime_ns:
+                digest = old.digest
+            else:
+                try:
+                    digest = file_digest(full_path)
+                except OSError:
+                    continue
+            rel_path = os.path.relpath(full_path, root).replace(os.sep, '/')
+            route = Route(
+                full_path, CONTENT_TYPES[ext], size, mtime_ns, digest,
+                variants=variants.get(full_path),
+                immutable=rel_path in hashed_files,
+            )
+            routes[rel_path] = route
+
+            # .html 확장자 없이 요청된 경우
+            if rel_path.endswith('.html'):
+                aliases[rel_path[:-len('.html')]] = route
+            # 디렉토리 요청이면 index.html
+            if os.path.basename(rel_path) == 'index.html':
+                aliases[os.path.dirname(rel_path)] = route
+
+        for key, route in aliases.items():
+            routes.setdefault(key, route)
+        return routes
+
+
+route_table = RouteTable()
@@ -0,0 +1,153 @@
+"""
+파일 전송 위임 (X-Accel-Redirect / X-Sendfile)
+
+권한·경로 확인은 Django에서 하고, 실제 바이트 전송은 앞단 프록시에 맡긴다.
+
+FILE_OFFLOAD_MODE
+- None: Django가 직접 전송 (Range 요청 지원)
+- 'x-accel-redirect': nginx internal location으로 위임 (FILE_OFFLOAD_LOCATIONS 매핑 사용)
+- 'x-sendfile': Apache mod_xsendfile / lighttpd 등에 절대 경로로 위임
+
+nginx 예시:
+    location /_protected/media/ {
+        internal;
+        alias /srv/yugwan/backend/media/;
+    }
+"""
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import FileResponse, HttpResponse
+from django.utils.http import http_date, parse_http_date_safe
+
+OFFLOAD_MODES = ('x-accel-redirect', 'x-sendfile')
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def get_offload_mode():
+    mode = getattr(settings, 'FILE_OFFLOAD_MODE', None)
+    if mode and mode not in OFFLOAD_MODES:
+        raise ImproperlyConfigured(f'FILE_OFFLOAD_MODE는 {OFFLOAD_MODES} 중 하나여야 합니다: {mode}')
+    return mode or None
+
+
+def get_internal_url(path):
+    """파일 절대 경로 → nginx internal location URL (가장 긴 루트 기준)"""
+    path = os.path.realpath(path)
+    best = None
+    for prefix, root in getattr(settings, 'FILE_OFFLOAD_LOCATIONS', {}).items():
+        root = os.path.realpath(root)
+        if path == root or path.startswith(root + os.sep):
+            if best is None or len(root) > len(best[1]):
+                best = (prefix, root)
+    if best is None:
+        raise ImproperlyConfigured(f'FILE_OFFLOAD_LOCATIONS에 해당 파일의 경로가 없습니다: {path}')
+    prefix, root = best
+    rel_path = os.path.relpath(path, root).replace(os.sep, '/')
+    return prefix.rstrip('/') + '/' + quote(rel_path)
+
+
+def parse_range(header, size):
+    """
+    단일 bytes Range 헤더 해석
+    - (start, end): 부분 응답
+    - None: 전체 응답 (헤더 없음, 형식 오류, 다중 범위)
+    - False: 범위를 만족할 수 없음 (416)
+    """
+    match = RANGE_RE.match((header or '').strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if first:
+        start = int(first)
+        end = int(last) if last else size - 1
+        if start >= size:
+            return False
+        if end < start:
+            return None
+        return start, min(end, size - 1)
+    length = int(last)
+    if length == 0 or size == 0:
+        return False
+    return max(size - length, 0), size - 1
+
+
+def if_range_matches(request, etag, last_modified):
+    """If-Range가 없거나 현재 파일과 일치하면 True"""
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        return bool(etag) and if_range == etag and not etag.startswith('W/')
+    return last_modified is not None and parse_http_date_safe(if_range) == int(last_modified)
+
+
+class RangeFileWrapper:
+    """파일의 [start, end] 구간만 읽어 주는 래퍼 (FileResponse용)"""
+
+    def __init__(self, f, start, end):
+        self.f = f
+        self.f.seek(start)
+        self.remaining = end - start + 1
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.f.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.f.close()
+
+
+def send_file(request, path, content_type, etag=None, last_modified=None, size=None):
+    """
+    파일 응답 생성
+    - 위임 모드면 빈 응답 + X-Accel-Redirect / X-Sendfile 헤더 (Range는 프록시가 처리)
+    - 아니면 FileResponse (단일 Range 요청은 206 부분 응답)
+    """
+    mode = get_offload_mode()
+    if mode:
+        response = HttpResponse(content_type=content_type)
+        if mode == 'x-accel-redirect':
+            response['X-Accel-Redirect'] = get_internal_url(path)
+        else:
+            response['X-Sendfile'] = os.path.realpath(path)
+        # If-Range(날짜) 비교에 쓰이도록 위임 응답에도 Last-Modified 포함
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    f = open(path, 'rb')
+    if size is None:
+        size = os.fstat(f.fileno()).st_size
+
+    byte_range = None
+    if 'HTTP_RANGE' in request.META and if_range_matches(request, etag, last_modified):
+        byte_range = parse_range(request.META['HTTP_RANGE'], size)
+
+    if byte_range is False:
+        f.close()
+        response = HttpResponse(status=416, content_type=content_type)
+        response['Content-Range'] = f'bytes */{size}'
+    elif byte_range:
+        start, end = byte_range
+        response = FileResponse(RangeFileWrapper(f, start, end), status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+    else:
+        response = FileResponse(f, content_type=content_type)
+
+    response['Accept-Ranges'] = 'bytes'
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
@@ -0,0 +1,271 @@
+"""
+업로드 파일 전송 테스트 (apps.frontend.views.serve_media / sendfile)
+
+같은 테스트를 세 가지 전송 방식으로 실행한다.
+- 직접 전송 (FILE_OFFLOAD_MODE = None)
+- X-Accel-Redirect / X-Sendfile: Django 응답을 NginxStub이 받아 실제 파일 응답으로 바꿈
+
+    python manage.py test apps.frontend
+"""
+import os
+import re
+import shutil
+import tempfile
+from urllib.parse import unquote
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils.http import http_date, parse_http_date_safe
+
+from apps.accounts.models import User
+
+from .views import serve_media
+
+DATA = bytes(range(256)) * 4  # 1024바이트
+SCRIPT = b'%PDF-1.4 script'
+
+
+class StubResponse:
+    def __init__(self, status_code, headers, body):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+
+class NginxStub:
+    """
+    앞단 프록시 흉내
+    - X-Accel-Redirect: internal location(FILE_OFFLOAD_LOCATIONS)을 폴더로 바꿔 파일 전송
+    - X-Sendfile: 헤더의 절대 경로 파일 전송
+    - Range / If-Range는 nginx처럼 프록시가 처리 (단일 범위만)
+    - 위임 헤더가 없는 응답은 그대로 전달
+    """
+    RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+    def __init__(self, locations):
+        self.locations = locations
+
+    def resolve(self, response):
+        if response.has_header('X-Accel-Redirect'):
+            uri = response['X-Accel-Redirect']
+            for prefix, root in self.locations.items():
+                if uri.startswith(prefix):
+                    return os.path.join(root, unquote(uri[len(prefix):]))
+            raise AssertionError(f'internal location 없음: {uri}')
+        if response.has_header('X-Sendfile'):
+            return response['X-Sendfile']
+        return None
+
+    def handle(self, request, response):
+        path = self.resolve(response)
+        headers = {key: value for key, value in response.items() if key not in ('X-Accel-Redirect', 'X-Sendfile')}
+        if path is None:
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+            return StubResponse(response.status_code, headers, body)
+
+        assert response.content == b'', '위임 응답에는 본문이 없어야 함'
+        with open(path, 'rb') as f:
+            data = f.read()
+        size = len(data)
+        headers['Accept-Ranges'] = 'bytes'
+        byte_range = self.parse_range(request, headers, size)
+        if byte_range is False:
+            headers['Content-Range'] = f'bytes */{size}'
+            return StubResponse(416, headers, b'')
+        if byte_range is None:
+            headers['Content-Length'] = str(size)
+            return StubResponse(200, headers, data)
+        start, end = byte_range
+        headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+        headers['Content-Length'] = str(end - start + 1)
+        return StubResponse(206, headers, data[start:end + 1])
+
+    def parse_range(self, request, headers, size):
+        match = self.RANGE_RE.match(request.META.get('HTTP_RANGE', ''))
+        if not match or not any(match.groups()):
+            return None
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if if_range:
+            if if_range.startswith('"'):
+                if if_range != headers.get('ETag'):
+                    return None
+            elif parse_http_date_safe(if_range) != parse_http_date_safe(headers.get('Last-Modified', '')):
+                return None
+        first, last = match.groups()
+        if not first:
+            length = int(last)
+            return (max(size - length, 0), size - 1) if length else False
+        start = int(first)
+        if start >= size:
+            return False
+        return start, min(int(last), size - 1) if last else size - 1
+
+
+class MediaServingTests:
+    """serve_media 공통 테스트 (offload_mode별 하위 클래스에서 실행)"""
+    offload_mode = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.media_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(cls.media_root, 'gallery'))
+        os.makedirs(os.path.join(cls.media_root, 'contest', 'scripts', '2026'))
+        with open(os.path.join(cls.media_root, 'gallery', 'photo 1.jpg'), 'wb') as f:
+            f.write(DATA)
+        with open(os.path.join(cls.media_root, 'contest', 'scripts', '2026', 'script.pdf'), 'wb') as f:
+            f.write(SCRIPT)
+        cls.locations = {'/_protected/media/': cls.media_root}
+        cls.settings_override = override_settings(
+            MEDIA_ROOT=cls.media_root,
+            FILE_OFFLOAD_MODE=cls.offload_mode,
+            FILE_OFFLOAD_LOCATIONS=cls.locations,
+            MEDIA_PERMISSIONS={'contest/scripts/': 'apps.contest.permissions.can_download_script'},
+        )
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        shutil.rmtree(cls.media_root)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.proxy = NginxStub(self.locations)
+
+    def fetch(self, path, user=None, **headers):
+        """serve_media 호출 후 앞단 프록시를 거친 최종 응답"""
+        request = self.factory.get(f'/media/{path}', **headers)
+        request.user = user or AnonymousUser()
+        return self.proxy.handle(request, serve_media(request, path))
+
+    def validators(self):
+        response = self.fetch('gallery/photo 1.jpg')
+        return response.headers['ETag'], response.headers['Last-Modified']
+
+    def test_full_file(self):
+        response = self.fetch('gallery/photo 1.jpg')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, DATA)
+        self.assertEqual(response.headers['Accept-Ranges'], 'bytes')
+        self.assertEqual(response.headers['Cache-Control'], 'public, max-age=86400')
+
+    def test_range(self):
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.body, DATA[10:20])
+        self.assertEqual(response.headers['Content-Range'], f'bytes 10-19/{len(DATA)}')
+        self.assertEqual(response.headers['Content-Length'], '10')
+
+    def test_open_ended_range(self):
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE='bytes=1000-')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.body, DATA[1000:])
+
+    def test_suffix_range(self):
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE='bytes=-24')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.body, DATA[-24:])
+        self.assertEqual(response.headers['Content-Range'], f'bytes 1000-1023/{len(DATA)}')
+
+    def test_range_past_end_is_clipped(self):
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE='bytes=1020-5000')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.body, DATA[1020:])
+
+    def test_unsatisfiable_range(self):
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE=f'bytes={len(DATA)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response.headers['Content-Range'], f'bytes */{len(DATA)}')
+
+    def test_if_range_etag_match(self):
+        etag, _ = self.validators()
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.body, DATA[:10])
+
+    def test_if_range_etag_mismatch_sends_full_file(self):
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"changed"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, DATA)
+
+    def test_if_range_date(self):
+        _, last_modified = self.validators()
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=last_modified)
+        self.assertEqual(response.status_code, 206)
+        stale = http_date(parse_http_date_safe(last_modified) - 60)
+        response = self.fetch('gallery/photo 1.jpg', HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=stale)
+        self.assertEqual(response.status_code, 200)
+
+    def test_not_modified(self):
+        etag, _ = self.validators()
+        response = self.fetch('gallery/photo 1.jpg', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.body, b'')
+
+    def test_missing_file(self):
+        with self.assertRaises(Http404):
+            self.fetch('gallery/missing.jpg')
+
+    def test_path_traversal(self):
+        with self.assertRaises(Http404):
+            self.fetch('../settings.py')
+
+    def test_private_file_denied(self):
+        with self.assertRaises(PermissionDenied):
+            self.fetch('contest/scripts/2026/script.pdf')
+        with self.assertRaises(PermissionDenied):
+            self.fetch('contest/scripts/2026/script.pdf', user=User(username='member'))
+
+    def test_private_file_allowed_for_staff(self):
+        response = self.fetch('contest/scripts/2026/script.pdf', user=User(username='staff', is_staff=True))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, SCRIPT)
+        self.assertEqual(response.headers['Cache-Control'], 'private, no-cache')
+
+    def test_private_file_range(self):
+        response = self.fetch(
+            'contest/scripts/2026/script.pdf', user=User(username='staff', is_staff=True), HTTP_RANGE='bytes=0-3'
+        )
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.body, SCRIPT[:4])
+
+
+class DirectServingTests(MediaServingTests, SimpleTestCase):
+    offload_mode = None
+
+    def test_no_offload_headers(self):
+        request = self.factory.get('/media/gallery/photo 1.jpg')
+        request.user = AnonymousUser()
+        response = serve_media(request, 'gallery/photo 1.jpg')
+        self.assertFalse(response.has_header('X-Accel-Redirect'))
+        self.assertFalse(response.has_header('X-Sendfile'))
+        self.assertEqual(b''.join(response.streaming_content), DATA)
+
+
+class AccelRedirectServingTests(MediaServingTests, SimpleTestCase):
+    offload_mode = 'x-accel-redirect'
+
+    def test_offload_header(self):
+        request = self.factory.get('/media/gallery/photo 1.jpg', HTTP_RANGE='bytes=0-9')
+        request.user = AnonymousUser()
+        response = serve_media(request, 'gallery/photo 1.jpg')
+        # Django는 경로만 넘기고 Range는 프록시에 맡김
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], '/_protected/media/gallery/photo%201.jpg')
+        self.assertEqual(response.content, b'')
+        self.assertTrue(response.has_header('ETag'))
+
+
+class SendfileServingTests(MediaServingTests, SimpleTestCase):
+    offload_mode = 'x-sendfile'
+
+    def test_offload_header(self):
+        request = self.factory.get('/media/gallery/photo 1.jpg')
+        request.user = AnonymousUser()
+        response = serve_media(request, 'gallery/photo 1.jpg')
+        self.assertEqual(response['X-Sendfile'], os.path.realpath(os.path.join(self.media_root, 'gallery', 'photo 1.jpg')))
+        self.assertEqual(response.content, b'')
@@ -0,0 +1,108 @@
+import mimetypes
+import os
+import stat
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied, SuspiciousFileOperation
+from django.http import Http404
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.module_loading import import_string
+from PIL import Image
+from .resize import ResizeNotAllowed, resize_cache
+from .routes import route_table
+from .sendfile import get_offload_mode, send_file
+
+
+def serve_frontend(request, path=''):
+    """프론트엔드 HTML/CSS/JS 파일 서빙"""
+    route = route_table.resolve(path)
+    if route is None:
+        raise Http404(f"File not found: {path}")
+
+    # 미리 압축된 파일 중 클라이언트가 받을 수 있는 가장 작은 것 선택
+    # (전송 위임 모드에서는 프록시의 gzip_static/brotli_static이 처리)
+    variant = None
+    if not get_offload_mode():
+        variant = route.select_variant(request.META.get('HTTP_ACCEPT_ENCODING'))
+    etag = route.variant_etag(variant)
+
+    # If-None-Match / If-Modified-Since 조건부 요청은 파일을 열지 않고 304 응답
+    response = get_conditional_response(
+        request, etag=etag, last_modified=route.mtime
+    )
+    if response is None:
+        target = variant or route
+        try:
+            response = send_file(
+                request, target.path, route.content_type,
+                etag=etag, last_modified=route.mtime, size=target.size
+            )
+        except OSError:
+            # 테이블 구성 이후 파일이 삭제/교체된 경우
+            route_table.invalidate()
+            raise Http404(f"File not found: {path}")
+        if variant:
+            response['Content-Encoding'] = variant.encoding
+
+    response['ETag'] = etag
+    response['Last-Modified'] = route.last_modified
+    if route.immutable:
+        response['Cache-Control'] = settings.FRONTEND_IMMUTABLE_CACHE_CONTROL
+    else:
+        response['Cache-Control'] = settings.FRONTEND_CACHE_CONTROL
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response
+
+
+def get_media_permission(path):
+    """MEDIA_PERMISSIONS에서 경로에 해당하는 권한 확인 함수 (없으면 공개 파일)"""
+    for prefix, checker in getattr(settings, 'MEDIA_PERMISSIONS', {}).items():
+        if path.startswith(prefix):
+            return import_string(checker) if isinstance(checker, str) else checker
+    return None
+
+
+def serve_media(request, path):
+    """업로드 파일(MEDIA_ROOT) 서빙 - 경로/권한은 Django가 확인, 전송은 send_file"""
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404(f"File not found: {path}")
+
+    checker = get_media_permission(path)
+    if checker is not None and not checker(request, path):
+        raise PermissionDenied
+
+    cache_control = 'private, no-cache' if checker is not None else settings.MEDIA_CACHE_CONTROL
+    return send_stored_file(request, full_path, cache_control)
+
+
+def serve_resized_media(request, width, height, fmt, path):
+    """업로드 이미지 리사이즈 (/media/resize/<너비>x<높이>/<형식>/<경로>) - 결과는 디스크 캐시에서 전송"""
+    try:
+        full_path = resize_cache.get(path, int(width), int(height), fmt)
+    except (ResizeNotAllowed, OSError, Image.DecompressionBombError):
+        raise Http404(f"File not found: {path}")
+    return send_stored_file(request, full_path, settings.MEDIA_CACHE_CONTROL, content_type=f'image/{fmt}')
+
+
+def send_stored_file(request, full_path, cache_control, content_type=None):
+    """디스크 파일 전송 (ETag/Last-Modified 조건부 요청 지원)"""
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        raise Http404("File not found")
+    if not stat.S_ISREG(st.st_mode):
+        raise Http404("File not found")
+
+    mtime = int(st.st_mtime)
+    etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+    response = get_conditional_response(request, etag=etag, last_modified=mtime)
+    if response is None:
+        content_type = content_type or mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        response = send_file(request, full_path, content_type, etag=etag, last_modified=mtime, size=st.st_size)
+
+    response['ETag'] = etag
+    response['Cache-Control'] = cache_control
+    return response
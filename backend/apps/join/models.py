@@ -70,6 +70,12 @@ class Donation(models.Model):
         verbose_name = '후원'
         verbose_name_plural = '후원 관리'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_confirmed', 'created_at'], name='donation_confirmed_idx'),
+            # 입금 확인 대기 목록 - filter(is_confirmed=False)는 SQLite에서 NOT is_confirmed로
+            # 생성되어 위 인덱스를 쓰지 못하므로 부분 인덱스로 보완
+            models.Index(fields=['created_at'], condition=models.Q(is_confirmed=False), name='donation_unconfirmed_idx'),
+        ]
 
     def __str__(self):
         return f"{self.donor_name} - {self.amount:,}원"
@@ -4,3 +4,6 @@ class PopupConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.popup'
     verbose_name = '팝업 관리'
+
+    def ready(self):
+        import apps.popup.signals
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('popup', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='popup',
+            index=models.Index(fields=['is_active', 'start_at', 'end_at'], name='popup_active_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('popup', '0003_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='popup',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='popup',
+            index=models.Index(fields=['updated_at'], name='popup_updated_idx'),
+        ),
+    ]
@@ -1,9 +1,12 @@
 from django.db import models
 from django.utils import timezone
+from apps.core.images import ImageVariantsModel
 
 
-class Popup(models.Model):
+class Popup(ImageVariantsModel):
     """팝업 관리 - 프론트엔드: index.html (메인페이지)"""
+    variant_fields = ('pc_image', 'mobile_image')
+
     title = models.CharField(max_length=100, verbose_name='제목')
     pc_image = models.ImageField(upload_to='popup/', verbose_name='PC 이미지')
     mobile_image = models.ImageField(upload_to='popup/', verbose_name='모바일 이미지')
@@ -12,11 +15,18 @@ class Popup(models.Model):
     end_at = models.DateTimeField(verbose_name='노출 종료일시')
     is_active = models.BooleanField(default=True, verbose_name='활성화')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = '팝업'
         verbose_name_plural = '팝업 관리'
         ordering = ['-created_at']
+        indexes = [
+            # 노출 중 팝업 조회 (ActivePopupListView)
+            models.Index(fields=['is_active', 'start_at', 'end_at'], name='popup_active_idx'),
+            # 조건부 GET 검증값 (COUNT + MAX(updated_at), apps.core.conditional)
+            models.Index(fields=['updated_at'], name='popup_updated_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -1,13 +1,16 @@
 from rest_framework import serializers
+from apps.core.images import SrcsetField
 from .models import Popup
 
 
 class PopupSerializer(serializers.ModelSerializer):
     is_visible = serializers.BooleanField(read_only=True)
+    pc_image_srcset = SrcsetField('pc_image')
+    mobile_image_srcset = SrcsetField('mobile_image')
 
     class Meta:
         model = Popup
         fields = [
-            'id', 'title', 'pc_image', 'mobile_image', 'link_url',
-            'start_at', 'end_at', 'is_active', 'is_visible'
+            'id', 'title', 'pc_image', 'pc_image_srcset', 'mobile_image', 'mobile_image_srcset',
+            'link_url', 'start_at', 'end_at', 'is_active', 'is_visible'
         ]
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from apps.core.cache import bump_version_on_change
+from apps.core.images import delete_variants_on_delete, process_images_on_save
+from .models import Popup
+
+# 노출 팝업 목록 캐시 무효화 (apps.core.cache)
+post_save.connect(bump_version_on_change, sender=Popup, dispatch_uid='cache-version-save-Popup')
+post_delete.connect(bump_version_on_change, sender=Popup, dispatch_uid='cache-version-delete-Popup')
+
+post_save.connect(process_images_on_save, sender=Popup, dispatch_uid='image-variants-save-Popup')
+post_delete.connect(delete_variants_on_delete, sender=Popup, dispatch_uid='image-variants-delete-Popup')
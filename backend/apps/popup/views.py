@@ -1,12 +1,17 @@
-from rest_framework import generics
 from rest_framework.permissions import AllowAny
 from django.utils import timezone
+from apps.core.cache import CachedListMixin
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.views import AsyncListAPIView
 from .models import Popup
 from .serializers import PopupSerializer
 
 
-class ActivePopupListView(generics.ListAPIView):
+class ActivePopupListView(ConditionalGetMixin, CachedListMixin, AsyncListAPIView):
     """현재 활성화된 팝업 목록"""
+    cache_models = (Popup,)
+    cache_timeout = 60  # 노출 시작/종료 시각이 지나면 목록이 바뀌므로 짧게
+    validator_interval = 60
     serializer_class = PopupSerializer
     permission_classes = [AllowAny]
 
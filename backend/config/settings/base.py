@@ -31,6 +31,8 @@ INSTALLED_APPS = [
     'apps.archive',
     'apps.join',
     'apps.popup',
+    'apps.frontend',
+    'apps.core',
 ]
 
 MIDDLEWARE = [
@@ -42,6 +44,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.accounts.middleware.PasswordHashBusyMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -63,6 +66,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
 
 # 데이터베이스 설정 - 환경변수에 DB_NAME이 있으면 PostgreSQL, 없으면 SQLite 사용
 if os.getenv('DB_NAME'):
@@ -94,6 +98,20 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# 비밀번호 해시는 별도 스레드 풀에서 계산 (apps.accounts.hashers) - 저장 형식은 Django 기본 PBKDF2와 동일
+PASSWORD_HASHERS = [
+    'apps.accounts.hashers.PooledPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+# 프로세스당 해시 스레드 수(0이면 요청 스레드에서 바로 계산) / 대기 허용 건수 / 초과 시 503 Retry-After(초)
+# 해시를 기다리는 요청도 요청 스레드를 잡고 있으므로 WORKERS + QUEUE_LIMIT는 워커당 요청 스레드 수보다 작게
+PASSWORD_HASH_WORKERS = 2
+PASSWORD_HASH_QUEUE_LIMIT = 2
+PASSWORD_HASH_RETRY_AFTER = 5
+
 LANGUAGE_CODE = 'ko-kr'
 TIME_ZONE = 'Asia/Seoul'
 USE_I18N = True
@@ -103,15 +121,37 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+MEDIA_CACHE_CONTROL = 'public, max-age=86400'
+IMAGE_RESIZE_CACHE_DIR = BASE_DIR / 'cache' / 'resize'  # /media/resize/ 변환 결과
+
+# 비공개 업로드 파일: 경로 접두사 → 권한 확인 함수 (request, path) -> bool
+MEDIA_PERMISSIONS = {
+    'contest/scripts/': 'apps.contest.permissions.can_download_script',
+}
 
 # 프론트엔드 정적 파일 경로 (루트 폴더)
 FRONTEND_DIR = BASE_DIR.parent  # backend의 상위 폴더 = 프로젝트 루트
+FRONTEND_BUILD_DIR = BASE_DIR / 'frontend_build'  # collectfrontend 결과 (있으면 우선 서빙)
+FRONTEND_ROUTE_CHECK_INTERVAL = 1 if DEBUG else 30  # 파일 변경 확인 주기(초)
+FRONTEND_CACHE_CONTROL = 'no-cache'  # HTML 등 - 매번 ETag로 재검증
+FRONTEND_IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'  # 해시 파일명
+
+# 파일 전송 위임 - None(Django 직접 전송) / 'x-accel-redirect'(nginx) / 'x-sendfile'(Apache 등)
+FILE_OFFLOAD_MODE = os.getenv('FILE_OFFLOAD_MODE') or None
+# X-Accel-Redirect용 nginx internal location → 실제 폴더
+FILE_OFFLOAD_LOCATIONS = {
+    '/_protected/media/': MEDIA_ROOT,
+    '/_protected/frontend/': FRONTEND_DIR,
+    '/_protected/frontend_build/': FRONTEND_BUILD_DIR,
+    '/_protected/resize/': IMAGE_RESIZE_CACHE_DIR,
+}
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # 읽기 요청은 토큰 클레임으로 사용자 구성 (apps.accounts.authentication)
+        'apps.accounts.authentication.ClaimsJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -129,14 +169,70 @@ REST_FRAMEWORK = {
         'user': '1000/hour',
         'contest_apply': '5/minute',
     },
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # 커서(키셋) 페이지네이션, ?page= 요청은 페이지 번호 방식
+    'DEFAULT_PAGINATION_CLASS': 'apps.core.pagination.KeysetPagination',
     'PAGE_SIZE': 10,
 }
 
+# 이 설정으로 실행되는 워커 프로세스 수 (app.py --prod가 gunicorn 워커 수로 지정)
+APP_WORKERS = int(os.getenv('APP_WORKERS') or os.getenv('WEB_CONCURRENCY') or 1)
+
+# 캐시 - 응답 캐시 버전·게시판 권한 버전·토큰 무효화 기록을 워커끼리 공유하도록 운영 환경에서는 REDIS_URL 지정
+# (APP_WORKERS가 2 이상인데 REDIS_URL이 없으면 시작 시 오류 - apps.core.cache.check_shared_cache)
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# 비로그인 목록 API 응답 캐시 사용 여부 / 유지 시간(초) - 내용 변경 시에는 모델 버전으로 즉시 무효화
+API_RESPONSE_CACHE = True
+API_CACHE_TIMEOUT = 60 * 60
+
+# 조회수 지연 반영 - 주기(초, 0이면 즉시 반영) / 누적 건수 도달 시 즉시 반영
+VIEW_COUNTER_FLUSH_INTERVAL = 10
+VIEW_COUNTER_FLUSH_THRESHOLD = 1000
+
+# 갤러리 앨범 목록의 이미지 수 - False: 저장된 image_count, True: 매 요청 COUNT 집계
+GALLERY_LIVE_IMAGE_COUNT = False
+
+# 앨범 상세에 포함하는 이미지 수 = 이미지 목록 API 한 페이지 크기
+GALLERY_IMAGE_PAGE_SIZE = 40
+
+# 앨범 ZIP 다운로드에 적용할 게시판 읽기 권한 (BoardPermission board_type, None이면 공개)
+GALLERY_DOWNLOAD_BOARD = 'gallery'
+
+# 갤러리 사진 일괄 업로드 (이미지 여러 장 또는 ZIP) - 요청당 최대 장수 / 장당 최대 크기 / 검증 프로세스 수(None: CPU 수)
+GALLERY_BULK_UPLOAD_MAX_FILES = 1000
+GALLERY_BULK_UPLOAD_MAX_FILE_SIZE = 30 * 1024 * 1024
+GALLERY_BULK_UPLOAD_WORKERS = None
+
+# 업로드 이미지 파생본 (apps.core.images) - 너비별 AVIF/WebP, 지원하지 않는 형식은 건너뜀
+IMAGE_VARIANT_WIDTHS = [320, 640, 1024, 1600]
+IMAGE_VARIANT_FORMATS = ['avif', 'webp']
+IMAGE_VARIANT_QUALITY = {'avif': 60, 'webp': 80}
+IMAGE_PROCESSING_WORKERS = 2  # 백그라운드 스레드 수 (0이면 저장 직후 즉시 처리)
+
+# 이미지 리사이즈 (/media/resize/<너비>x<높이>/<형식>/<경로>) - 높이 0은 너비 기준 비율 유지
+IMAGE_RESIZE_SIZES = ['320x0', '640x0', '1024x0', '400x300', '800x600', '200x200']
+IMAGE_RESIZE_FORMATS = ['avif', 'webp', 'jpeg']
+IMAGE_RESIZE_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 초과 시 오래 사용하지 않은 파일부터 삭제
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
+    # 토큰에 tier/admin_level/is_staff/is_superuser 클레임 포함, 갱신 시 DB 값으로 다시 채움
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.accounts.serializers.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.accounts.serializers.ClaimsTokenRefreshSerializer',
 }
 
 CORS_ALLOWED_ORIGINS = [
@@ -153,6 +249,7 @@ if DEBUG:
 
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
+DATA_UPLOAD_MAX_NUMBER_FILES = 1000  # 갤러리 일괄 업로드 (기본값 100)
 ALLOWED_UPLOAD_EXTENSIONS = ['.hwp', '.pdf', '.docx', '.doc', '.jpg', '.jpeg', '.png', '.gif']
 BLOCKED_UPLOAD_EXTENSIONS = ['.exe', '.sh', '.bat', '.cmd', '.ps1', '.js', '.php']
 
@@ -1,8 +1,14 @@
 """
 Production Settings
 """
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
+# 응답 캐시·게시판 권한·토큰 무효화 기록을 워커끼리 공유해야 하므로 공유 캐시 필수
+if not os.getenv('REDIS_URL'):
+    raise ImproperlyConfigured('운영 설정에는 REDIS_URL(공유 캐시)이 필요합니다.')
+
 DEBUG = False
 
 SECURE_BROWSER_XSS_FILTER = True
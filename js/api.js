@@ -155,6 +155,12 @@ const API = {
             });
         },
 
+        // 전체 게시판 읽기/쓰기 권한 - { boards: { notice: { can_read, can_write }, ... }, user_tier, is_admin }
+        async getBoardPermissions() {
+            const result = await API.request('/auth/check-permission/');
+            return result.data;
+        },
+
         isLoggedIn() {
             return !!API.getToken();
         },
@@ -212,6 +218,10 @@ const API = {
         async getVideos(params = {}) {
             const query = new URLSearchParams(params).toString();
             return API.request(`/archive/gallery/videos/${query ? '?' + query : ''}`);
+        },
+
+        async getVideo(id) {
+            return API.request(`/archive/gallery/videos/${id}/`);
         }
     },
 
@@ -337,6 +347,27 @@ const UI = {
             month: 'long',
             day: 'numeric'
         });
+    },
+
+    // 업로드 이미지의 리사이즈 URL (/media/resize/<너비>x<높이>/<형식>/...)
+    // 서버 IMAGE_RESIZE_SIZES에 있는 크기만 가능, 높이 0은 비율 유지
+    resized(src, width, height = 0, fmt = 'webp') {
+        if (!src) return src;
+        const url = new URL(src, window.location.origin);
+        if (!url.pathname.startsWith('/media/') || url.pathname.startsWith('/media/resize/')) return src;
+        url.pathname = `/media/resize/${width}x${height}/${fmt}/` + url.pathname.slice('/media/'.length);
+        return url.toString();
+    },
+
+    // 이미지 태그 - srcset(API의 *_srcset)이 있으면 AVIF/WebP <picture>
+    picture(src, srcset, alt = '', sizes = '100vw', attrs = '') {
+        const img = `<img src="${src}" alt="${alt}" loading="lazy" decoding="async" ${attrs}>`;
+        if (!srcset) return img;
+        const sources = ['avif', 'webp']
+            .filter(fmt => srcset[fmt])
+            .map(fmt => `<source type="image/${fmt}" srcset="${srcset[fmt]}" sizes="${sizes}">`)
+            .join('');
+        return `<picture>${sources}${img}</picture>`;
     }
 };
 
@@ -0,0 +1,94 @@
+/**
+ * BlurHash 디코더 (https://blurha.sh)
+ * API의 blurhash 문자열을 작은 캔버스에 흐린 미리보기로 그린다.
+ * 원본 이미지가 로드되기 전까지 자리를 채우는 용도
+ */
+
+const BlurHash = {
+    DIGITS: '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~',
+
+    decode83(str) {
+        let value = 0;
+        for (const char of str) {
+            value = value * 83 + this.DIGITS.indexOf(char);
+        }
+        return value;
+    },
+
+    srgbToLinear(value) {
+        const v = value / 255;
+        return v <= 0.04045 ? v / 12.92 : Math.pow((v + 0.055) / 1.055, 2.4);
+    },
+
+    linearToSrgb(value) {
+        const v = Math.max(0, Math.min(1, value));
+        return v <= 0.0031308
+            ? Math.round(v * 12.92 * 255)
+            : Math.round((1.055 * Math.pow(v, 1 / 2.4) - 0.055) * 255);
+    },
+
+    signPow(value, exponent) {
+        return Math.sign(value) * Math.pow(Math.abs(value), exponent);
+    },
+
+    // width x height RGBA 픽셀 배열 (잘못된 문자열이면 null)
+    decode(hash, width, height) {
+        if (!hash || hash.length < 6) return null;
+        const sizeFlag = this.decode83(hash[0]);
+        const numX = (sizeFlag % 9) + 1;
+        const numY = Math.floor(sizeFlag / 9) + 1;
+        if (hash.length !== 4 + 2 * numX * numY) return null;
+
+        const maxValue = (this.decode83(hash[1]) + 1) / 166;
+        const colors = [];
+        const dc = this.decode83(hash.slice(2, 6));
+        colors.push([dc >> 16, (dc >> 8) & 255, dc & 255].map(v => this.srgbToLinear(v)));
+        for (let i = 1; i < numX * numY; i++) {
+            const ac = this.decode83(hash.slice(4 + i * 2, 6 + i * 2));
+            colors.push([Math.floor(ac / 361), Math.floor(ac / 19) % 19, ac % 19]
+                .map(v => this.signPow((v - 9) / 9, 2) * maxValue));
+        }
+
+        const pixels = new Uint8ClampedArray(width * height * 4);
+        for (let y = 0; y < height; y++) {
+            for (let x = 0; x < width; x++) {
+                let r = 0, g = 0, b = 0;
+                for (let j = 0; j < numY; j++) {
+                    const basisY = Math.cos(Math.PI * y * j / height);
+                    for (let i = 0; i < numX; i++) {
+                        const basis = Math.cos(Math.PI * x * i / width) * basisY;
+                        const color = colors[i + j * numX];
+                        r += color[0] * basis;
+                        g += color[1] * basis;
+                        b += color[2] * basis;
+                    }
+                }
+                const offset = 4 * (x + y * width);
+                pixels[offset] = this.linearToSrgb(r);
+                pixels[offset + 1] = this.linearToSrgb(g);
+                pixels[offset + 2] = this.linearToSrgb(b);
+                pixels[offset + 3] = 255;
+            }
+        }
+        return pixels;
+    },
+
+    // <canvas data-blurhash="..."> 에 그리기 (CSS로 실제 크기까지 늘려 표시)
+    paint(canvas) {
+        const pixels = this.decode(canvas.dataset.blurhash, canvas.width, canvas.height);
+        if (!pixels) return;
+        const ctx = canvas.getContext('2d');
+        const imageData = ctx.createImageData(canvas.width, canvas.height);
+        imageData.data.set(pixels);
+        ctx.putImageData(imageData, 0, 0);
+    },
+
+    paintAll(root = document) {
+        root.querySelectorAll('canvas[data-blurhash]').forEach(canvas => this.paint(canvas));
+    },
+
+    // 카드용 미리보기 캔버스 태그 (hash가 없으면 빈 문자열)
+    canvas(hash, className = 'blurhash') {
+        return hash ? `<canvas class="${className}" width="32" height="32" data-blurhash="${hash}" aria-hidden="true"></canvas>` : '';
+    }
+};